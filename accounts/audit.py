@@ -0,0 +1,146 @@
+import datetime
+import json
+import logging
+import os
+import queue
+import threading
+
+_STOP = object()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; fields passed as ``extra={'audit': {...}}`` are merged in."""
+
+    def format(self, record):
+        payload = {
+            'time': datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': record.getMessage(),
+        }
+        payload.update(getattr(record, 'audit', {}))
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class AuditHandler(logging.Handler):
+    """Logging handler that never blocks the calling thread on disk I/O.
+
+    ``emit`` only puts the record on a bounded in-memory queue; when the queue
+    is full the record is dropped and counted in ``dropped``. A background
+    thread, started on first use, drains the queue in batches of up to
+    ``batch_size`` records, writes each batch with a single write/flush and
+    rotates the file once it exceeds ``max_bytes``.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5, queue_size=10000, batch_size=256):
+        super().__init__()
+        self.filename = os.fspath(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._stream = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def emit(self, record):
+        if self._thread is None or not self._thread.is_alive():
+            self._start()
+        # Resolve the message now: args may be mutated once we return.
+        record.msg = record.getMessage()
+        record.args = None
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Block until every queued record has been written, or the writer is gone."""
+        thread = self._thread
+        if thread is None:
+            return
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks and thread.is_alive():
+                self.queue.all_tasks_done.wait(0.1)
+
+    def close(self, timeout=5):
+        if self._thread is not None:
+            try:
+                self.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        super().close()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            records = [record for record in batch if record is not _STOP]
+            try:
+                if records:
+                    self._write(records)
+            except Exception:
+                # Disk full, permissions...: report it, lose this batch only and keep draining.
+                self.handleError(records[0])
+                self._discard_stream()
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                if self._stream is not None:
+                    self._stream.close()
+                    self._stream = None
+                return
+
+    def _write(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + '\n')
+            except Exception:
+                self.handleError(record)
+        data = ''.join(lines).encode('utf-8')
+        if self._stream is None:
+            os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+            self._stream = open(self.filename, 'ab')
+        if self.max_bytes and self._stream.tell() and self._stream.tell() + len(data) > self.max_bytes:
+            self._rotate()
+        self._stream.write(data)
+        self._stream.flush()
+
+    def _discard_stream(self):
+        """Drop a stream that failed so the next batch reopens the file."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _rotate(self):
+        self._stream.close()
+        if self.backup_count:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.filename}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.filename}.{index + 1}")
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+        self._stream = open(self.filename, 'ab')
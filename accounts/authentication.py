@@ -0,0 +1,137 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from calendar_main.timing import measure
+
+USER_STATE_FIELDS = ('id', 'email', 'is_active', 'is_staff')
+
+
+class TTLCache:
+    """Small thread-safe LRU mapping whose entries also expire at a deadline."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, deadline = entry
+            if deadline <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, deadline):
+        with self._lock:
+            self._data[key] = (value, deadline)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Verified tokens never change, so they can live in process memory until they expire.
+validated_tokens = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE)
+
+
+def user_state_cache_key(user_id):
+    return f"accounts:user-state:{user_id}"
+
+
+def invalidate_user_state(user_id):
+    caches[settings.AUTH_CACHE_ALIAS].delete(user_state_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """Drop-in JWTAuthentication that skips the signature check and user query when cached.
+
+    Verified tokens are kept in a bounded in-process cache until their ``exp``
+    claim. The user's id, email and active/staff flags are kept in the
+    AUTH_CACHE_ALIAS cache for AUTH_CACHE_TIMEOUT seconds and dropped whenever
+    the user is saved or deleted (see accounts.signals). The returned user is a
+    CustomUser with every other field deferred, so code that needs e.g. the
+    password hash loads it on access and ``save()`` only writes loaded fields.
+    """
+
+    def authenticate(self, request):
+        with measure('auth'):
+            return super().authenticate(request)
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).hexdigest()
+        token = validated_tokens.get(key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            validated_tokens.set(key, token, token.get('exp') or time.time() + settings.AUTH_CACHE_TIMEOUT)
+        return token
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+        user_id = self.get_user_id(validated_token)
+        cache = caches[settings.AUTH_CACHE_ALIAS]
+        key = user_state_cache_key(user_id)
+        state = cache.get(key)
+        if state is None:
+            state = self.user_state_queryset(user_id).first()
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, state, settings.AUTH_CACHE_TIMEOUT)
+        return self.user_from_state(state)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views; the token check stays on the event loop."""
+        with measure('auth'):
+            header = self.get_header(request)
+            if header is None:
+                return None
+            raw_token = self.get_raw_token(header)
+            if raw_token is None:
+                return None
+            validated_token = self.get_validated_token(raw_token)
+            return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return await sync_to_async(super().get_user)(validated_token)
+        user_id = self.get_user_id(validated_token)
+        cache = caches[settings.AUTH_CACHE_ALIAS]
+        key = user_state_cache_key(user_id)
+        state = await cache.aget(key)
+        if state is None:
+            state = await self.user_state_queryset(user_id).afirst()
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            await cache.aset(key, state, settings.AUTH_CACHE_TIMEOUT)
+        return self.user_from_state(state)
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def user_state_queryset(self, user_id):
+        return self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values_list(*USER_STATE_FIELDS)
+
+    def user_from_state(self, state):
+        user = self.user_model.from_db(self.user_model.objects.db, USER_STATE_FIELDS, state)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def check_auth_cache_is_shared(app_configs, **kwargs):
+    """Cached user state is only dropped in the process that saved the user."""
+    if settings.AUTH_CACHE_TIMEOUT and isinstance(caches[settings.AUTH_CACHE_ALIAS], LocMemCache):
+        return [Warning(
+            "AUTH_CACHE_ALIAS uses a per-process cache.",
+            hint=(
+                "With more than one server process, a deactivated user or changed password keeps "
+                "authenticating in the other processes for up to AUTH_CACHE_TIMEOUT seconds. "
+                "Set AUTH_CACHE_BACKEND to a shared backend, or AUTH_CACHE_TIMEOUT to 0."
+            ),
+            id='accounts.W001',
+        )]
+    return []
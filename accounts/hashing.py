@@ -0,0 +1,187 @@
+"""Password hashing in a bounded process pool for the login and password views.
+
+One PBKDF2 hash costs 100+ ms of CPU. Done inline, a burst of logins takes
+every request thread and core and starves the rest of the API. Views that
+hash run inside ``offloaded()`` (see accounts.views); while it is active,
+CustomUser.check_password and set_password send the work to
+PASSWORD_HASHING_WORKERS processes, so at most that many hashes run at once
+per server process whatever the number of request threads.
+
+Admission control: at most workers + PASSWORD_HASHING_QUEUE_SIZE hashes are
+in flight. Past that a request is refused at once with 429 and Retry-After
+instead of queuing; a hash that takes longer than PASSWORD_HASHING_TIMEOUT,
+or a broken pool, gives 503. The waiting request thread holds no GIL, under
+WSGI and under ASGI alike, where Django runs these sync views in a thread per
+request. PASSWORD_HASHING_WORKERS = 0 hashes inline, as Django does.
+
+Hashers are resolved from settings in the server process and sent to the
+workers, which therefore need no Django setup.
+"""
+import contextvars
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.crypto import get_random_string
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+
+_offloaded = contextvars.ContextVar('password_hashing_offloaded', default=False)
+
+
+class HashingQueueFull(Throttled):
+    default_detail = 'Too many password operations in progress.'
+    default_code = 'hashing_queue_full'
+
+
+class HashingUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Password hashing is temporarily unavailable.'
+    default_code = 'hashing_unavailable'
+
+    def __init__(self, detail=None, code=None, wait=None):
+        super().__init__(detail, code)
+        # Sent as Retry-After by DRF's exception handler.
+        self.wait = wait
+
+
+def _encode(hasher, password, salt):
+    return hasher.encode(password, salt)
+
+
+def _verify(hasher, preferred, password, encoded):
+    """The hashing half of django.contrib.auth.hashers.verify_password()."""
+    hasher_changed = hasher.algorithm != preferred.algorithm
+    must_update = hasher_changed or preferred.must_update(encoded)
+    is_correct = hasher.verify(password, encoded)
+    if not is_correct and not hasher_changed and must_update:
+        hasher.harden_runtime(password, encoded)
+    return is_correct, must_update
+
+
+class HashingPool:
+    """A process pool that refuses work beyond ``workers + queue_size`` in-flight calls."""
+
+    def __init__(self, workers, queue_size, timeout, retry_after=1):
+        self.workers = workers
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+
+    def executor(self):
+        with self._lock:
+            # A pool inherited through fork (e.g. a preloading server) is unusable.
+            if self._executor is None or self._pid != os.getpid():
+                # spawn: forking a server process that runs threads is unsafe.
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+                self._pid = os.getpid()
+            return self._executor
+
+    def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingQueueFull(wait=self.retry_after)
+        try:
+            future = self.executor().submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError):
+            self._slots.release()
+            self.shutdown()
+            raise HashingUnavailable(wait=self.retry_after)
+        # The slot stays taken until the worker is done, even if we stop waiting.
+        future.add_done_callback(lambda future: self._slots.release())
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise HashingUnavailable(wait=self.retry_after)
+        except BrokenProcessPool:
+            self.shutdown()
+            raise HashingUnavailable(wait=self.retry_after)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """The process-wide pool, or None when PASSWORD_HASHING_WORKERS is 0."""
+    global _pool
+    if settings.PASSWORD_HASHING_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(
+                settings.PASSWORD_HASHING_WORKERS,
+                settings.PASSWORD_HASHING_QUEUE_SIZE,
+                settings.PASSWORD_HASHING_TIMEOUT,
+            )
+        return _pool
+
+
+@receiver(setting_changed)
+def reset_pool(*, setting=None, **kwargs):
+    global _pool
+    if setting is not None and not setting.startswith('PASSWORD_HASH'):
+        return
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+@contextmanager
+def offloaded():
+    """Hash passwords in the pool for the duration of the block."""
+    token = _offloaded.set(True)
+    try:
+        yield
+    finally:
+        _offloaded.reset(token)
+
+
+def _active_pool():
+    return get_pool() if _offloaded.get() else None
+
+
+def make_password(password):
+    """django.contrib.auth.hashers.make_password() with the default hasher."""
+    pool = _active_pool()
+    if pool is None or password is None:
+        return hashers.make_password(password)
+    hasher = hashers.get_hasher()
+    return pool.run(_encode, hasher, password, hasher.salt())
+
+
+def check_password(password, encoded, setter=None):
+    """django.contrib.auth.hashers.check_password()."""
+    pool = _active_pool()
+    if pool is None:
+        return hashers.check_password(password, encoded, setter)
+    fake_runtime = password is None or not hashers.is_password_usable(encoded)
+    preferred = hashers.get_hasher()
+    try:
+        hasher = hashers.identify_hasher(encoded)
+    except ValueError:
+        fake_runtime = True
+    if fake_runtime:
+        # Same cost as a real check, so unknown accounts are not revealed by timing.
+        make_password(get_random_string(hashers.UNUSABLE_PASSWORD_SUFFIX_LENGTH))
+        return False
+    is_correct, must_update = pool.run(_verify, hasher, preferred, password, encoded)
+    if setter and is_correct and must_update:
+        setter(password)
+    return is_correct
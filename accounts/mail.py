@@ -0,0 +1,75 @@
+import datetime
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+from .models import OutboundEmail
+
+
+def enqueue_mail(subject, message, recipient_list, from_email=None):
+    """Store an email in the outbox; `manage.py send_outbox` delivers it."""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipient_list),
+    )
+
+
+def backoff(attempts):
+    seconds = settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1)
+    return datetime.timedelta(seconds=min(seconds, settings.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS))
+
+
+def _fail(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboundEmail.FAILED
+    else:
+        email.next_attempt_at = now + backoff(email.attempts)
+
+
+def deliver_batch(batch_size=100, connection=None):
+    """Send up to ``batch_size`` due emails over a single SMTP connection.
+
+    Failed messages are retried with exponential backoff and marked failed
+    after EMAIL_OUTBOX_MAX_ATTEMPTS. Returns ``(sent, failed)`` counts for the
+    batch. Run a single worker per database: SQLite has no SKIP LOCKED, so
+    concurrent workers could pick the same rows.
+    """
+    now = timezone.now()
+    batch = list(
+        OutboundEmail.objects
+        .filter(status=OutboundEmail.PENDING, next_attempt_at__lte=now)
+        .order_by('next_attempt_at')[:batch_size]
+    )
+    if not batch:
+        return 0, 0
+
+    connection = connection or get_connection(fail_silently=False)
+    sent = failed = 0
+    try:
+        connection.open()
+    except Exception as error:
+        for email in batch:
+            _fail(email, error, now)
+        failed = len(batch)
+    else:
+        try:
+            for email in batch:
+                message = EmailMessage(email.subject, email.message, email.from_email, email.recipients, connection=connection)
+                try:
+                    message.send()
+                except Exception as error:
+                    _fail(email, error, now)
+                    failed += 1
+                else:
+                    email.status = OutboundEmail.SENT
+                    email.attempts += 1
+                    email.sent_at = timezone.now()
+                    sent += 1
+        finally:
+            connection.close()
+
+    OutboundEmail.objects.bulk_update(batch, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at'])
+    return sent, failed
@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from accounts.mail import deliver_batch
+
+
+class Command(BaseCommand):
+    help = "Deliver queued emails from the outbox in batches over a reused SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--once', action='store_true', help="Drain the due emails once and exit.")
+        parser.add_argument('--interval', type=float, default=2.0, help="Seconds to sleep when the outbox is empty.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = deliver_batch(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}.")
+                continue
+            if options['once']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,88 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from django.test import SimpleTestCase
+from accounts.audit import AuditHandler, JsonFormatter
+
+
+class AuditLogTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'audit', 'audit.log')
+        self.logger = logging.getLogger('tests.audit')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.directory.cleanup()
+
+    def attach(self, **kwargs):
+        handler = AuditHandler(self.filename, **kwargs)
+        handler.setFormatter(JsonFormatter())
+        self.logger.addHandler(handler)
+        return handler
+
+    def read_lines(self, path=None):
+        with open(path or self.filename) as stream:
+            return [json.loads(line) for line in stream]
+
+    def test_records_are_written_as_json(self):
+        handler = self.attach()
+        self.logger.info("password_reset_requested", extra={'audit': {'email': 'a@example.com', 'ip': '127.0.0.1'}})
+        handler.flush()
+        [record] = self.read_lines()
+        self.assertEqual(record['event'], 'password_reset_requested')
+        self.assertEqual(record['email'], 'a@example.com')
+        self.assertEqual(record['level'], 'INFO')
+
+    def test_rotation_by_size(self):
+        handler = self.attach(max_bytes=300, backup_count=2)
+        for i in range(20):
+            self.logger.info("event %s", i)
+            handler.flush()
+        self.assertTrue(os.path.exists(self.filename + '.1'))
+        self.assertTrue(os.path.exists(self.filename + '.2'))
+        self.assertFalse(os.path.exists(self.filename + '.3'))
+        self.assertEqual(self.read_lines()[-1]['event'], 'event 19')
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = self.attach(queue_size=1)
+        handler._start = lambda: None  # keep the writer from draining the queue
+        self.logger.info("first")
+        self.logger.info("second")
+        self.assertEqual(handler.dropped, 1)
+
+    def test_failed_write_is_reported_and_writer_keeps_running(self):
+        handler = self.attach()
+        errors = []
+        handler.handleError = errors.append
+        write = handler._write
+
+        def fail_once(records):
+            handler._write = write
+            raise OSError("disk full")
+
+        handler._write = fail_once
+        self.logger.info("lost")
+        handler.flush()
+        self.logger.info("kept")
+        handler.flush()
+        self.assertEqual([record.getMessage() for record in errors], ["lost"])
+        self.assertEqual([record['event'] for record in self.read_lines()], ["kept"])
+
+    def test_flush_and_close_do_not_hang_without_a_writer(self):
+        handler = self.attach(queue_size=1)
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        handler._thread = dead
+        handler._start = lambda: None
+        self.logger.info("stuck")
+        handler.flush()
+        handler.close(timeout=0.1)
+        self.assertIsNone(handler._thread)
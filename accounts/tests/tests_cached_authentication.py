@@ -0,0 +1,67 @@
+from django.core.checks import run_checks
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+class CachedAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@email.com",
+            password="StrongPassword123!"
+        )
+        self.user.is_active = True
+        self.user.save()
+
+        self.protected_url = reverse('protected')
+        access_token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    def test_user_state_is_cached(self):
+        response = self.client.get(self.protected_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.protected_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(self.user.email, response.data['msg'])
+
+    def test_deactivation_invalidates_cache(self):
+        self.client.get(self.protected_url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.protected_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_with_cached_user(self):
+        self.client.get(self.protected_url)
+        data = {
+            "old_password": "StrongPassword123!",
+            "new_password": "NewStrongPassword456!",
+        }
+        response = self.client.post(reverse('change-password'), data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("NewStrongPassword456!"))
+        self.assertTrue(self.user.is_active)
+
+    def test_deploy_check_warns_about_per_process_cache(self):
+        def warnings():
+            return [message.id for message in run_checks(include_deployment_checks=True) if message.id == 'accounts.W001']
+
+        self.assertEqual(warnings(), ['accounts.W001'])
+        with override_settings(AUTH_CACHE_TIMEOUT=0):
+            self.assertEqual(warnings(), [])
+        with override_settings(AUTH_CACHE_ALIAS='events'):
+            # Still LocMem; only a shared backend silences it.
+            self.assertEqual(warnings(), ['accounts.W001'])
+
+    @override_settings(AUTH_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_user_cache(self):
+        self.client.get(self.protected_url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.protected_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
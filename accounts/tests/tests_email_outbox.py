@@ -0,0 +1,46 @@
+from unittest import mock
+from django.core import mail
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from accounts.mail import deliver_batch, enqueue_mail
+from accounts.models import OutboundEmail
+
+
+class EmailOutboxTests(APITestCase):
+    def test_register_only_enqueues(self):
+        data = {"email": "testuser@example.com", "password": "StrongPassword123!"}
+        response = self.client.post(reverse('register'), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.recipients, ["testuser@example.com"])
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+
+    def test_deliver_batch_sends_due_emails(self):
+        for i in range(3):
+            enqueue_mail("Subject", "Body", [f"user{i}@example.com"])
+        sent, failed = deliver_batch(batch_size=2)
+        self.assertEqual((sent, failed), (2, 0))
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(deliver_batch(), (1, 0))
+        self.assertEqual(deliver_batch(), (0, 0))
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.SENT).count(), 3)
+
+    def test_failures_back_off_then_give_up(self):
+        email = enqueue_mail("Subject", "Body", ["user@example.com"])
+        connection = mock.Mock()
+        connection.send_messages.side_effect = OSError("connection refused")
+        with self.settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2):
+            self.assertEqual(deliver_batch(connection=connection), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutboundEmail.PENDING)
+            self.assertGreater(email.next_attempt_at, timezone.now())
+            self.assertEqual(deliver_batch(connection=connection), (0, 0))
+
+            OutboundEmail.objects.update(next_attempt_at=timezone.now())
+            self.assertEqual(deliver_batch(connection=connection), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutboundEmail.FAILED)
+            self.assertIn("connection refused", email.last_error)
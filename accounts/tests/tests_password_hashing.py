@@ -0,0 +1,83 @@
+from django.urls import reverse
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from accounts import hashing
+
+User = get_user_model()
+
+
+@override_settings(
+    PASSWORD_HASHING_WORKERS=1,
+    PASSWORD_HASHING_QUEUE_SIZE=1,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
+class PasswordHashingPoolTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@email.com", password="StrongPassword123!", is_active=True)
+        self.login_url = reverse('token_obtain_pair')
+        self.addCleanup(hashing.reset_pool)
+
+    def login(self, password="StrongPassword123!"):
+        return self.client.post(self.login_url, {"email": "test@email.com", "password": password})
+
+    def test_login_hashes_in_the_pool(self):
+        self.assertIsNone(hashing.get_pool()._executor)
+
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(hashing.get_pool()._executor)
+        self.assertEqual(self.login("wrong").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unknown_user_still_pays_for_a_hash(self):
+        pool = hashing.get_pool()
+        response = self.client.post(self.login_url, {"email": "nobody@email.com", "password": "whatever"})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIsNotNone(pool._executor)
+
+    def test_change_password_through_the_pool(self):
+        access_token = self.login().data['access']
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access_token)
+
+        response = self.client.post(reverse('change-password'), {
+            "old_password": "StrongPassword123!",
+            "new_password": "NewStrongPassword123!",
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("NewStrongPassword123!"))
+
+    def test_full_queue_is_refused_with_429(self):
+        pool = hashing.get_pool()
+        # Every slot taken by other requests.
+        for _ in range(2):
+            pool._slots.acquire()
+        try:
+            response = self.login()
+        finally:
+            for _ in range(2):
+                pool._slots.release()
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+
+    @override_settings(PASSWORD_HASHING_TIMEOUT=0.000001)
+    def test_slow_hash_gives_503(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn('Retry-After', response)
+
+    @override_settings(PASSWORD_HASHING_WORKERS=0)
+    def test_zero_workers_hashes_inline(self):
+        self.assertIsNone(hashing.get_pool())
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+
+    def test_other_code_hashes_inline(self):
+        user = User.objects.create_user(email="other@email.com", password="StrongPassword123!")
+
+        self.assertTrue(user.check_password("StrongPassword123!"))
+        self.assertIsNone(hashing.get_pool()._executor)
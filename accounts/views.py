@@ -8,7 +8,8 @@ from .serializers import (
     PasswordChangeSerializer,
 )
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
+from .hashing import offloaded
+from .mail import enqueue_mail
 from django.urls import reverse
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
@@ -21,21 +22,22 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password, ValidationError
 from rest_framework.throttling import AnonRateThrottle
 import logging
-from datetime import datetime
 from drf_spectacular.utils import extend_schema
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-# Configure logger
+# Audit log, configured in settings.LOGGING (non-blocking, see accounts.audit).
 logger = logging.getLogger("password_reset")
-handler = logging.FileHandler("password_reset.log")
-formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
-handler.setFormatter(formatter)
-if not logger.hasHandlers():
-    logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+
+class OffloadedHashingMixin:
+    """Hashes passwords in the bounded pool of accounts.hashing (429/503 when it is saturated)."""
+
+    def dispatch(self, request, *args, **kwargs):
+        with offloaded():
+            return super().dispatch(request, *args, **kwargs)
+
 
 @extend_schema(tags=["Token Management"])
-class TokenObtainPairView(TokenObtainPairView):
+class TokenObtainPairView(OffloadedHashingMixin, TokenObtainPairView):
     pass
 
 @extend_schema(tags=["Token Management"])
@@ -52,12 +54,11 @@ class RegisterView(APIView):
             token = default_token_generator.make_token(user)
             activation_link = f"http://{get_current_site(request).domain}{reverse('activate', kwargs={'uidb64': uid, 'token': token})}"
 
-            send_mail(
+            enqueue_mail(
                 subject='Activate your account',
                 message=f'Actuvate your account using this link: {activation_link}',
                 from_email='noreply@authsystem.com',
                 recipient_list=[user.email],
-                fail_silently=False,
             )
 
             return Response({'msg': 'User created. Please check your email to activate your account.'}, status=status.HTTP_201_CREATED)
@@ -108,14 +109,14 @@ class PasswordResetRequestView(APIView):
         email = request.data.get('email')
         user = User.objects.filter(email=email).first()
         ip = request.META.get('REMOTE_ADDR')
-        logger.info(f"Password reset requested for {email} from IP {ip} at {datetime.now()}")
+        logger.info("password_reset_requested", extra={'audit': {'email': email, 'ip': ip}})
         if not user:
             return Response({'msg': 'This email does not exist in our system.'}, status=status.HTTP_404_NOT_FOUND)
         uid = urlsafe_base64_encode(force_bytes(user.pk))
         token = default_token_generator.make_token(user)
         reset_url = f"http://{get_current_site(request).domain}/api/auth/reset-password-confirm/{uid}/{token}/"
 
-        send_mail(
+        enqueue_mail(
             subject='Reset your password',
             message=f'Use this link to reset your password: {reset_url}',
             from_email='noreply@authsystem.com',
@@ -127,7 +128,7 @@ class PasswordResetRequestView(APIView):
     tags=["Password Reset"],
     request=PasswordResetConfirmSerializer,
 )
-class PasswordResetConfirmView(APIView):
+class PasswordResetConfirmView(OffloadedHashingMixin, APIView):
     def post(self, request, uidb64, token):
         serializer = PasswordResetConfirmSerializer(data=request.data)
         if not serializer.is_valid():
@@ -150,7 +151,7 @@ class PasswordResetConfirmView(APIView):
         user.set_password(password)
         user.save()
         ip = request.META.get('REMOTE_ADDR')
-        logger.info(f"Password reset confirmed for {user.email} from IP {ip} at {datetime.now()}")
+        logger.info("password_reset_confirmed", extra={'audit': {'email': user.email, 'ip': ip}})
         return Response({"msg": "Password reset successfully"}, status=200)
     
 from rest_framework.permissions import IsAuthenticated
@@ -159,7 +160,7 @@ from rest_framework.permissions import IsAuthenticated
     tags=["Password Change"],
     request=PasswordChangeSerializer,
 )
-class PasswordChangeView(APIView):
+class PasswordChangeView(OffloadedHashingMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
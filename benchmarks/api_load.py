@@ -0,0 +1,267 @@
+"""End-to-end latency and throughput of the accounts and events APIs.
+
+    python -m benchmarks.api_load --users 50 --events 1000 --output results.json
+    python -m benchmarks.api_load --users 50 --events 1000 --baseline results.json
+
+Seeds --users users, each with --events events and --categories categories,
+then drives every endpoint in turn through the Django test client from
+--threads concurrent clients (one user each). Reports p50/p95/p99 latency
+and requests per second per endpoint.
+
+--output writes the results as JSON. --baseline compares against a previous
+results file and exits with status 1 when an endpoint's p95 latency rose, or
+its requests per second fell, by more than --threshold (a fraction).
+"""
+import argparse
+import datetime
+import json
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from .common import format_summary, setup_django, summarize
+
+PASSWORD = 'Bench-password-1'
+
+
+class Session:
+    """One simulated client: a user, its tokens and the ids it can act on."""
+
+    def __init__(self, user, index):
+        from rest_framework.test import APIClient
+        from rest_framework_simplejwt.tokens import RefreshToken
+        from events.models import Category, Event
+
+        self.user = user
+        self.rng = random.Random(index)
+        refresh = RefreshToken.for_user(user)
+        self.refresh = str(refresh)
+        self.anonymous = APIClient(raise_request_exception=False)
+        self.client = APIClient(raise_request_exception=False)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.events = [str(pk) for pk in Event.objects.filter(user=user).values_list('pk', flat=True)]
+        self.categories = [str(pk) for pk in Category.objects.filter(user=user).values_list('pk', flat=True)]
+        self.start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def event_data(self, n):
+        start = self.start + datetime.timedelta(hours=self.rng.randrange(24 * 365))
+        return {
+            'title': f'Load event {n}',
+            'description': 'Created by the load benchmark',
+            'startDate': start.isoformat(),
+            'endDate': (start + datetime.timedelta(hours=1)).isoformat(),
+            'category': self.rng.choice(self.categories),
+        }
+
+    def window(self):
+        start = self.start + datetime.timedelta(days=self.rng.randrange(330))
+        return {'start': start.isoformat(), 'end': (start + datetime.timedelta(days=31)).isoformat()}
+
+
+def seed(users, events, categories):
+    from django.contrib.auth.hashers import make_password
+    from accounts.models import CustomUser
+    from events.models import Category, Event
+
+    # Hash once: the stored hash is what login checks, and hashing per user
+    # would dominate the seeding time.
+    password = make_password(PASSWORD)
+    CustomUser.objects.bulk_create(
+        CustomUser(email=f'load{i}@example.com', password=password, is_active=True) for i in range(users)
+    )
+    rng = random.Random(0)
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    for user in CustomUser.objects.filter(email__startswith='load'):
+        owned = Category.objects.bulk_create(
+            Category(name=f'Category {n}', color=f'#{rng.randrange(1 << 24):06x}', user=user)
+            for n in range(categories)
+        )
+        Event.objects.bulk_create(
+            (
+                Event(
+                    title=f'Event {n}',
+                    description='Seeded by the load benchmark',
+                    startDate=(begin := start + datetime.timedelta(hours=rng.randrange(24 * 365))),
+                    endDate=begin + datetime.timedelta(minutes=rng.choice((30, 60, 90))),
+                    category=rng.choice(owned) if owned else None,
+                    user=user,
+                )
+                for n in range(events)
+            ),
+            batch_size=2000,
+        )
+
+
+def scenarios():
+    """(name, expected status, prepare, request) for every endpoint, in run order.
+
+    ``prepare(session, count)`` runs untimed and returns one argument per
+    request; ``request(session, arg)`` sends it and returns the response.
+    """
+    from django.urls import reverse
+    from events.models import Category, Event
+
+    def repeat(session, count):
+        return range(count)
+
+    def pick(attr):
+        return lambda session, count: [session.rng.choice(getattr(session, attr)) for _ in range(count)]
+
+    def disposable_events(session, count):
+        created = Event.objects.bulk_create(
+            Event(title='Disposable', startDate=session.start, endDate=session.start, user=session.user)
+            for _ in range(count)
+        )
+        return [str(event.pk) for event in created]
+
+    def disposable_categories(session, count):
+        created = Category.objects.bulk_create(Category(name='Disposable', user=session.user) for _ in range(count))
+        return [str(category.pk) for category in created]
+
+    return [
+        ('auth.login', 200, repeat, lambda s, n: s.anonymous.post(
+            reverse('token_obtain_pair'), {'email': s.user.email, 'password': PASSWORD}, format='json')),
+        ('auth.refresh', 200, repeat, lambda s, n: s.anonymous.post(
+            reverse('token_refresh'), {'refresh': s.refresh}, format='json')),
+        ('events.list', 200, repeat, lambda s, n: s.client.get(reverse('event-list'), s.window())),
+        ('events.retrieve', 200, pick('events'), lambda s, pk: s.client.get(reverse('event-detail', args=[pk]))),
+        ('events.create', 201, repeat, lambda s, n: s.client.post(
+            reverse('event-list'), s.event_data(n), format='json')),
+        ('events.update', 200, pick('events'), lambda s, pk: s.client.patch(
+            reverse('event-detail', args=[pk]), {'title': f'Renamed {s.rng.random()}'}, format='json')),
+        ('events.delete', 204, disposable_events, lambda s, pk: s.client.delete(
+            reverse('event-detail', args=[pk]))),
+        ('categories.list', 200, repeat, lambda s, n: s.client.get(reverse('category-list'))),
+        ('categories.create', 201, repeat, lambda s, n: s.client.post(
+            reverse('category-list'), {'name': f'Load category {n}', 'color': '#336699'}, format='json')),
+        ('categories.update', 200, pick('categories'), lambda s, pk: s.client.patch(
+            reverse('category-detail', args=[pk]), {'color': f'#{s.rng.randrange(1 << 24):06x}'}, format='json')),
+        ('categories.delete', 204, disposable_categories, lambda s, pk: s.client.delete(
+            reverse('category-detail', args=[pk]))),
+    ]
+
+
+def run_scenario(sessions, count, expected, prepare, send):
+    """Send ``count`` requests spread over one thread per session; (summary, failures)."""
+    from django.db import close_old_connections
+
+    per_session = [count // len(sessions) + (i < count % len(sessions)) for i in range(len(sessions))]
+    arguments = [prepare(session, n) for session, n in zip(sessions, per_session)]
+    samples, failures = [], []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(sessions) + 1)
+
+    def worker(session, args):
+        local_samples, local_failures = [], []
+        barrier.wait()
+        for arg in args:
+            start = time.perf_counter()
+            response = send(session, arg)
+            elapsed = time.perf_counter() - start
+            if response.status_code == expected:
+                local_samples.append(elapsed)
+            else:
+                local_failures.append(response.status_code)
+        close_old_connections()
+        with lock:
+            samples.extend(local_samples)
+            failures.extend(local_failures)
+
+    threads = [threading.Thread(target=worker, args=pair) for pair in zip(sessions, arguments)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    summary = summarize(samples, time.perf_counter() - began)
+    summary['failed'] = len(failures)
+    return summary, failures
+
+
+def compare(results, baseline, threshold):
+    """Print per-endpoint changes against ``baseline``; return the regressions."""
+    if baseline.get('config') != results['config']:
+        print(f"warning: baseline config differs: {baseline.get('config')}")
+    regressions = []
+    for name, current in results['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if previous is None:
+            print(f"{name:<32}  (not in baseline)")
+            continue
+        p95_change = current['p95_ms'] / previous['p95_ms'] - 1 if previous['p95_ms'] else 0.0
+        rps_change = current['rps'] / previous['rps'] - 1 if previous.get('rps') else 0.0
+        flagged = p95_change > threshold or rps_change < -threshold
+        print(f"{name:<32}  p95 {previous['p95_ms']:.2f} -> {current['p95_ms']:.2f}ms ({p95_change:+.0%})  "
+              f"rps {previous.get('rps', 0):.1f} -> {current['rps']:.1f} ({rps_change:+.0%})"
+              f"{'  REGRESSION' if flagged else ''}")
+        if flagged:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--events', type=int, default=500, help='seeded events per user')
+    parser.add_argument('--categories', type=int, default=10, help='seeded categories per user')
+    parser.add_argument('--requests', type=int, default=200, help='requests per endpoint')
+    parser.add_argument('--login-requests', type=int, default=40,
+                        help='requests for auth.login, which pays for a real password hash each time')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    parser.add_argument('--only', nargs='*', help='endpoint names to run, e.g. events.list auth.login')
+    args = parser.parse_args()
+    if args.threads > args.users:
+        parser.error('--threads cannot exceed --users')
+
+    from django.conf import global_settings
+    directory = tempfile.TemporaryDirectory()
+    # A file database, as in production: it gets the WAL profile from
+    # settings.SQLITE_PRAGMAS. Login cost is part of what is measured, so
+    # keep the production hashers.
+    setup_django(test_database=f'{directory.name}/api_load.sqlite3', PASSWORD_HASHERS=global_settings.PASSWORD_HASHERS)
+    import django
+    from accounts.models import CustomUser
+
+    seed(args.users, args.events, args.categories)
+    sessions = [
+        Session(user, index)
+        for index, user in enumerate(CustomUser.objects.filter(email__startswith='load').order_by('pk')[:args.threads])
+    ]
+
+    config = {key: getattr(args, key) for key in ('users', 'events', 'categories', 'requests', 'login_requests', 'threads')}
+    results = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'config': config,
+        'endpoints': {},
+    }
+    print(f"users={args.users}  events/user={args.events}  categories/user={args.categories}  threads={args.threads}")
+    for name, expected, prepare, send in scenarios():
+        if args.only and name not in args.only:
+            continue
+        count = args.login_requests if name == 'auth.login' else args.requests
+        summary, failures = run_scenario(sessions, count, expected, prepare, send)
+        results['endpoints'][name] = summary
+        print(format_summary(name, summary) + (f"  failed={len(failures)} {sorted(set(failures))}" if failures else ''))
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(results, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"regressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Concurrent clients against the sync DRF viewsets and the async views, under ASGI.
+
+    python -m benchmarks.async_views --events 2000 --requests 400 --concurrency 1 10 50
+
+Requests go straight into calendar_main.asgi.application from an asyncio
+client, so no network or server process is involved. Each client alternates
+an event list page and an event detail; both paths return identical bodies.
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+import time
+from .common import format_summary, setup_django, summarize
+
+
+async def call(application, path, query, token):
+    """Run one GET through the ASGI application and return (status, body)."""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'authorization', f'Bearer {token}'.encode())],
+        'client': ('127.0.0.1', 50000),
+        'server': ('testserver', 80),
+    }
+    sent = asyncio.Event()
+    response = {'body': b''}
+
+    async def receive():
+        if not sent.is_set():
+            sent.set()
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            response['status'] = message['status']
+        elif message['type'] == 'http.response.body':
+            response['body'] += message.get('body', b'')
+
+    await application(scope, receive, send)
+    return response['status'], response['body']
+
+
+async def run(application, paths, token, requests, concurrency):
+    work = itertools.islice(itertools.cycle(paths), requests)
+    samples = []
+
+    async def client():
+        for path, query in work:
+            start = time.perf_counter()
+            status, body = await call(application, path, query, token)
+            samples.append(time.perf_counter() - start)
+            assert status == 200, body[:200]
+
+    began = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return summarize(samples, time.perf_counter() - began)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50])
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.asgi import get_asgi_application
+    from django.urls import reverse
+    from django.utils import timezone
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts.models import CustomUser
+    from events.models import Event
+    from events.views import EventViewSet
+
+    # The async views have no response cache; compare the uncached paths.
+    EventViewSet.cached_actions = ()
+    application = get_asgi_application()
+    user = CustomUser.objects.create_user(email='bench@example.com', password='bench', is_active=True)
+    start = timezone.now().replace(microsecond=0)
+    events = Event.objects.bulk_create(
+        Event(
+            title=f"Event {i}",
+            startDate=start + datetime.timedelta(hours=i),
+            endDate=start + datetime.timedelta(hours=i, minutes=45),
+            user=user,
+        )
+        for i in range(args.events)
+    )
+    token = str(RefreshToken.for_user(user).access_token)
+    detail = str(events[len(events) // 2].pk)
+    variants = {
+        'sync': [(reverse('event-list'), 'page_size=100'), (reverse('event-detail', kwargs={'pk': detail}), '')],
+        'async': [(reverse('async-event-list'), 'page_size=100'), (reverse('async-event-detail', kwargs={'pk': detail}), '')],
+    }
+
+    async def compare():
+        for path, query in zip(variants['sync'], variants['async']):
+            sync_body = (await call(application, *path, token))[1]
+            async_body = (await call(application, *query, token))[1]
+            assert sync_body.split(b'"results"')[-1] == async_body.split(b'"results"')[-1], "bodies differ"
+        for concurrency in args.concurrency:
+            for name, paths in variants.items():
+                summary = await run(application, paths, token, args.requests, concurrency)
+                print(format_summary(f"{name} c={concurrency}", summary))
+
+    print(f"events={args.events}  requests={args.requests}")
+    asyncio.run(compare())
+
+
+if __name__ == '__main__':
+    main()
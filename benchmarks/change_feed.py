@@ -0,0 +1,96 @@
+"""Cost of idle change-feed connections and publish-to-delivery latency, under ASGI.
+
+    python -m benchmarks.change_feed --connections 2000 --messages 200
+
+Opens many Server-Sent Events connections through calendar_main.asgi
+in-process (one user per connection), measures the memory they hold while
+idle, then times how long a published change takes to reach the stream.
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from .common import format_summary, setup_django, summarize
+
+
+class FeedConnection:
+    """A fake ASGI client holding one feed request open."""
+
+    def __init__(self, application, path, token):
+        self.frames = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'authorization', f'Bearer {token}'.encode())],
+            'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+        }
+        self.task = asyncio.ensure_future(application(self.scope, self.receive, self.send))
+        self.requested = False
+
+    async def receive(self):
+        if not self.requested:
+            self.requested = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await self.disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        if message['type'] == 'http.response.body' and message.get('body'):
+            self.frames.put_nowait((time.perf_counter(), message['body']))
+
+    async def close(self):
+        self.disconnected.set()
+        await asyncio.wait([self.task], timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--connections', type=int, default=2000)
+    parser.add_argument('--messages', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django(EVENT_FEED_HEARTBEAT_SECONDS=3600)
+    from django.core.asgi import get_asgi_application
+    from django.urls import reverse
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts.models import CustomUser
+    from events.feed import broker
+
+    application = get_asgi_application()
+    users = CustomUser.objects.bulk_create(
+        CustomUser(email=f'feed{i}@example.com', is_active=True) for i in range(args.connections)
+    )
+    tokens = [str(RefreshToken.for_user(user).access_token) for user in users]
+    path = reverse('async-event-feed')
+
+    async def run():
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        connections = []
+        for token in tokens:
+            connection = FeedConnection(application, path, token)
+            connections.append(connection)
+            await connection.frames.get()  # the "ready" frame
+        idle = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        print(f"connections={broker.stats()['subscriptions']}  idle memory={idle / 1024 / 1024:.1f}MiB  "
+              f"per connection={idle / len(connections) / 1024:.1f}KiB")
+
+        samples = []
+        for number in range(args.messages):
+            index = number % len(connections)
+            sent = time.perf_counter()
+            broker.publish(users[index].pk, {'type': 'change', 'number': number})
+            received, _ = await connections[index].frames.get()
+            samples.append(received - sent)
+        print(format_summary('publish -> stream', summarize(samples)))
+
+        await asyncio.gather(*(connection.close() for connection in connections))
+        print(f"after disconnect: subscriptions={broker.stats()['subscriptions']}")
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Helpers shared by the benchmark scripts in this package.
+
+Benchmarks run against a throwaway test database, never db.sqlite3:
+
+    python -m benchmarks.<name> [options]
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(test_database=None, **overrides):
+    """Configure Django, create a test database and apply setting overrides.
+
+    The test database is in memory unless ``test_database`` names a file;
+    use one when several threads write at once, since in-memory SQLite locks
+    whole tables and fails instead of waiting.
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'calendar_main.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    import django
+    from django.conf import settings
+    django.setup()
+
+    from django.db import connection, connections
+    from django.test.utils import setup_test_environment
+    setup_test_environment()
+    # Cheap hashing keeps user creation out of the measurements unless a
+    # benchmark asks for the real hashers.
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    if test_database is not None:
+        settings.DATABASES['default']['TEST']['NAME'] = str(test_database)
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+    # Aliases such as the read replica point at the test database, as under the test runner.
+    for alias in connections:
+        mirror = connections[alias].settings_dict['TEST'].get('MIRROR')
+        if mirror:
+            connections[alias].creation.set_as_test_mirror(connections[mirror].settings_dict)
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples, elapsed=None):
+    """p50/p95/p99/mean in milliseconds plus requests per second."""
+    summary = {
+        'count': len(samples),
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'mean_ms': statistics.fmean(samples) * 1000 if samples else 0.0,
+    }
+    if elapsed:
+        summary['rps'] = len(samples) / elapsed
+    return summary
+
+
+def format_summary(name, summary):
+    parts = [f"{name:<32}"]
+    for key in ('count', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'rps'):
+        if key in summary:
+            value = summary[key]
+            parts.append(f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}")
+    return '  '.join(parts)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
@@ -0,0 +1,64 @@
+"""Registration latency and outbox throughput against a slow SMTP server.
+
+    python -m benchmarks.email_outbox --requests 50 --connect-delay 0.2 --message-delay 0.02
+
+Compares the old inline path (one SMTP session per request) with the
+outbox: requests only insert a row, and the worker drains the rows over a
+single connection.
+"""
+import argparse
+import time
+from .common import format_summary, setup_django, summarize, timed
+from .smtp_sink import SMTPSink
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--connect-delay', type=float, default=0.2)
+    parser.add_argument('--message-delay', type=float, default=0.02)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+
+    sink = SMTPSink(connect_delay=args.connect_delay, message_delay=args.message_delay).start_in_thread()
+    setup_django(
+        EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+        EMAIL_HOST=sink.host,
+        EMAIL_PORT=sink.port,
+    )
+    from django.core.mail import send_mail
+    from rest_framework.test import APIClient
+    from accounts.mail import deliver_batch
+    from accounts.models import OutboundEmail
+
+    client = APIClient()
+
+    inline = []
+    for i in range(args.requests):
+        elapsed, _ = timed(send_mail, 'Activate your account', 'link', 'noreply@authsystem.com', [f'inline{i}@example.com'])
+        inline.append(elapsed)
+
+    queued = []
+    for i in range(args.requests):
+        data = {'email': f'user{i}@example.com', 'password': 'StrongPassword123!'}
+        elapsed, response = timed(client.post, '/api/auth/register/', data, format='json')
+        assert response.status_code == 201, response.content
+        queued.append(elapsed)
+
+    start = time.perf_counter()
+    sent = 0
+    while True:
+        batch_sent, batch_failed = deliver_batch(args.batch_size)
+        if not (batch_sent or batch_failed):
+            break
+        sent += batch_sent
+    drain = time.perf_counter() - start
+    assert OutboundEmail.objects.filter(status=OutboundEmail.SENT).count() == args.requests
+
+    print(format_summary('inline send_mail (per request)', summarize(inline, sum(inline))))
+    print(format_summary('register with outbox', summarize(queued, sum(queued))))
+    print(f"{'outbox worker':<32}  sent={sent}  seconds={drain:.2f}  msgs_per_sec={sent / drain:.2f}")
+
+
+if __name__ == '__main__':
+    main()
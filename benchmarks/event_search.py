@@ -0,0 +1,72 @@
+"""Latency of event search on a large calendar, FTS5 index versus icontains.
+
+    python -m benchmarks.event_search --events 100000 --requests 200
+"""
+import argparse
+import datetime
+import random
+import time
+from unittest import mock
+from .common import format_summary, setup_django, summarize
+
+SYLLABLES = "ka lo mi ne ru sa ti vo ze pa".split()
+# 1000 made-up words, so a query matches a realistic handful of events.
+WORDS = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.urls import reverse
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts.models import CustomUser
+    from events import search
+    from events.models import Event
+
+    rng = random.Random(args.seed)
+    user = CustomUser.objects.create_user(email='bench@example.com', password='bench', is_active=True)
+    start = timezone.now().replace(microsecond=0)
+    Event.objects.bulk_create(
+        (
+            Event(
+                title=' '.join(rng.sample(WORDS, 2)) + f" {i}",
+                description=' '.join(rng.choices(WORDS, k=8)),
+                startDate=start + datetime.timedelta(hours=i),
+                endDate=start + datetime.timedelta(hours=i, minutes=30),
+                user=user,
+            )
+            for i in range(args.events)
+        ),
+        batch_size=2000,
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    url = reverse('event-search')
+    # Half common words (~1% of events each), half a single event's number.
+    queries = [rng.choice(WORDS) if n % 2 else str(rng.randrange(args.events)) for n in range(args.requests)]
+
+    def run():
+        samples = []
+        began = time.perf_counter()
+        for query in queries:
+            request_start = time.perf_counter()
+            response = client.get(url, {'q': query, 'limit': 20})
+            samples.append(time.perf_counter() - request_start)
+            assert response.status_code == 200, response.content
+        return summarize(samples, time.perf_counter() - began)
+
+    print(f"events={args.events}  requests={args.requests}")
+    print(format_summary('fts5', run()))
+    with mock.patch.object(search, 'fts_available', return_value=False):
+        print(format_summary('icontains', run()))
+
+
+if __name__ == '__main__':
+    main()
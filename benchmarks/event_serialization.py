@@ -0,0 +1,60 @@
+"""EventSerializer + JSONRenderer versus EventRowSerializer + FastJSONRenderer.
+
+    python -m benchmarks.event_serialization --events 10000 --repeat 5
+
+FastJSONRenderer uses orjson (in requirements.txt); without it the renderer
+falls back to the standard one, and the speedup is the serializer's alone.
+"""
+import argparse
+import datetime
+from .common import setup_django, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.utils import timezone
+    from rest_framework.renderers import JSONRenderer
+    from accounts.models import CustomUser
+    from events import renderers
+    from events.models import Category, Event
+    from events.renderers import FastJSONRenderer
+    from events.serializers import EventRowSerializer, EventSerializer
+
+    user = CustomUser.objects.create_user(email='bench@example.com', password='bench', is_active=True)
+    categories = [Category.objects.create(name=f"Category {i}", user=user) for i in range(5)]
+    start = timezone.now().replace(microsecond=0)
+    Event.objects.bulk_create(
+        Event(
+            title=f"Event {i}",
+            description="Lorem ipsum dolor sit amet" if i % 2 else None,
+            startDate=start + datetime.timedelta(hours=i),
+            endDate=start + datetime.timedelta(hours=i, minutes=45),
+            category=categories[i % len(categories)] if i % 3 else None,
+            user=user,
+        )
+        for i in range(args.events)
+    )
+    queryset = Event.objects.filter(user=user).order_by('startDate', 'id')
+
+    def slow():
+        return JSONRenderer().render(EventSerializer(queryset, many=True).data)
+
+    def fast():
+        row_serializer = EventRowSerializer()
+        return FastJSONRenderer().render(row_serializer.serialize(queryset.values(*row_serializer.value_fields)))
+
+    assert slow() == fast(), "fast path output differs from EventSerializer"
+    slow_best = min(timed(slow)[0] for _ in range(args.repeat))
+    fast_best = min(timed(fast)[0] for _ in range(args.repeat))
+    print(f"events={args.events}  orjson={'yes' if renderers.orjson else 'no'}")
+    print(f"{'EventSerializer + JSONRenderer':<40} best={slow_best * 1000:.1f}ms")
+    print(f"{'EventRowSerializer + FastJSONRenderer':<40} best={fast_best * 1000:.1f}ms  speedup={slow_best / fast_best:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
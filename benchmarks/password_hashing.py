@@ -0,0 +1,142 @@
+"""Tail latency of the events API while a burst of logins is running.
+
+    python -m benchmarks.password_hashing --login-threads 8 --api-threads 4 --duration 10
+
+Every phase runs --api-threads clients listing events for --duration
+seconds, each in a loop:
+
+  quiet          no logins
+  burst inline   --login-threads clients logging in non-stop, hashing on
+                 their request threads (PASSWORD_HASHING_WORKERS=0)
+  burst pooled   the same burst through accounts.hashing (--workers processes,
+                 --queue-size waiting; the rest get 429)
+
+Passwords use the production hashers.
+"""
+import argparse
+import collections
+import datetime
+import logging
+import tempfile
+import threading
+import time
+from .common import format_summary, setup_django, summarize
+
+PASSWORD = 'Bench-password-1'
+
+
+def run_phase(duration, api_clients, login_clients, list_url, login_url):
+    from django.db import close_old_connections
+
+    stop = threading.Event()
+    samples, statuses = [], collections.Counter()
+    lock = threading.Lock()
+
+    def api_worker(client):
+        local = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            response = client.get(list_url)
+            local.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.status_code
+        close_old_connections()
+        with lock:
+            samples.extend(local)
+
+    def login_worker(client, email):
+        local = collections.Counter()
+        while not stop.is_set():
+            response = client.post(login_url, {'email': email, 'password': PASSWORD}, format='json')
+            local[response.status_code] += 1
+            if response.status_code == 429:
+                # A well-behaved client backs off, briefly.
+                time.sleep(0.05)
+        close_old_connections()
+        with lock:
+            statuses.update(local)
+
+    threads = [threading.Thread(target=api_worker, args=(client,)) for client in api_clients]
+    threads += [threading.Thread(target=login_worker, args=pair) for pair in login_clients]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return summarize(samples, time.perf_counter() - began), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--login-threads', type=int, default=8)
+    parser.add_argument('--api-threads', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per phase')
+    parser.add_argument('--events', type=int, default=100, help='events per API user')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--queue-size', type=int, default=2)
+    args = parser.parse_args()
+
+    from django.conf import global_settings
+    directory = tempfile.TemporaryDirectory()
+    setup_django(test_database=f'{directory.name}/password_hashing.sqlite3',
+                 PASSWORD_HASHERS=global_settings.PASSWORD_HASHERS)
+    from django.contrib.auth.hashers import make_password
+    from django.test.utils import override_settings
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts import hashing
+    from accounts.models import CustomUser
+    from events.models import Event
+    from events.views import EventViewSet
+
+    # Refused logins are expected here; don't log a warning for each.
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+    # Measure the list itself, not the response cache.
+    EventViewSet.cached_actions = ()
+    password = make_password(PASSWORD)
+    api_users = CustomUser.objects.bulk_create(
+        CustomUser(email=f'api{i}@example.com', password=password, is_active=True) for i in range(args.api_threads)
+    )
+    login_users = CustomUser.objects.bulk_create(
+        CustomUser(email=f'login{i}@example.com', password=password, is_active=True) for i in range(args.login_threads)
+    )
+    start = datetime.datetime(2025, 6, 1, 9, tzinfo=datetime.timezone.utc)
+    Event.objects.bulk_create(
+        Event(title=f'Event {n}', startDate=start + datetime.timedelta(hours=n),
+              endDate=start + datetime.timedelta(hours=n, minutes=30), user=user)
+        for user in api_users for n in range(args.events)
+    )
+    api_clients = []
+    for user in api_users:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+        api_clients.append(client)
+    login_clients = [(APIClient(raise_request_exception=False), user.email) for user in login_users]
+    list_url, login_url = reverse('event-list'), reverse('token_obtain_pair')
+
+    phases = [
+        ('quiet', [], {}),
+        ('burst inline', login_clients, {'PASSWORD_HASHING_WORKERS': 0}),
+        ('burst pooled', login_clients, {
+            'PASSWORD_HASHING_WORKERS': args.workers, 'PASSWORD_HASHING_QUEUE_SIZE': args.queue_size,
+        }),
+    ]
+    print(f"api threads={args.api_threads}  login threads={args.login_threads}  duration={args.duration}s")
+    for name, logins, overrides in phases:
+        with override_settings(**overrides):
+            if overrides.get('PASSWORD_HASHING_WORKERS'):
+                # Start the workers before timing; spawning them is a one-off cost.
+                with hashing.offloaded():
+                    login_users[0].check_password(PASSWORD)
+            summary, statuses = run_phase(args.duration, api_clients, logins, list_url, login_url)
+        line = format_summary(f'events.list ({name})', summary)
+        if statuses:
+            logins_per_second = statuses[200] / args.duration
+            line += f"  logins/s={logins_per_second:.1f}  login statuses={dict(sorted(statuses.items()))}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
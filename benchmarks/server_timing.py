@@ -0,0 +1,70 @@
+"""Overhead of the Server-Timing instrumentation on the event list endpoint.
+
+    python -m benchmarks.server_timing --events 200 --requests 2000
+
+Times the same requests with ServerTimingMiddleware removed, installed with
+sampling off, and sampling every request.
+"""
+import argparse
+import datetime
+import time
+from .common import format_summary, setup_django, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test.utils import override_settings
+    from django.urls import reverse
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts.models import CustomUser
+    from events.models import Event
+    from events.views import EventViewSet
+
+    # Measure the whole request path, not the response cache.
+    EventViewSet.cached_actions = ()
+    user = CustomUser.objects.create_user(email='bench@example.com', password='bench', is_active=True)
+    start = timezone.now().replace(microsecond=0)
+    Event.objects.bulk_create(
+        Event(title=f'Event {i}', startDate=start + datetime.timedelta(hours=i),
+              endDate=start + datetime.timedelta(hours=i, minutes=30), user=user)
+        for i in range(args.events)
+    )
+    token = RefreshToken.for_user(user).access_token
+    url = reverse('event-list')
+    without = [name for name in settings.MIDDLEWARE if name != 'calendar_main.timing.ServerTimingMiddleware']
+
+    profiles = [
+        ('without middleware', {'MIDDLEWARE': without}),
+        ('sampling off', {'SERVER_TIMING_SAMPLE_RATE': 0.0}),
+        ('sampling every request', {'SERVER_TIMING_SAMPLE_RATE': 1.0}),
+    ]
+    print(f"events={args.events}  requests={args.requests}")
+    # Two rounds, reporting the second, so every profile runs warm.
+    for round_ in range(2):
+        for name, overrides in profiles:
+            with override_settings(**overrides):
+                # A new client loads the middleware with the overridden settings.
+                client = APIClient()
+                client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+                samples = []
+                began = time.perf_counter()
+                for _ in range(args.requests):
+                    request_start = time.perf_counter()
+                    response = client.get(url)
+                    samples.append(time.perf_counter() - request_start)
+                    assert response.status_code == 200, response.content
+                summary = summarize(samples, time.perf_counter() - began)
+            if round_:
+                print(format_summary(name, summary))
+
+
+if __name__ == '__main__':
+    main()
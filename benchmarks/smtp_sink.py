@@ -0,0 +1,99 @@
+"""Minimal SMTP server that accepts and discards mail, with optional latency.
+
+Stands in for a real (possibly slow) mail server in local runs:
+
+    python -m benchmarks.smtp_sink --port 1025 --connect-delay 0.2 --message-delay 0.05
+
+and point Django at it with EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend,
+EMAIL_HOST=127.0.0.1, EMAIL_PORT=1025.
+"""
+import argparse
+import asyncio
+import threading
+
+
+class SMTPSink:
+    def __init__(self, host='127.0.0.1', port=0, connect_delay=0.0, message_delay=0.0):
+        self.host = host
+        self.port = port
+        self.connect_delay = connect_delay
+        self.message_delay = message_delay
+        self.connections = 0
+        self.received = 0
+        self._loop = None
+        self._server = None
+
+    async def _reply(self, writer, line):
+        writer.write(line + b'\r\n')
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+        await self._reply(writer, b'220 sink ESMTP')
+        in_data = False
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if in_data:
+                if line.rstrip(b'\r\n') == b'.':
+                    in_data = False
+                    self.received += 1
+                    if self.message_delay:
+                        await asyncio.sleep(self.message_delay)
+                    await self._reply(writer, b'250 OK queued')
+                continue
+            command = line[:4].upper()
+            if command == b'EHLO':
+                await self._reply(writer, b'250-sink')
+                await self._reply(writer, b'250 8BITMIME')
+            elif command == b'DATA':
+                in_data = True
+                await self._reply(writer, b'354 End data with <CR><LF>.<CR><LF>')
+            elif command == b'QUIT':
+                await self._reply(writer, b'221 Bye')
+                break
+            else:
+                await self._reply(writer, b'250 OK')
+        writer.close()
+
+    async def serve(self, ready=None):
+        self._server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready.set()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self):
+        """Run the sink on a daemon thread and return once it is listening."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.serve(ready))
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1025)
+    parser.add_argument('--connect-delay', type=float, default=0.0)
+    parser.add_argument('--message-delay', type=float, default=0.0)
+    args = parser.parse_args()
+    sink = SMTPSink(args.host, args.port, args.connect_delay, args.message_delay)
+    print(f"SMTP sink listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(sink.serve())
+    except KeyboardInterrupt:
+        print(f"Received {sink.received} messages over {sink.connections} connections")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Mixed read/write load against a file-backed SQLite database, before and after tuning.
+
+    python -m benchmarks.sqlite_profile --threads 8 --requests 300
+
+Runs each profile in its own process on a fresh temporary database file:
+
+  baseline  rollback journal, no pragmas, deferred transactions, one alias
+  tuned     the settings.SQLITE_PRAGMAS profile (WAL, mmap, ...), IMMEDIATE
+            transactions and reads routed to the read-only replica alias
+
+Every thread plays one user issuing ~80% event list GETs and ~20% creates.
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from .common import BASE_DIR, format_summary, summarize
+
+PROFILES = ('baseline', 'tuned')
+
+
+def setup(profile, path):
+    os.environ['DATABASE_FILE'] = str(path)
+    os.environ['DATABASE_READ_REPLICA'] = '1' if profile == 'tuned' else '0'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'calendar_main.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    sys.path.insert(0, str(BASE_DIR))
+    import django
+    from django.conf import settings
+    django.setup()
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    settings.ALLOWED_HOSTS = ['testserver']
+    if profile == 'baseline':
+        # Connections are only opened after this, so nothing tuned leaks in.
+        settings.SQLITE_PRAGMAS = {}
+        settings.DATABASES['default']['OPTIONS'] = {}
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def run_profile(profile, threads, requests_per_thread, seed_events):
+    from django.db import close_old_connections, connection
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from accounts.models import CustomUser
+    from events.models import Event
+    from events.views import EventViewSet
+
+    # Measure the database, not the response cache.
+    EventViewSet.cached_actions = ()
+    users = [
+        CustomUser.objects.create_user(email=f'sqlite{i}@example.com', password='x', is_active=True)
+        for i in range(threads)
+    ]
+    Event.objects.bulk_create(
+        Event(user=user, title=f'Seed {n}', startDate=f'2025-06-{n % 28 + 1:02d}T09:00:00Z',
+              endDate=f'2025-06-{n % 28 + 1:02d}T10:00:00Z')
+        for user in users for n in range(seed_events)
+    )
+    tokens = [str(RefreshToken.for_user(user).access_token) for user in users]
+    url = reverse('event-list')
+    journal_mode = connection.cursor().execute('PRAGMA journal_mode').fetchone()[0]
+    connection.close()
+
+    reads, writes, failures = [], [], []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        client = APIClient(raise_request_exception=False)
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens[index]}')
+        rng = random.Random(index)
+        local_reads, local_writes, local_failures = [], [], []
+        barrier.wait()
+        for n in range(requests_per_thread):
+            start = time.perf_counter()
+            if rng.random() < 0.8:
+                response = client.get(url, {'start': '2025-06-01T00:00:00Z', 'end': '2025-07-01T00:00:00Z'})
+                samples, expected = local_reads, 200
+            else:
+                day = rng.randint(1, 28)
+                response = client.post(url, {
+                    'title': f'Load {index}-{n}',
+                    'startDate': f'2025-06-{day:02d}T11:00:00Z',
+                    'endDate': f'2025-06-{day:02d}T12:00:00Z',
+                }, format='json')
+                samples, expected = local_writes, 201
+            elapsed = time.perf_counter() - start
+            if response.status_code == expected:
+                samples.append(elapsed)
+            else:
+                local_failures.append(response.status_code)
+        close_old_connections()
+        with lock:
+            reads.extend(local_reads)
+            writes.extend(local_writes)
+            failures.extend(local_failures)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{profile}: journal_mode={journal_mode}  threads={threads}  failed={len(failures)}")
+    print(format_summary(f'{profile} all', summarize(reads + writes, elapsed)))
+    print(format_summary(f'{profile} reads', summarize(reads)))
+    print(format_summary(f'{profile} writes', summarize(writes)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=300, help='requests per thread')
+    parser.add_argument('--seed-events', type=int, default=200, help='existing events per user')
+    parser.add_argument('--profile', choices=PROFILES, help='run a single profile in this process')
+    args = parser.parse_args()
+
+    if args.profile is None:
+        for profile in PROFILES:
+            subprocess.run(
+                [sys.executable, '-m', 'benchmarks.sqlite_profile', '--profile', profile,
+                 '--threads', str(args.threads), '--requests', str(args.requests),
+                 '--seed-events', str(args.seed_events)],
+                cwd=BASE_DIR, check=True,
+            )
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup(args.profile, Path(directory) / 'benchmark.sqlite3')
+        run_profile(args.profile, args.threads, args.requests, args.seed_events)
+
+
+if __name__ == '__main__':
+    main()
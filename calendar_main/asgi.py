@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'calendar_main.settings')
+# Persistent connections would pile up, one per short-lived sync thread.
+os.environ.setdefault('DATABASE_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
@@ -0,0 +1,53 @@
+"""SQLite tuning and read/write routing for the project's databases.
+
+``configure_sqlite`` runs on every new connection (connected to
+``connection_created`` in events.apps) and applies settings.SQLITE_PRAGMAS.
+``ReadReplicaRouter`` sends reads of calendar data to the read-only 'replica'
+alias, a second connection to the same file, so readers never queue behind a
+writer's connection; with WAL they also never wait for the write lock.
+"""
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    read_only = connection.settings_dict.get('READ_ONLY', False)
+    # Straight on the DB-API connection, so the pragmas never show up in query logs or counts.
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        if read_only and name == 'journal_mode':
+            # Switching journal mode writes to the file; the primary already did it.
+            continue
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+    if read_only:
+        connection.connection.execute('PRAGMA query_only = ON')
+
+
+class ReadReplicaRouter:
+    """Reads of ``replica_apps`` models go to the replica alias; everything
+    else, writes and migrations go to the primary.
+
+    Reads made while the primary is inside atomic() stay on the primary so a
+    transaction always sees its own uncommitted writes.
+    """
+    # Auth, admin and sessions do read-modify-write outside atomic(); they
+    # keep to one connection.
+    replica_apps = {'events'}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in self.replica_apps or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases open the same database file.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
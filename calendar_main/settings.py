@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from decouple import config
 
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'calendar_main.timing.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -71,14 +73,91 @@ WSGI_APPLICATION = 'calendar_main.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+DATABASE_FILE = Path(config('DATABASE_FILE', default=str(BASE_DIR / 'db.sqlite3')))
+# Seconds a connection is kept open between requests, sparing WSGI workers a
+# reconnect (and SQLITE_PRAGMAS) per request. calendar_main.asgi defaults it
+# to 0: there sync code runs in short-lived threads that would each keep their own.
+DATABASE_CONN_MAX_AGE = config('DATABASE_CONN_MAX_AGE', default=60, cast=int)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': DATABASE_FILE,
+        'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock when a transaction starts instead of failing
+            # with "database is locked" when it later tries to upgrade.
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+# Reads are routed to a second, read-only connection to the same file (see
+# calendar_main.database). Tests mirror it onto the default test database.
+if config('DATABASE_READ_REPLICA', default=True, cast=bool):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': DATABASE_FILE.resolve().as_uri() + '?mode=ro',
+        'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'uri': True},
+        'READ_ONLY': True,
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_ROUTERS = ['calendar_main.database.ReadReplicaRouter']
+
+# Applied to every new SQLite connection by calendar_main.database.configure_sqlite.
+# WAL lets readers proceed while a writer commits; synchronous=NORMAL is safe
+# with WAL and skips an fsync per transaction.
+SQLITE_PRAGMAS = {
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT_MS', default=5000, cast=int),
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+    'cache_size': -config('SQLITE_CACHE_KIB', default=20000, cast=int),
+    'temp_store': 'MEMORY',
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Rendered event/category reads, see events.caching. Entries are keyed on
+    # the calendar version, so a per-process cache never serves stale bodies.
+    'events': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'events-responses',
+        'TIMEOUT': config('EVENTS_CACHE_TIMEOUT', default=300, cast=int),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('EVENTS_CACHE_MAX_ENTRIES', default=10000, cast=int),
+        },
+    },
+    # Authenticated users' state, see AUTH_CACHE_ALIAS below.
+    'auth': {
+        'BACKEND': config('AUTH_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('AUTH_CACHE_LOCATION', default='auth-user-state'),
+    },
+}
+
+
+# Verified JWTs (in process) and minimal user state (in AUTH_CACHE_ALIAS),
+# see accounts.authentication. Deactivating a user or changing a password
+# drops the cached state in that cache only, so the default LocMem backend is
+# correct with a single server process: with several, every other process
+# keeps authenticating the user for up to AUTH_CACHE_TIMEOUT seconds. Run
+# more than one process with a shared AUTH_CACHE_BACKEND (e.g.
+# django.core.cache.backends.redis.RedisCache and a redis:// AUTH_CACHE_LOCATION),
+# or AUTH_CACHE_TIMEOUT=0 to not cache users. `check --deploy` warns about it.
+AUTH_CACHE_ALIAS = 'auth'
+AUTH_CACHE_TIMEOUT = config('AUTH_CACHE_TIMEOUT', default=60, cast=int)
+AUTH_TOKEN_CACHE_SIZE = config('AUTH_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -125,15 +204,100 @@ AUTH_USER_MODEL = 'accounts.CustomUser'
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'noreply@authsystem.com'
 
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+
+AUDIT_LOG_FILE = config('AUDIT_LOG_FILE', default=str(BASE_DIR / 'logs' / 'password_reset.log'))
+PERFORMANCE_LOG_FILE = config('PERFORMANCE_LOG_FILE', default=str(BASE_DIR / 'logs' / 'performance.log'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {
+            '()': 'accounts.audit.JsonFormatter',
+        },
+    },
+    'handlers': {
+        'audit': {
+            'class': 'accounts.audit.AuditHandler',
+            'filename': AUDIT_LOG_FILE,
+            'max_bytes': config('AUDIT_LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int),
+            'backup_count': config('AUDIT_LOG_BACKUP_COUNT', default=5, cast=int),
+            'queue_size': config('AUDIT_LOG_QUEUE_SIZE', default=10000, cast=int),
+            'formatter': 'json',
+        },
+        'performance': {
+            'class': 'accounts.audit.AuditHandler',
+            'filename': PERFORMANCE_LOG_FILE,
+            'max_bytes': config('PERFORMANCE_LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int),
+            'backup_count': config('PERFORMANCE_LOG_BACKUP_COUNT', default=5, cast=int),
+            'formatter': 'json',
+        },
+    },
+    'loggers': {
+        'password_reset': {
+            'handlers': ['audit'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'performance': {
+            'handlers': ['performance'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+# Request timing (calendar_main.timing): the share of requests, 0.0-1.0, that
+# get a Server-Timing header and a line in PERFORMANCE_LOG_FILE. At 0.0 the
+# instrumentation costs a random() call per request and nothing per query.
+SERVER_TIMING_SAMPLE_RATE = config('SERVER_TIMING_SAMPLE_RATE', default=0.0, cast=float)
+# Off to keep sampled timings in the log only, e.g. when clients should not see them.
+SERVER_TIMING_HEADER = config('SERVER_TIMING_HEADER', default=True, cast=bool)
+
+# Password hashing for login, password change and reset confirm runs in this
+# many processes (accounts.hashing); 0 hashes inline. Up to QUEUE_SIZE more
+# requests may wait for a worker, further ones get 429. A hash not done
+# within TIMEOUT seconds gives 503.
+PASSWORD_HASHING_WORKERS = config('PASSWORD_HASHING_WORKERS', default=max(1, (os.cpu_count() or 2) // 2), cast=int)
+PASSWORD_HASHING_QUEUE_SIZE = config('PASSWORD_HASHING_QUEUE_SIZE', default=16, cast=int)
+PASSWORD_HASHING_TIMEOUT = config('PASSWORD_HASHING_TIMEOUT', default=5.0, cast=float)
+
+# Outbox delivery, see accounts.mail and `manage.py send_outbox`.
+EMAIL_OUTBOX_MAX_ATTEMPTS = config('EMAIL_OUTBOX_MAX_ATTEMPTS', default=5, cast=int)
+EMAIL_OUTBOX_BACKOFF_SECONDS = config('EMAIL_OUTBOX_BACKOFF_SECONDS', default=30, cast=int)
+EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = config('EMAIL_OUTBOX_MAX_BACKOFF_SECONDS', default=3600, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     
+    'DEFAULT_RENDERER_CLASSES': (
+        'events.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 
 }
 
+# Default page size of the event and category lists (events.pagination);
+# clients can ask for up to 1000 with ?page_size=.
+API_PAGE_SIZE = config('API_PAGE_SIZE', default=100, cast=int)
+
+# Deletions older than this are pruned by `manage.py prune_tombstones`; older
+# sync tokens get 410 Gone and clients must do a full sync.
+SYNC_TOMBSTONE_RETENTION_DAYS = config('SYNC_TOMBSTONE_RETENTION_DAYS', default=30, cast=int)
+
+# Live change feed (GET /api/async/events/feed/, Server-Sent Events; needs ASGI).
+# Each connection buffers at most EVENT_FEED_QUEUE_SIZE changes; beyond that
+# the client is told to resync instead.
+EVENT_FEED_QUEUE_SIZE = config('EVENT_FEED_QUEUE_SIZE', default=100, cast=int)
+EVENT_FEED_MAX_CONNECTIONS_PER_USER = config('EVENT_FEED_MAX_CONNECTIONS_PER_USER', default=10, cast=int)
+EVENT_FEED_HEARTBEAT_SECONDS = config('EVENT_FEED_HEARTBEAT_SECONDS', default=15, cast=int)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'AuthSystem API',
     'DESCRIPTION': 'Documentation for the AuthSystem API',
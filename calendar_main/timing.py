@@ -0,0 +1,186 @@
+"""Per-request performance instrumentation: a Server-Timing header and a log line.
+
+ServerTimingMiddleware samples SERVER_TIMING_SAMPLE_RATE of the requests. For
+a sampled request it records:
+
+  db         queries and time spent executing them, on every database alias
+  auth       JWT authentication (accounts.authentication)
+  serialize  serializer validation and representation (events.serializers)
+  view       from the view being called until it returns its response
+  render     turning a DRF/template response into bytes
+  total      the whole request, including the other middleware
+
+plus the response size, and writes them to the 'performance' logger. Phases
+overlap: db time is also counted in whichever phase ran the query.
+
+Code outside this module reports time with ``measure(name)``. For requests
+that are not sampled it does nothing beyond a context variable lookup, as do
+the query wrapper and the view hooks.
+"""
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger('performance')
+
+_current = contextvars.ContextVar('request_timing', default=None)
+
+PHASES = ('db', 'auth', 'serialize', 'view', 'render', 'total')
+
+
+class RequestTiming:
+    """Durations (in seconds) and query count collected for one sampled request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.queries = 0
+        self.view_started = None
+        self.view_returned = None
+
+    def add(self, name, seconds):
+        self.durations[name] += seconds
+
+    def server_timing(self, size):
+        metrics = []
+        for name in PHASES:
+            entry = f'{name};dur={self.durations[name] * 1000:.2f}'
+            if name == 'db':
+                entry += f';desc="{self.queries} queries"'
+            metrics.append(entry)
+        if size is not None:
+            metrics.append(f'size;desc="{size} bytes"')
+        return ', '.join(metrics)
+
+
+@contextmanager
+def measure(name):
+    """Add the time spent in the block to phase ``name`` of the current sampled request."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(name, time.perf_counter() - start)
+
+
+def record_query(execute, sql, params, many, context):
+    timing = _current.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.queries += 1
+        timing.add('db', time.perf_counter() - start)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """connection_created receiver. Wrappers live on the connection, which is
+    per thread, so installing them here also covers the threads async views
+    run their queries in; the request's timing follows them as a context variable.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class ServerTimingMiddleware:
+    """Times sampled requests; list it first in MIDDLEWARE so ``total`` covers the rest."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.SERVER_TIMING_SAMPLE_RATE
+        self.send_header = settings.SERVER_TIMING_HEADER
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # Async hooks, or Django would run each one through sync_to_async.
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def sampled(self):
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+        timing = RequestTiming()
+        token = _current.set(timing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, timing)
+        return response
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+        timing = RequestTiming()
+        token = _current.set(timing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, timing)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.view_started()
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self.view_started()
+        return None
+
+    def process_template_response(self, request, response):
+        self.view_returned(response)
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        self.view_returned(response)
+        return response
+
+    def view_started(self):
+        timing = _current.get()
+        if timing is not None:
+            timing.view_started = time.perf_counter()
+
+    def view_returned(self, response):
+        timing = _current.get()
+        if timing is not None:
+            timing.view_returned = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: timing.add('render', time.perf_counter() - timing.view_returned)
+            )
+
+    def finish(self, request, response, timing):
+        now = time.perf_counter()
+        timing.add('total', now - timing.started)
+        if timing.view_started is not None:
+            timing.add('view', (timing.view_returned or now) - timing.view_started)
+        size = None if response.streaming else len(response.content)
+        if self.send_header:
+            response['Server-Timing'] = timing.server_timing(size)
+        match = request.resolver_match
+        logger.info('request', extra={'audit': {
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'queries': timing.queries,
+            **{f'{name}_ms': round(timing.durations[name] * 1000, 3) for name in PHASES},
+            'bytes': size,
+        }})
@@ -0,0 +1,93 @@
+import datetime
+from collections import defaultdict
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncDate
+from .filters import filter_window
+from .recurrence import expand
+
+ONE_DAY = datetime.timedelta(days=1)
+
+
+def local_midnight(day, tz):
+    return datetime.datetime.combine(day, datetime.time.min, tzinfo=tz)
+
+
+def split_by_day(start, end, tz):
+    """Yield (local day, duration) for each day the interval [start, end) touches.
+
+    A zero-length interval still counts once, on the day it happens.
+    """
+    day = start.astimezone(tz).date()
+    if start == end:
+        yield day, datetime.timedelta(0)
+        return
+    while True:
+        next_midnight = local_midnight(day + ONE_DAY, tz)
+        # In UTC: datetimes sharing a tzinfo subtract on the wall clock, which
+        # would make DST switch days 24 hours long.
+        day_start = max(start, local_midnight(day, tz)).astimezone(datetime.timezone.utc)
+        yield day, min(end, next_midnight).astimezone(datetime.timezone.utc) - day_start
+        if end <= next_midnight:
+            return
+        day += ONE_DAY
+
+
+def summarize_days(queryset, first_day, last_day, tz):
+    """Per-day, per-category event counts and durations over the local days [first_day, last_day].
+
+    Events within a single local day, the bulk of any calendar, are grouped
+    and summed in SQL, so only one row per (day, category) leaves the
+    database. Events crossing midnight and recurring series are split across
+    the days they cover in Python. Overlapping events each add their own
+    duration.
+    """
+    window_start = local_midnight(first_day, tz)
+    window_end = local_midnight(last_day + ONE_DAY, tz)
+    candidates = filter_window(queryset, window_start, window_end)
+    events = candidates.annotate(
+        day=TruncDate('startDate', tzinfo=tz),
+        lastDay=TruncDate('endDate', tzinfo=tz),
+    )
+    buckets = defaultdict(lambda: [0, datetime.timedelta(0)])
+
+    single_day = (
+        events.filter(recurrence__isnull=True, day=F('lastDay'))
+        .values('day', 'category')
+        .annotate(
+            count=Count('id'),
+            duration=Sum(ExpressionWrapper(F('endDate') - F('startDate'), output_field=DurationField())),
+        )
+        .order_by()
+    )
+    for row in single_day:
+        bucket = buckets[row['day'], row['category']]
+        bucket[0] += row['count']
+        bucket[1] += row['duration']
+
+    spanning = events.filter(recurrence__isnull=True).exclude(day=F('lastDay'))
+    intervals = [
+        (category, start, end)
+        for start, end, category in spanning.values_list('startDate', 'endDate', 'category').iterator()
+    ]
+    for event in candidates.filter(recurrence__isnull=False):
+        intervals.extend((event.category_id, start, end) for start, end in expand(event, window_start, window_end))
+
+    for category, start, end in intervals:
+        for day, duration in split_by_day(max(start, window_start), min(end, window_end), tz):
+            bucket = buckets[day, category]
+            bucket[0] += 1
+            bucket[1] += duration
+
+    days = defaultdict(list)
+    for (day, category), (count, duration) in buckets.items():
+        days[day].append({'category': category, 'count': count, 'minutes': duration // datetime.timedelta(minutes=1)})
+    results = []
+    for day in sorted(days):
+        categories = sorted(days[day], key=lambda entry: (entry['category'] is not None, str(entry['category'])))
+        results.append({
+            'date': day,
+            'count': sum(entry['count'] for entry in categories),
+            'minutes': sum(entry['minutes'] for entry in categories),
+            'categories': categories,
+        })
+    return results
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        post_migrate.connect(signals.restore_search_index, sender=self)
+        from calendar_main.database import configure_sqlite
+        connection_created.connect(configure_sqlite, dispatch_uid='configure_sqlite')
+        from calendar_main.timing import install_query_timer
+        connection_created.connect(install_query_timer, dispatch_uid='install_query_timer')
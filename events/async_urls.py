@@ -0,0 +1,16 @@
+from django.urls import path
+from .async_views import (
+    AsyncCategoryDetailView,
+    AsyncCategoryListView,
+    AsyncEventDetailView,
+    AsyncEventFeedView,
+    AsyncEventListView,
+)
+
+urlpatterns = [
+    path('', AsyncEventListView.as_view(), name='async-event-list'),
+    path('feed/', AsyncEventFeedView.as_view(), name='async-event-feed'),
+    path('category/', AsyncCategoryListView.as_view(), name='async-category-list'),
+    path('category/<uuid:pk>/', AsyncCategoryDetailView.as_view(), name='async-category-detail'),
+    path('<uuid:pk>/', AsyncEventDetailView.as_view(), name='async-event-detail'),
+]
@@ -0,0 +1,244 @@
+"""Async counterparts of the EventViewSet and CategoryViewSet CRUD endpoints.
+
+Served under /api/async/events/ with the same request and response bodies
+as the DRF viewsets. Handlers run on the event loop and reach the database
+through Django's async ORM (aget, afirst, asave, adelete, ``async for``).
+Only JSON request bodies are accepted.
+"""
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import parse_etags
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from accounts.authentication import CachedJWTAuthentication
+from .feed import TooManySubscriptions, broker, format_event
+from .filters import filter_window, parse_expand, parse_window
+from .models import Category, Event
+from .pagination import CategoryCursorPagination, EventCursorPagination
+from .renderers import FastJSONRenderer
+from .serializers import CategorySerializer, EventRowSerializer, EventSerializer
+from .versioning import aget_version, calendar_etag
+
+
+class AsyncAPIView(View):
+    """JWT authentication, JSON rendering and DRF-style error bodies for async handlers."""
+    authentication_class = CachedJWTAuthentication
+    renderer_class = FastJSONRenderer
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Token authentication, like DRF's APIView: no session, so no CSRF.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+        handler = getattr(self, method, None) if method in self.http_method_names else None
+        if handler is None:
+            return await self.http_method_not_allowed(request, *args, **kwargs)
+        authenticator = self.authentication_class()
+        try:
+            result = await authenticator.aauthenticate(request)
+            if result is None:
+                response = self.render({'detail': exceptions.NotAuthenticated.default_detail}, status.HTTP_401_UNAUTHORIZED)
+                response['WWW-Authenticate'] = authenticator.authenticate_header(request)
+                return response
+            request.user = result[0]
+            return await handler(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            response = self.render(detail, exc.status_code)
+            if isinstance(exc, exceptions.AuthenticationFailed):
+                response['WWW-Authenticate'] = authenticator.authenticate_header(request)
+            return response
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        renderer = self.renderer_class()
+        return HttpResponse(renderer.render(data), status=status_code, content_type=renderer.media_type)
+
+    def parse_body(self, request):
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError as exc:
+            raise exceptions.ParseError(f'JSON parse error - {exc}')
+        if not isinstance(data, dict):
+            raise exceptions.ParseError('Expected a JSON object.')
+        return data
+
+    async def conditional(self, request, scope):
+        """(etag, 304 response or None) for a list request, as CalendarETagMixin does."""
+        etag = calendar_etag(request, scope, await aget_version(request.user.pk))
+        if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = etag
+            return etag, response
+        return etag, None
+
+
+class AsyncDetailView(AsyncAPIView):
+    """GET, PUT, PATCH and DELETE of one object owned by the requester."""
+    model = None
+    serializer_class = None
+
+    def get_queryset(self, request):
+        return self.model.objects.filter(user=request.user)
+
+    async def get_serializer_context(self, request, data=None):
+        return {'request': request}
+
+    async def get_object(self, request, pk):
+        try:
+            return await self.get_queryset(request).aget(pk=pk)
+        except (self.model.DoesNotExist, DjangoValidationError):
+            raise exceptions.NotFound(f'No {self.model._meta.object_name} matches the given query.')
+
+    async def get(self, request, pk):
+        instance = await self.get_object(request, pk)
+        return self.render(self.serializer_class(instance, context=await self.get_serializer_context(request)).data)
+
+    async def put(self, request, pk):
+        return await self.update(request, pk, partial=False)
+
+    async def patch(self, request, pk):
+        return await self.update(request, pk, partial=True)
+
+    async def update(self, request, pk, partial):
+        instance = await self.get_object(request, pk)
+        data = self.parse_body(request)
+        context = await self.get_serializer_context(request, data)
+        serializer = self.serializer_class(instance, data=data, partial=partial, context=context)
+        serializer.is_valid(raise_exception=True)
+        for attr, value in serializer.validated_data.items():
+            setattr(instance, attr, value)
+        await instance.asave()
+        return self.render(self.serializer_class(instance, context=context).data)
+
+    async def delete(self, request, pk):
+        instance = await self.get_object(request, pk)
+        await instance.adelete()
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+async def event_serializer_context(request, data=None):
+    """Serializer context with the referenced category preloaded, so validation never queries."""
+    categories = {}
+    category = data.get('category') if data else None
+    if category:
+        try:
+            categories = {str(obj.pk): obj async for obj in Category.objects.filter(pk=category, user=request.user)}
+        except DjangoValidationError:
+            pass
+    return {
+        'request': request,
+        'expand': parse_expand(request.GET),
+        'categories': categories,
+        'categories_complete': True,
+    }
+
+
+class AsyncEventListView(AsyncAPIView):
+    pagination_class = EventCursorPagination
+
+    async def get(self, request):
+        start, end = parse_window(request.GET)
+        etag, not_modified = await self.conditional(request, 'event')
+        if not_modified is not None:
+            return not_modified
+        row_serializer = EventRowSerializer(expand=parse_expand(request.GET))
+        queryset = filter_window(Event.objects.filter(user=request.user), start, end).values(*row_serializer.value_fields)
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, Request(request), self)
+        if page is None:
+            response = self.render(row_serializer.serialize([row async for row in queryset]))
+        else:
+            response = self.render(paginator.get_paginated_data(row_serializer.serialize(page)))
+        response['ETag'] = etag
+        return response
+
+    async def post(self, request):
+        data = self.parse_body(request)
+        context = await event_serializer_context(request, data)
+        serializer = EventSerializer(data=data, context=context)
+        serializer.is_valid(raise_exception=True)
+        event = Event(user=request.user, **serializer.validated_data)
+        await event.asave()
+        return self.render(EventSerializer(event, context=context).data, status.HTTP_201_CREATED)
+
+
+class AsyncEventDetailView(AsyncDetailView):
+    model = Event
+    serializer_class = EventSerializer
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if 'category' in parse_expand(request.GET):
+            queryset = queryset.select_related('category')
+        return queryset
+
+    async def get_serializer_context(self, request, data=None):
+        return await event_serializer_context(request, data)
+
+
+class AsyncCategoryListView(AsyncAPIView):
+    pagination_class = CategoryCursorPagination
+
+    async def get(self, request):
+        etag, not_modified = await self.conditional(request, 'category')
+        if not_modified is not None:
+            return not_modified
+        paginator = self.pagination_class()
+        queryset = Category.objects.filter(user=request.user)
+        page = await paginator.apaginate_queryset(queryset, Request(request), self)
+        if page is None:
+            response = self.render(CategorySerializer([category async for category in queryset], many=True).data)
+        else:
+            response = self.render(paginator.get_paginated_data(CategorySerializer(page, many=True).data))
+        response['ETag'] = etag
+        return response
+
+    async def post(self, request):
+        serializer = CategorySerializer(data=self.parse_body(request), context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        category = Category(user=request.user, **serializer.validated_data)
+        await category.asave()
+        return self.render(CategorySerializer(category).data, status.HTTP_201_CREATED)
+
+
+class AsyncCategoryDetailView(AsyncDetailView):
+    model = Category
+    serializer_class = CategorySerializer
+
+
+class AsyncEventFeedView(AsyncAPIView):
+    """Server-Sent Events stream of the requester's event and category changes.
+
+    Each connection is an idle coroutine waiting on its own bounded queue (see
+    events.feed), so it holds no thread and no database connection. A comment
+    line is sent every ``heartbeat`` seconds to keep proxies from closing it.
+    Requires an ASGI server; under WSGI the stream would tie up a worker.
+    """
+    heartbeat = settings.EVENT_FEED_HEARTBEAT_SECONDS
+    retry_ms = 5000
+
+    async def get(self, request):
+        try:
+            subscription = broker.subscribe(request.user.pk)
+        except TooManySubscriptions:
+            return self.render({'detail': 'Too many open feeds for this user.'}, status.HTTP_429_TOO_MANY_REQUESTS)
+        response = StreamingHttpResponse(self.stream(subscription), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def stream(self, subscription):
+        try:
+            yield f"retry: {self.retry_ms}\n\n".encode() + format_event({'type': 'ready'})
+            while True:
+                message = await subscription.get(self.heartbeat)
+                yield b': keepalive\n\n' if message is None else format_event(message)
+        finally:
+            subscription.close()
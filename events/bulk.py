@@ -0,0 +1,112 @@
+import uuid
+from django.db import transaction
+from django.utils import timezone
+from .models import Event
+from .serializers import EventSerializer
+from .versioning import bump_version, get_version
+from .feed import publish_resync
+
+
+def _parse_id(value):
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def _assign(instance, validated_data):
+    for attr, value in validated_data.items():
+        setattr(instance, attr, value)
+    instance.recurrenceEnd = instance.compute_recurrence_end()
+
+
+def apply_bulk(user, payload, context):
+    """Validate and apply a batch of event creates, updates and deletes.
+
+    Every item is validated before anything is written. If any item fails,
+    nothing is written and ``(errors, None)`` is returned, with one error dict
+    per input item (empty for valid items). Otherwise all writes happen in a
+    single transaction using bulk_create / bulk_update / one DELETE, and
+    ``(None, result)`` is returned.
+    """
+    create_items = payload.get('create') or []
+    update_items = payload.get('update') or []
+    delete_items = payload.get('delete') or []
+    context = {
+        **context,
+        'categories': {str(category.pk): category for category in user.categories.all()},
+        'categories_complete': True,
+    }
+
+    errors = {'create': [], 'update': [], 'delete': []}
+    failed = False
+
+    to_create = []
+    for item in create_items:
+        serializer = EventSerializer(data=item, context=context)
+        if serializer.is_valid():
+            event = Event(user=user)
+            _assign(event, serializer.validated_data)
+            to_create.append(event)
+            errors['create'].append({})
+        else:
+            errors['create'].append(serializer.errors)
+            failed = True
+
+    update_ids = [_parse_id(item.get('id')) if isinstance(item, dict) else None for item in update_items]
+    existing = Event.objects.filter(user=user, id__in=[pk for pk in update_ids if pk]).in_bulk()
+    existing = {str(pk): event for pk, event in existing.items()}
+    to_update = []
+    # bulk_update() skips auto_now, so updatedAt is stamped explicitly.
+    update_fields = {'recurrenceEnd', 'updatedAt', 'changeVersion'}
+    now = timezone.now()
+    for item, pk in zip(update_items, update_ids):
+        event = existing.get(pk)
+        if event is None:
+            errors['update'].append({'id': ["Not found."]})
+            failed = True
+            continue
+        serializer = EventSerializer(event, data=item, partial=True, context=context)
+        if serializer.is_valid():
+            _assign(event, serializer.validated_data)
+            event.updatedAt = now
+            update_fields.update(serializer.validated_data)
+            to_update.append(event)
+            errors['update'].append({})
+        else:
+            errors['update'].append(serializer.errors)
+            failed = True
+
+    delete_ids = [_parse_id(value) for value in delete_items]
+    found = set(
+        str(pk) for pk in Event.objects.filter(user=user, id__in=[pk for pk in delete_ids if pk]).values_list('id', flat=True)
+    )
+    for pk in delete_ids:
+        if pk in found:
+            errors['delete'].append({})
+        else:
+            errors['delete'].append({'id': ["Not found."]})
+            failed = True
+
+    if failed:
+        return errors, None
+
+    with transaction.atomic():
+        if found:
+            # Bumps the version; the creates and updates share it.
+            Event.objects.filter(user=user, id__in=found).delete()
+        # bulk_create() and bulk_update() skip Event.save() and send no post_save signals.
+        if to_create or to_update:
+            version = get_version(user.pk) if found else bump_version(user.pk)
+            for event in to_create + to_update:
+                event.changeVersion = version
+            Event.objects.bulk_create(to_create)
+            if to_update:
+                Event.objects.bulk_update(to_update, sorted(update_fields))
+            publish_resync(user.pk)
+
+    return None, {
+        'created': EventSerializer(to_create, many=True, context=context).data,
+        'updated': EventSerializer(to_update, many=True, context=context).data,
+        'deleted': delete_ids,
+    }
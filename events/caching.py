@@ -0,0 +1,108 @@
+import hashlib
+import uuid
+from django.core.cache import caches
+from django.http import HttpResponse
+from .versioning import get_version
+
+CACHE_ALIAS = 'events'
+STATS_KEYS = ('hits', 'misses')
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def _generation_key(user_id):
+    return f"events:generation:{user_id}"
+
+
+def get_generation(user_id):
+    """Random token naming the current set of cached responses for a user.
+
+    Rotated when a user is created, so an account that reuses a primary key
+    (and restarts at calendar version 0) never sees another's responses. A
+    token rather than a counter, so an evicted generation can never come back
+    with an old value and resurrect stale entries.
+    """
+    cache = get_cache()
+    key = _generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_user(user_id):
+    get_cache().set(_generation_key(user_id), uuid.uuid4().hex, None)
+
+
+def record(stat):
+    cache = get_cache()
+    key = f"events:stats:{stat}"
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def get_stats():
+    cache = get_cache()
+    stats = {stat: cache.get(f"events:stats:{stat}", 0) for stat in STATS_KEYS}
+    total = stats['hits'] + stats['misses']
+    stats['hit_ratio'] = stats['hits'] / total if total else 0.0
+    return stats
+
+
+def response_cache_key(request, scope, action, pk=None, version=None):
+    """Key of a cached response: the user's calendar version is part of it,
+    so a write makes every older entry unreachable once it commits."""
+    if version is None:
+        version = get_version(request.user.pk)
+    query = hashlib.sha1(request.META.get('QUERY_STRING', '').encode()).hexdigest()
+    generation = get_generation(request.user.pk)
+    return (
+        f"events:response:{request.user.pk}:{generation}:{version}:{scope}:{action}:{pk}:"
+        f"{request.accepted_renderer.format}:{query}"
+    )
+
+
+class CachedReadMixin:
+    """Read-through cache of rendered list/retrieve responses, per user and query.
+
+    Only successful responses are stored. Entries are keyed on the user's
+    calendar version, read before the response is built (by
+    CalendarETagMixin for lists), so every process sees a write the moment it
+    commits and no reader can file a body under a version it predates.
+    Superseded entries age out through the TTL and the backend's eviction.
+    """
+    cached_actions = ('list', 'retrieve')
+
+    def list(self, request, *args, **kwargs):
+        if 'list' not in self.cached_actions:
+            return super().list(request, *args, **kwargs)
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'retrieve' not in self.cached_actions:
+            return super().retrieve(request, *args, **kwargs)
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, view, request, *args, **kwargs):
+        cache = get_cache()
+        key = response_cache_key(
+            request, self.basename, self.action, kwargs.get(self.lookup_field), getattr(self, 'calendar_version', None),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            record('hits')
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+        record('misses')
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.add_post_render_callback(
+                lambda rendered: cache.set(key, (rendered.content, rendered['Content-Type']))
+            )
+        return response
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import threading
+from django.conf import settings
+from django.db import transaction
+
+# Sent instead of the lost messages once a subscriber's queue overflows:
+# the client should catch up through the sync endpoint.
+RESYNC = {'type': 'resync'}
+
+
+class Subscription:
+    """One connected client: a bounded queue living on the client's event loop."""
+
+    def __init__(self, broker, user_id, maxsize, loop):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def offer(self, message):
+        """Queue ``message`` without ever blocking; runs on ``self.loop``.
+
+        When the queue is full its contents are replaced by a single RESYNC
+        and everything else is dropped until the client has read it.
+        """
+        if self.overflowed:
+            self.broker.record('dropped')
+            return
+        try:
+            self.queue.put_nowait(message)
+            self.broker.record('delivered')
+        except asyncio.QueueFull:
+            self.broker.record('dropped', self.queue.qsize() + 1)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+            self.overflowed = True
+
+    async def get(self, timeout):
+        """Next message, or None when nothing arrived within ``timeout`` seconds."""
+        try:
+            message = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message is RESYNC:
+            self.overflowed = False
+        return message
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class TooManySubscriptions(Exception):
+    pass
+
+
+class ChangeBroker:
+    """In-process fan-out of calendar changes to the feed connections of each user.
+
+    ``publish`` may be called from any thread; delivery is handed to each
+    subscriber's event loop with call_soon_threadsafe, so writers never wait
+    on slow readers. Subscribers only see changes made in the same process.
+    """
+
+    def __init__(self, queue_size, max_per_user):
+        self.queue_size = queue_size
+        self.max_per_user = max_per_user
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+        self._stats = {'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def subscribe(self, user_id):
+        subscription = Subscription(self, user_id, self.queue_size, asyncio.get_running_loop())
+        with self._lock:
+            subscriptions = self._subscriptions.setdefault(user_id, set())
+            if len(subscriptions) >= self.max_per_user:
+                raise TooManySubscriptions()
+            subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id, message):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+            self._stats['published'] += 1
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # The subscriber's loop is closed; its connection is gone.
+                self.unsubscribe(subscription)
+
+    def record(self, name, count=1):
+        with self._lock:
+            self._stats[name] += count
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                'users': len(self._subscriptions),
+                'subscriptions': sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+            }
+
+
+broker = ChangeBroker(settings.EVENT_FEED_QUEUE_SIZE, settings.EVENT_FEED_MAX_CONNECTIONS_PER_USER)
+
+
+def publish_change(user_id, model, object_id, action):
+    """Notify the user's feed connections once the current transaction commits."""
+    message = {'type': 'change', 'model': model, 'id': str(object_id), 'action': action}
+    transaction.on_commit(lambda: broker.publish(user_id, message))
+
+
+def publish_resync(user_id):
+    """Ask the user's clients to resync, for bulk writes that send no per-row signals."""
+    transaction.on_commit(lambda: broker.publish(user_id, RESYNC))
+
+
+def format_event(message):
+    """Encode a message as one Server-Sent Events frame."""
+    return f"event: {message['type']}\ndata: {json.dumps(message)}\n\n".encode()
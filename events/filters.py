@@ -0,0 +1,122 @@
+import datetime
+import uuid
+import zoneinfo
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def parse_query_datetime(value, name):
+    """Parse an ISO 8601 datetime (or plain date) from a query parameter."""
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is not None:
+                parsed = datetime.datetime.combine(day, datetime.time.min)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: "Invalid datetime. Use ISO 8601 format."})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_window(query_params, required=False):
+    """Return the (start, end) window requested through ?start=&end=."""
+    start = query_params.get('start')
+    end = query_params.get('end')
+    if required:
+        missing = {name: "This parameter is required." for name, value in (('start', start), ('end', end)) if not value}
+        if missing:
+            raise ValidationError(missing)
+    start = parse_query_datetime(start, 'start') if start else None
+    end = parse_query_datetime(end, 'end') if end else None
+    if start and end and start > end:
+        raise ValidationError("The start date cannot be greater than the end date.")
+    return start, end
+
+
+def parse_day_range(query_params):
+    """Return the inclusive (first, last) local days requested through ?start=&end=."""
+    days = {}
+    for name in ('start', 'end'):
+        value = query_params.get(name)
+        if not value:
+            raise ValidationError({name: "This parameter is required."})
+        try:
+            days[name] = parse_date(value)
+        except ValueError:
+            days[name] = None
+        if days[name] is None:
+            raise ValidationError({name: "Invalid date. Use YYYY-MM-DD format."})
+    if days['start'] > days['end']:
+        raise ValidationError("The start date cannot be greater than the end date.")
+    return days['start'], days['end']
+
+
+def parse_timezone(query_params):
+    """Return the zone named by ?tz=, defaulting to the current time zone."""
+    name = query_params.get('tz')
+    if not name:
+        return timezone.get_current_timezone()
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        raise ValidationError({'tz': f"Unknown time zone: {name}."})
+
+
+def parse_uuid(query_params, name):
+    """Return the UUID passed as ?<name>=, or None when absent."""
+    value = query_params.get(name)
+    if not value:
+        return None
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValidationError({name: "Must be a valid UUID."})
+
+
+def parse_limit(query_params, default, maximum):
+    """Return ?limit= as an int in [1, maximum]."""
+    value = query_params.get('limit')
+    if not value:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= maximum:
+        raise ValidationError({'limit': f"Must be an integer between 1 and {maximum}."})
+    return limit
+
+
+def filter_window(queryset, start=None, end=None):
+    """Keep only the events (or recurring series) overlapping [start, end).
+
+    The filter is expressed on (startDate, endDate) so it can be served by the
+    (user, startDate, endDate) index. A series matches while its last
+    occurrence (recurrenceEnd) has not ended before the window.
+    """
+    if end is not None:
+        queryset = queryset.filter(startDate__lt=end)
+    if start is not None:
+        queryset = queryset.filter(
+            Q(endDate__gt=start)
+            | Q(recurrence__isnull=False) & (Q(recurrenceEnd__isnull=True) | Q(recurrenceEnd__gt=start))
+        )
+    return queryset
+
+
+EXPANDABLE_FIELDS = frozenset(['category'])
+
+
+def parse_expand(query_params):
+    """Return the related fields requested through ?expand=category[,...]."""
+    requested = frozenset(name.strip() for name in query_params.get('expand', '').split(',') if name.strip())
+    unknown = requested - EXPANDABLE_FIELDS
+    if unknown:
+        raise ValidationError({'expand': f"Cannot expand: {', '.join(sorted(unknown))}."})
+    return requested
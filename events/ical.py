@@ -0,0 +1,295 @@
+import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+PRODID = '-//calendar-backend//Events//EN'
+EXPORT_FIELDS = (
+    'id', 'title', 'description', 'startDate', 'endDate', 'updatedAt', 'category__name',
+    'recurrence', 'recurrenceInterval', 'recurrenceCount', 'recurrenceUntil', 'recurrenceExceptions',
+    'recurrenceTimezone',
+)
+
+
+def escape_text(value):
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold(line):
+    """Fold a content line at 75 octets as required by RFC 5545, section 3.1."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte UTF-8 sequence.
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = 74
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def format_datetime(value):
+    return value.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def format_local_datetime(value, zone):
+    return value.astimezone(ZoneInfo(zone)).strftime('%Y%m%dT%H%M%S')
+
+
+def vevent_lines(row):
+    """Content lines for one event, from a values() row with EXPORT_FIELDS."""
+    zone = row['recurrenceTimezone'] if row['recurrence'] else None
+    if zone:
+        # The series repeats on this zone's wall clock, which a UTC DTSTART would lose.
+        start = f"DTSTART;TZID={zone}:{format_local_datetime(row['startDate'], zone)}"
+        end = f"DTEND;TZID={zone}:{format_local_datetime(row['endDate'], zone)}"
+    else:
+        start = f"DTSTART:{format_datetime(row['startDate'])}"
+        end = f"DTEND:{format_datetime(row['endDate'])}"
+    lines = [
+        'BEGIN:VEVENT',
+        f"UID:{row['id']}",
+        f"DTSTAMP:{format_datetime(row['updatedAt'])}",
+        start,
+        end,
+        f"SUMMARY:{escape_text(row['title'])}",
+    ]
+    if row['description']:
+        lines.append(f"DESCRIPTION:{escape_text(row['description'])}")
+    if row['category__name']:
+        lines.append(f"CATEGORIES:{escape_text(row['category__name'])}")
+    if row['recurrence']:
+        rule = f"FREQ={row['recurrence'].upper()};INTERVAL={row['recurrenceInterval']}"
+        if row['recurrenceCount']:
+            rule += f";COUNT={row['recurrenceCount']}"
+        elif row['recurrenceUntil']:
+            rule += f";UNTIL={format_datetime(row['recurrenceUntil'])}"
+        lines.append(f"RRULE:{rule}")
+        for exception in row['recurrenceExceptions'] or ():
+            lines.append(f"EXDATE:{format_datetime(datetime.datetime.fromisoformat(exception))}")
+    lines.append('END:VEVENT')
+    return lines
+
+
+def calendar_header(name=None):
+    header = ['BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{PRODID}', 'CALSCALE:GREGORIAN']
+    if name:
+        header.append(f"X-WR-CALNAME:{escape_text(name)}")
+    return ''.join(fold(line) for line in header)
+
+
+def iter_calendar(rows, name=None):
+    """Yield the calendar as text chunks, one per event, without buffering the feed."""
+    yield calendar_header(name)
+    for row in rows:
+        yield ''.join(fold(line) for line in vevent_lines(row))
+    yield fold('END:VCALENDAR')
+
+
+async def aiter_calendar(rows, name=None):
+    """iter_calendar() over an async iterable of rows, for responses served under ASGI."""
+    yield calendar_header(name)
+    async for row in rows:
+        yield ''.join(fold(line) for line in vevent_lines(row))
+    yield fold('END:VCALENDAR')
+
+
+class ICalendarError(ValueError):
+    pass
+
+
+WEEKDAYS = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+SUPPORTED_FREQUENCIES = {'DAILY': 'daily', 'WEEKLY': 'weekly', 'MONTHLY': 'monthly'}
+
+
+def unescape_text(value):
+    result = []
+    chars = iter(value)
+    for char in chars:
+        if char == '\\':
+            following = next(chars, '')
+            result.append('\n' if following in ('n', 'N') else following)
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def unfold(lines):
+    """Join folded content lines. ``lines`` may be str or bytes and is consumed lazily."""
+    current = None
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def split_property(line):
+    """'DTSTART;TZID=Europe/Madrid:20250617T100000' -> ('DTSTART', {'TZID': ...}, '20250617T100000')."""
+    head, separator, value = line.partition(':')
+    if not separator:
+        raise ICalendarError(f"Malformed content line: {line[:40]}")
+    name, *params = head.split(';')
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition('=')
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def parse_datetime_value(value, parameters, default_timezone):
+    """Parse DATE / DATE-TIME values (UTC, TZID-qualified or floating)."""
+    try:
+        if parameters.get('VALUE') == 'DATE' or len(value) == 8:
+            moment = datetime.datetime.strptime(value[:8], '%Y%m%d')
+        elif value.endswith('Z'):
+            return datetime.datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=datetime.timezone.utc)
+        else:
+            moment = datetime.datetime.strptime(value, '%Y%m%dT%H%M%S')
+    except ValueError:
+        raise ICalendarError(f"Invalid date value: {value}")
+    zone = default_timezone
+    if 'TZID' in parameters:
+        try:
+            zone = ZoneInfo(parameters['TZID'])
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return moment.replace(tzinfo=zone)
+
+
+def parse_duration(value):
+    """Parse an RFC 5545 duration such as P1D, PT1H30M or P2W."""
+    sign = -1 if value.startswith('-') else 1
+    value = value.lstrip('+-')
+    if not value.startswith('P'):
+        raise ICalendarError(f"Invalid duration: {value}")
+    units = {'W': 'weeks', 'D': 'days', 'H': 'hours', 'M': 'minutes', 'S': 'seconds'}
+    kwargs = {}
+    number = ''
+    for char in value[1:]:
+        if char.isdigit():
+            number += char
+        elif char == 'T':
+            continue
+        elif char in units and number:
+            kwargs[units[char]] = int(number)
+            number = ''
+        else:
+            raise ICalendarError(f"Invalid duration: {value}")
+    return sign * datetime.timedelta(**kwargs)
+
+
+def parse_positive_integer(value, name):
+    if not (value.isascii() and value.isdigit()) or int(value) < 1:
+        raise ICalendarError(f"Invalid {name}: {value}")
+    return int(value)
+
+
+def parse_rrule(value, dtstart, default_timezone):
+    parts = dict(part.split('=', 1) for part in value.split(';') if '=' in part)
+    frequency = SUPPORTED_FREQUENCIES.get(parts.pop('FREQ', None))
+    if frequency is None:
+        raise ICalendarError(f"Unsupported recurrence: {value}")
+    rule = {'recurrence': frequency, 'recurrenceInterval': parse_positive_integer(parts.pop('INTERVAL', '1'), 'INTERVAL')}
+    if 'COUNT' in parts:
+        rule['recurrenceCount'] = parse_positive_integer(parts.pop('COUNT'), 'COUNT')
+    if 'UNTIL' in parts:
+        rule['recurrenceUntil'] = parse_datetime_value(parts.pop('UNTIL'), {}, default_timezone)
+    parts.pop('WKST', None)
+    # A single BYDAY/BYMONTHDAY matching DTSTART is redundant and can be dropped.
+    if frequency == 'weekly' and parts.get('BYDAY') == WEEKDAYS[dtstart.weekday()]:
+        parts.pop('BYDAY')
+    if frequency == 'monthly' and parts.get('BYMONTHDAY') == str(dtstart.day):
+        parts.pop('BYMONTHDAY')
+    if parts:
+        raise ICalendarError(f"Unsupported recurrence parts: {', '.join(sorted(parts))}")
+    return rule
+
+
+def iter_vevents(lines):
+    """Lazily yield the raw properties of each VEVENT as lists of (name, params, value)."""
+    properties = None
+    depth = 0
+    for line in unfold(lines):
+        if not line:
+            continue
+        upper = line.upper()
+        if upper == 'BEGIN:VEVENT':
+            properties = []
+            depth = 0
+        elif upper == 'END:VEVENT':
+            if properties is not None:
+                yield properties
+            properties = None
+        elif properties is not None:
+            # Skip nested components such as VALARM.
+            if upper.startswith('BEGIN:'):
+                depth += 1
+            elif upper.startswith('END:'):
+                depth -= 1
+            elif depth == 0:
+                properties.append(line)
+
+
+def parse_vevent(lines, default_timezone):
+    """Map VEVENT content lines onto Event field values plus a category name."""
+    values = {}
+    exceptions = []
+    exdate_parameters = {}
+    for line in lines:
+        name, parameters, value = split_property(line)
+        if name == 'EXDATE':
+            exceptions.extend(value.split(','))
+            exdate_parameters = parameters
+        elif name not in values:
+            values[name] = (parameters, value)
+
+    if 'DTSTART' not in values:
+        raise ICalendarError("Missing DTSTART")
+    start = parse_datetime_value(values['DTSTART'][1], values['DTSTART'][0], default_timezone)
+    all_day = values['DTSTART'][0].get('VALUE') == 'DATE' or len(values['DTSTART'][1]) == 8
+    if 'DTEND' in values:
+        end = parse_datetime_value(values['DTEND'][1], values['DTEND'][0], default_timezone)
+    elif 'DURATION' in values:
+        end = start + parse_duration(values['DURATION'][1])
+    else:
+        end = start + datetime.timedelta(days=1) if all_day else start
+    if start > end:
+        raise ICalendarError("The start date cannot be greater than the end date.")
+
+    title = unescape_text(values.get('SUMMARY', ({}, ''))[1]) or 'Untitled'
+    fields = {
+        'title': title[:255],
+        'description': unescape_text(values['DESCRIPTION'][1]) if 'DESCRIPTION' in values else None,
+        'startDate': start,
+        'endDate': end,
+    }
+    if 'RRULE' in values:
+        fields.update(parse_rrule(values['RRULE'][1], start, default_timezone))
+        # Repeat on the wall clock of DTSTART's zone (TZID or the floating default).
+        fields['recurrenceTimezone'] = getattr(start.tzinfo, 'key', None)
+        fields['recurrenceExceptions'] = sorted(
+            parse_datetime_value(value, exdate_parameters, default_timezone).astimezone(datetime.timezone.utc).isoformat()
+            for value in exceptions
+        )
+    category = None
+    if 'CATEGORIES' in values:
+        category = unescape_text(values['CATEGORIES'][1].split(',')[0]).strip()[:100] or None
+    uid = values.get('UID', ({}, None))[1]
+    return uid, fields, category
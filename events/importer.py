@@ -0,0 +1,77 @@
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from .feed import publish_resync
+from .ical import ICalendarError, iter_vevents, parse_vevent
+from .models import Category, Event
+from .versioning import bump_version
+
+
+def import_calendar(user, lines, batch_size=500, progress=None):
+    """Import the VEVENTs read lazily from ``lines`` into ``user``'s calendar.
+
+    Events are inserted with bulk_create in batches of ``batch_size``, each
+    batch in its own transaction, so a failure only loses the current batch
+    (its events are reported in ``errors``) and memory stays bounded. Categories are matched by name and created on
+    first use. ``progress`` is called with the running totals after every
+    batch. Returns ``{'imported': n, 'errors': [{'index', 'uid', 'error'}]}``.
+    """
+    categories = {category.name: category for category in Category.objects.filter(user=user)}
+    default_timezone = timezone.get_current_timezone()
+    imported = 0
+    errors = []
+    batch = []
+    # (index, uid) of each event in ``batch``, to report a failed batch.
+    positions = []
+
+    def flush():
+        nonlocal imported
+        if not batch:
+            return
+        created = []
+        try:
+            with transaction.atomic():
+                for event in batch:
+                    if event.category is not None and event.category._state.adding:
+                        event.category.save()
+                        created.append(event.category)
+                # bulk_create() skips Event.save(), which stamps the version.
+                version = bump_version(user.pk)
+                for event in batch:
+                    event.changeVersion = version
+                Event.objects.bulk_create(batch)
+        except DatabaseError as error:
+            # Rolled back, so later batches must insert these categories again.
+            for category in created:
+                category._state.adding = True
+            errors.extend({'index': index, 'uid': uid, 'error': f"Not saved: {error}"} for index, uid in positions)
+        else:
+            imported += len(batch)
+        batch.clear()
+        positions.clear()
+        if progress is not None:
+            progress({'imported': imported, 'errors': len(errors)})
+
+    for index, lines_of_event in enumerate(iter_vevents(lines)):
+        uid = None
+        try:
+            uid, fields, category_name = parse_vevent(lines_of_event, default_timezone)
+            event = Event(user=user, **fields)
+            event.recurrenceEnd = event.compute_recurrence_end()
+        except (ICalendarError, ValueError, OverflowError) as error:
+            errors.append({'index': index, 'uid': uid, 'error': str(error)})
+            continue
+        if category_name:
+            event.category = categories.get(category_name)
+            if event.category is None:
+                event.category = categories[category_name] = Category(name=category_name, user=user)
+        batch.append(event)
+        positions.append((index, uid))
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    if imported:
+        # bulk_create() sends no post_save signals.
+        publish_resync(user.pk)
+    errors.sort(key=lambda error: error['index'])
+    return {'imported': imported, 'errors': errors}
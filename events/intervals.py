@@ -0,0 +1,27 @@
+def merge_intervals(intervals):
+    """Merge (start, end) pairs sorted by start into disjoint busy intervals.
+
+    Single sweep over the input: it is consumed lazily and only the interval
+    currently being extended is kept in memory. Touching intervals are merged.
+    """
+    current_start = current_end = None
+    for start, end in intervals:
+        if current_start is None:
+            current_start, current_end = start, end
+        elif start <= current_end:
+            if end > current_end:
+                current_end = end
+        else:
+            yield current_start, current_end
+            current_start, current_end = start, end
+    if current_start is not None:
+        yield current_start, current_end
+
+
+def clip_intervals(intervals, start, end):
+    """Clip (start, end) pairs to the [start, end) window, dropping empty ones."""
+    for interval_start, interval_end in intervals:
+        interval_start = max(interval_start, start)
+        interval_end = min(interval_end, end)
+        if interval_start < interval_end:
+            yield interval_start, interval_end
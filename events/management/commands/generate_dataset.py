@@ -0,0 +1,68 @@
+import argparse
+import datetime
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from events.synthetic import CATEGORY_NAMES, START, generate
+
+
+def parse_start(value):
+    try:
+        day = datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a YYYY-MM-DD date, got {value!r}")
+    return datetime.datetime.combine(day, datetime.time(), tzinfo=datetime.timezone.utc)
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic users, categories and events for benchmarking."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--events', type=int, default=100000, help="Total events, spread unevenly over the users.")
+        parser.add_argument('--max-categories', type=int, default=8, help="Upper bound of categories per user.")
+        parser.add_argument('--start', type=parse_start, default=START,
+                            help=f"First day (UTC) events fall on; default {START:%Y-%m-%d}.")
+        parser.add_argument('--days', type=int, default=730, help="Span of days, from --start, events fall in.")
+        parser.add_argument('--multi-day-ratio', type=float, default=0.05)
+        parser.add_argument('--recurring-ratio', type=float, default=0.03)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--password', default='password', help="Password of every generated user.")
+        parser.add_argument('--email-prefix', default='synthetic', help="Users are named <prefix><n>@example.com.")
+
+    def handle(self, *args, **options):
+        if not 0 <= options['max_categories'] <= len(CATEGORY_NAMES):
+            raise CommandError(f"--max-categories must be between 0 and {len(CATEGORY_NAMES)}.")
+        if options['users'] < 1 or options['events'] < 0 or options['batch_size'] < 1:
+            raise CommandError("--users and --batch-size must be positive and --events not negative.")
+        if get_user_model().objects.filter(email__startswith=options['email_prefix']).exists():
+            raise CommandError(f"Users named {options['email_prefix']}* already exist; pick another --email-prefix.")
+
+        started = time.perf_counter()
+
+        def progress(totals):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{totals['users']} users, {totals['categories']} categories, {totals['events']} events "
+                f"({totals['events'] / elapsed:.0f} events/s)"
+            )
+
+        totals = generate(
+            options['users'],
+            options['events'],
+            max_categories=options['max_categories'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            password=options['password'],
+            email_prefix=options['email_prefix'],
+            start=options['start'],
+            days=options['days'],
+            multi_day_ratio=options['multi_day_ratio'],
+            recurring_ratio=options['recurring_ratio'],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {totals['users']} users, {totals['categories']} categories and {totals['events']} events "
+            f"in {time.perf_counter() - started:.1f}s."
+        ))
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from events.importer import import_calendar
+
+
+class Command(BaseCommand):
+    help = "Import an iCalendar (.ics) file into a user's calendar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', required=True, help="Email of the calendar owner.")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(email=options['user'])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"User {options['user']} does not exist.")
+
+        def progress(totals):
+            self.stdout.write(f"Imported {totals['imported']} events ({totals['errors']} errors)")
+
+        with open(options['path'], 'rb') as stream:
+            result = import_calendar(user, stream, batch_size=options['batch_size'], progress=progress)
+
+        for error in result['errors']:
+            self.stderr.write(f"Event #{error['index']} ({error['uid'] or 'no UID'}): {error['error']}")
+        self.stdout.write(self.style.SUCCESS(f"Imported {result['imported']} events, {len(result['errors'])} errors."))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 20:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_category_color'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'startDate', 'endDate'], name='event_user_window_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 20:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_user_window_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'name'], name='category_user_name_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-18 20:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_category_user_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='recurrence',
+            field=models.CharField(blank=True, choices=[('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly')], max_length=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceCount',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceEnd',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceExceptions',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceInterval',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceUntil',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 20:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('events', '0007_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='calendar_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
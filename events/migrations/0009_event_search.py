@@ -0,0 +1,54 @@
+from django.db import migrations
+
+FTS_TABLE = 'events_event_fts'
+
+SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='events_event', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def fts_supported(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any(option == 'ENABLE_FTS5' for option, in cursor.fetchall())
+
+
+def install_search_index(apps, schema_editor):
+    if fts_supported(schema_editor.connection):
+        for statement in SCHEMA:
+            schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_calendarversion'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, drop_search_index),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 20:47
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_event_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarShare',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shares', to=settings.AUTH_USER_MODEL)),
+                ('sharedWith', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sharedCalendars', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['sharedWith', 'owner'], name='calendarshare_shared_idx')],
+                'constraints': [models.UniqueConstraint(fields=('owner', 'sharedWith'), name='calendarshare_unique')],
+            },
+        ),
+    ]
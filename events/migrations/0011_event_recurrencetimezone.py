@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_calendarshare'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='recurrenceTimezone',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_event_recurrencetimezone'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='category',
+            name='category_user_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='event_user_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tombstone',
+            name='tombstone_user_deleted_idx',
+        ),
+        migrations.AddField(
+            model_name='calendarversion',
+            name='prunedVersion',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='changeVersion',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='changeVersion',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='changeVersion',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'changeVersion'], name='category_user_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'changeVersion'], name='event_user_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['user', 'changeVersion'], name='tombstone_user_change_idx'),
+        ),
+    ]
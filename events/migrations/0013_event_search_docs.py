@@ -0,0 +1,97 @@
+from django.db import migrations
+
+FTS_TABLE = 'events_event_fts'
+DOCS_TABLE = 'events_event_fts_docs'
+
+# 0009 keyed the index on events_event's implicit rowid, which VACUUM may
+# renumber. Each event id now gets a stable docid in DOCS_TABLE instead.
+SCHEMA = [
+    f"""CREATE TABLE IF NOT EXISTS {DOCS_TABLE} (
+        docid integer NOT NULL PRIMARY KEY,
+        event_id char(32) NOT NULL UNIQUE
+    )""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON events_event BEGIN
+        INSERT INTO {DOCS_TABLE}(event_id) VALUES (new.id);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+            SELECT docid, new.title, new.description FROM {DOCS_TABLE} WHERE event_id = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            SELECT 'delete', docid, old.title, old.description FROM {DOCS_TABLE} WHERE event_id = old.id;
+        DELETE FROM {DOCS_TABLE} WHERE event_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            SELECT 'delete', docid, old.title, old.description FROM {DOCS_TABLE} WHERE event_id = old.id;
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+            SELECT docid, new.title, new.description FROM {DOCS_TABLE} WHERE event_id = new.id;
+    END""",
+    f"INSERT INTO {DOCS_TABLE}(event_id) SELECT id FROM events_event",
+    f"""INSERT INTO {FTS_TABLE}(rowid, title, description)
+        SELECT docs.docid, event.title, event.description
+        FROM {DOCS_TABLE} AS docs INNER JOIN events_event AS event ON event.id = docs.event_id""",
+]
+
+ROWID_SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='events_event', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def fts_supported(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any(option == 'ENABLE_FTS5' for option, in cursor.fetchall())
+
+
+def drop_search_index(schema_editor):
+    for suffix in ('ai', 'ad', 'au'):
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}')
+    schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    schema_editor.execute(f'DROP TABLE IF EXISTS {DOCS_TABLE}')
+
+
+def key_search_index_on_event_id(apps, schema_editor):
+    if fts_supported(schema_editor.connection):
+        drop_search_index(schema_editor)
+        for statement in SCHEMA:
+            schema_editor.execute(statement)
+
+
+def key_search_index_on_rowid(apps, schema_editor):
+    if fts_supported(schema_editor.connection):
+        drop_search_index(schema_editor)
+        for statement in ROWID_SCHEMA:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0012_sync_versions'),
+    ]
+
+    operations = [
+        migrations.RunPython(key_search_index_on_event_id, key_search_index_on_rowid),
+    ]
@@ -1,8 +1,80 @@
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import F
+from django.dispatch import Signal
 import uuid
 from django.conf import settings
+from .recurrence import FREQUENCY_CHOICES, series_end, series_timezone
 
-class Category(models.Model):
+
+# Sent once per delete call, inside its transaction, with the model as sender
+# and the deleted ``rows`` as (user_id, pk) pairs. Used instead of
+# post_delete, whose per-row receivers would stop Django from deleting in a
+# single statement.
+rows_deleted = Signal()
+
+
+def record_deletions(model, rows):
+    """Write tombstones for ``rows`` ((user_id, pk) pairs) in one INSERT and bump each owner's version once.
+
+    Call it before deleting the rows, in the same transaction: deleting
+    categories sets their events' category to NULL with a bare UPDATE, so
+    those events are stamped with the owner's new version here, while they
+    can still be found.
+    """
+    rows = list(rows)
+    versions = {user_id: CalendarVersion.bump(user_id) for user_id in {user_id for user_id, _ in rows}}
+    if model is Category and rows:
+        orphaned = Event.objects.filter(category__in=[pk for _, pk in rows])
+        for user_id in orphaned.values_list('user_id', flat=True).distinct().order_by():
+            if user_id not in versions:
+                versions[user_id] = CalendarVersion.bump(user_id)
+            orphaned.filter(user_id=user_id).update(changeVersion=versions[user_id])
+    Tombstone.objects.bulk_create(
+        Tombstone(user_id=user_id, model=model._meta.model_name, objectId=pk, changeVersion=versions[user_id])
+        for user_id, pk in rows
+    )
+    rows_deleted.send(sender=model, rows=rows)
+
+
+class CalendarQuerySet(models.QuerySet):
+    def delete(self):
+        """Delete the rows, recording the whole call as one change per owner (see record_deletions)."""
+        with transaction.atomic(using=router.db_for_write(self.model)):
+            record_deletions(self.model, self.values_list('user_id', 'pk'))
+            return super().delete()
+
+
+class CalendarModel(models.Model):
+    """Base of the models whose writes change a user's CalendarVersion.
+
+    Every save bumps the version and stamps the row with it as changeVersion,
+    in one transaction (see CalendarVersion.bump). Deletes leave a Tombstone
+    per row for sync clients and bump the version once per call. A user
+    deletion cascades past these methods and records nothing.
+    """
+    # CalendarVersion.version of the write that last changed the row; drives sync.
+    changeVersion = models.PositiveBigIntegerField(default=0, editable=False)
+
+    objects = CalendarQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'changeVersion'}
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            self.changeVersion = CalendarVersion.bump(self.user_id)
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            record_deletions(type(self), [(self.user_id, self.pk)])
+            return super().delete(*args, **kwargs)
+
+
+class Category(CalendarModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=100)
     color = models.CharField(max_length=7, default="#000000")  # Hex color
@@ -11,11 +83,18 @@ class Category(models.Model):
         on_delete=models.CASCADE,
         related_name="categories"
     )
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name'], name='category_user_name_idx'),
+            models.Index(fields=['user', 'changeVersion'], name='category_user_change_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
-class Event(models.Model):
+class Event(CalendarModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
@@ -34,6 +113,131 @@ class Event(models.Model):
         related_name="events"
     )
     createdAt = models.DateTimeField(auto_now_add=True)
+    updatedAt = models.DateTimeField(auto_now=True)
+    recurrence = models.CharField(max_length=7, choices=FREQUENCY_CHOICES, blank=True, null=True)
+    recurrenceInterval = models.PositiveIntegerField(default=1)
+    recurrenceCount = models.PositiveIntegerField(blank=True, null=True)
+    recurrenceUntil = models.DateTimeField(blank=True, null=True)
+    recurrenceExceptions = models.JSONField(default=list, blank=True)
+    # IANA zone whose wall clock the series follows across DST; UTC when empty.
+    recurrenceTimezone = models.CharField(max_length=64, blank=True, null=True)
+    # End of the last occurrence; null for series without count/until.
+    recurrenceEnd = models.DateTimeField(blank=True, null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'startDate', 'endDate'], name='event_user_window_idx'),
+            models.Index(fields=['user', 'changeVersion'], name='event_user_change_idx'),
+        ]
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        self.recurrenceEnd = self.compute_recurrence_end()
+        super().save(*args, **kwargs)
+
+    def compute_recurrence_end(self):
+        if not self.recurrence:
+            return None
+        return series_end(
+            self.startDate,
+            self.endDate,
+            self.recurrence,
+            self.recurrenceInterval,
+            self.recurrenceCount,
+            self.recurrenceUntil,
+            series_timezone(self.recurrenceTimezone),
+        )
+
+
+class Tombstone(models.Model):
+    """Records a deleted Event or Category so sync clients can drop it."""
+    EVENT = 'event'
+    CATEGORY = 'category'
+    MODEL_CHOICES = [
+        (EVENT, 'Event'),
+        (CATEGORY, 'Category'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="tombstones"
+    )
+    model = models.CharField(max_length=8, choices=MODEL_CHOICES)
+    objectId = models.UUIDField()
+    deletedAt = models.DateTimeField(auto_now_add=True)
+    changeVersion = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'changeVersion'], name='tombstone_user_change_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.objectId}"
+
+
+class CalendarVersion(models.Model):
+    """Per-user counter bumped on every Event/Category write.
+
+    Used as the list ETag and as the change sequence sync tokens carry.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="calendar_version"
+    )
+    version = models.PositiveBigIntegerField(default=0)
+    # Highest changeVersion among pruned tombstones; older sync tokens are expired.
+    prunedVersion = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}@{self.version}"
+
+    @classmethod
+    def bump(cls, user_id):
+        """Increment the user's version and return the new value.
+
+        Call it inside the transaction of the write it stamps. The UPDATE
+        holds the row (on SQLite, the database) locked until commit, so a
+        user's versions commit in increasing order: once version N is
+        visible, so is every write stamped below N.
+        """
+        if not cls.objects.filter(user_id=user_id).update(version=F('version') + 1):
+            try:
+                with transaction.atomic():
+                    cls.objects.create(user_id=user_id, version=1)
+                return 1
+            except IntegrityError:
+                cls.objects.filter(user_id=user_id).update(version=F('version') + 1)
+        return cls.objects.filter(user_id=user_id).values_list('version', flat=True).get()
+
+
+class CalendarShare(models.Model):
+    """Lets ``sharedWith`` see the busy times of ``owner`` when scheduling meetings."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="shares"
+    )
+    sharedWith = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="sharedCalendars"
+    )
+    createdAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['owner', 'sharedWith'], name='calendarshare_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['sharedWith', 'owner'], name='calendarshare_shared_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_id} -> {self.sharedWith_id}"
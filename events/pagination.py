@@ -0,0 +1,37 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(CursorPagination):
+    """Opaque cursor pagination; page size defaults to settings.API_PAGE_SIZE.
+
+    Async views paginate with ``apaginate_queryset``.
+    """
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # Django's async ORM runs queries through sync_to_async as well, so
+        # this costs async views nothing over a native async fetch.
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+
+class EventCursorPagination(KeysetPagination):
+    ordering = ('startDate', 'id')
+
+
+class CategoryCursorPagination(KeysetPagination):
+    ordering = ('name', 'id')
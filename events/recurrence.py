@@ -0,0 +1,133 @@
+import calendar
+import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from django.utils.dateparse import parse_datetime
+
+DAILY = 'daily'
+WEEKLY = 'weekly'
+MONTHLY = 'monthly'
+
+FREQUENCY_CHOICES = [
+    (DAILY, 'Daily'),
+    (WEEKLY, 'Weekly'),
+    (MONTHLY, 'Monthly'),
+]
+
+# Number of (series, window) expansions kept in memory per process.
+EXPANSION_CACHE_SIZE = 1024
+
+_STEPS = {
+    DAILY: datetime.timedelta(days=1),
+    WEEKLY: datetime.timedelta(weeks=1),
+}
+
+
+def add_months(value, months):
+    """Shift a datetime by whole months, clamping the day to the end of the month."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def series_timezone(name):
+    """The zone a series repeats in, from Event.recurrenceTimezone; UTC when unset."""
+    return ZoneInfo(name) if name else datetime.timezone.utc
+
+
+def nth_start(dtstart, frequency, interval, n, tz=datetime.timezone.utc):
+    """Start of the n-th (0-based) occurrence of a series.
+
+    Steps are taken on the wall clock of ``tz``, so a 09:00 series stays at
+    09:00 local time across DST changes. The result is in UTC.
+    """
+    local = dtstart.astimezone(tz)
+    if frequency == MONTHLY:
+        start = add_months(local, interval * n)
+    else:
+        start = local + _STEPS[frequency] * interval * n
+    return start.astimezone(datetime.timezone.utc)
+
+
+def _index_at_or_before(dtstart, frequency, interval, moment, tz=datetime.timezone.utc):
+    """Largest n whose occurrence starts at or before ``moment`` (may be negative)."""
+    local, moment_local = dtstart.astimezone(tz), moment.astimezone(tz)
+    if frequency == MONTHLY:
+        months = (moment_local.year - local.year) * 12 + moment_local.month - local.month
+        n = months // interval
+    else:
+        elapsed = moment_local.replace(tzinfo=None) - local.replace(tzinfo=None)
+        n = elapsed // (_STEPS[frequency] * interval)
+    # The wall-clock estimate can be one off around a UTC offset change.
+    if nth_start(dtstart, frequency, interval, n, tz) > moment:
+        n -= 1
+    elif nth_start(dtstart, frequency, interval, n + 1, tz) <= moment:
+        n += 1
+    return n
+
+
+def series_end(dtstart, dtend, frequency, interval, count=None, until=None, tz=datetime.timezone.utc):
+    """End of the last occurrence of a series, or None when it repeats forever."""
+    if count is not None:
+        last = count - 1
+    elif until is not None:
+        last = _index_at_or_before(dtstart, frequency, interval, until, tz)
+    else:
+        return None
+    return nth_start(dtstart, frequency, interval, max(last, 0), tz) + (dtend - dtstart)
+
+
+def iter_occurrences(dtstart, dtend, frequency, interval, count, until, exceptions, tz, window_start, window_end):
+    """Lazily yield the (start, end) occurrences overlapping [window_start, window_end).
+
+    Expansion jumps straight to the first occurrence that can reach the window,
+    so the cost is proportional to the occurrences inside it.
+    """
+    duration = dtend - dtstart
+    n = max(_index_at_or_before(dtstart, frequency, interval, window_start - duration, tz), 0)
+    while count is None or n < count:
+        start = nth_start(dtstart, frequency, interval, n, tz)
+        n += 1
+        if start >= window_end or (until is not None and start > until):
+            return
+        end = start + duration
+        if end > window_start and start not in exceptions:
+            yield start, end
+
+
+def parse_exceptions(values):
+    return frozenset(parse_datetime(value) for value in values or ())
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _expand(series, window_start, window_end):
+    return tuple(iter_occurrences(*series, window_start, window_end))
+
+
+def expand(event, window_start, window_end):
+    """Occurrences of ``event`` overlapping the window, as (start, end) pairs.
+
+    Results are memoised per (series, window). The series key is made of the
+    recurrence definition itself, so editing an event never serves stale data.
+    """
+    if not event.recurrence:
+        if event.startDate < window_end and event.endDate > window_start:
+            return ((event.startDate, event.endDate),)
+        return ()
+    series = (
+        event.startDate,
+        event.endDate,
+        event.recurrence,
+        event.recurrenceInterval,
+        event.recurrenceCount,
+        event.recurrenceUntil,
+        parse_exceptions(event.recurrenceExceptions),
+        series_timezone(event.recurrenceTimezone),
+    )
+    return _expand(series, window_start, window_end)
+
+
+def clear_cache():
+    _expand.cache_clear()
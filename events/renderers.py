@@ -0,0 +1,50 @@
+import json
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ICalendarRenderer(BaseRenderer):
+    """Lets calendar clients negotiate text/calendar; the feed itself is streamed by the view."""
+    media_type = 'text/calendar'
+    format = 'ics'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only error payloads reach the renderer.
+        if data is None:
+            return b''
+        return json.dumps(data).encode(self.charset)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Byte-for-byte compatible JSONRenderer that uses orjson when it is installed.
+
+    Indented output, ASCII-only output and payloads orjson refuses fall back
+    to the standard renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            # datetimes go through DRF's encoder, which formats them differently from orjson.
+            ret = orjson.dumps(data, default=self._default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+    def _default(self, value):
+        result = self.encoder_class().default(value)
+        if isinstance(result, (str, int, float, bool, list, dict)) or result is None:
+            return result
+        raise TypeError
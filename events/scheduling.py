@@ -0,0 +1,73 @@
+import datetime
+import heapq
+from itertools import islice
+from .filters import filter_window
+from .intervals import clip_intervals, merge_intervals
+from .models import Event
+from .recurrence import expand
+
+# Rows fetched per round trip while streaming a user's events.
+BUSY_CHUNK_SIZE = 500
+
+
+def iter_busy(user, start, end):
+    """Busy (start, end) pairs of one user within [start, end), sorted by start.
+
+    Single events are streamed from the (user, startDate, endDate) index in
+    chunks, so a caller that stops early never reads the rest of the calendar.
+    Recurring series are few and are expanded up front.
+    """
+    events = filter_window(Event.objects.filter(user=user), start, end)
+    single = (
+        events.filter(recurrence__isnull=True)
+        .order_by('startDate')
+        .values_list('startDate', 'endDate')
+        .iterator(chunk_size=BUSY_CHUNK_SIZE)
+    )
+    series = [expand(event, start, end) for event in events.filter(recurrence__isnull=False)]
+    return clip_intervals(heapq.merge(single, *series), start, end)
+
+
+def working_windows(start, end, tz, work_start, work_end, weekdays):
+    """Yield the working hours of each allowed day (ISO weekday numbers) within [start, end)."""
+    day = start.astimezone(tz).date()
+    while datetime.datetime.combine(day, datetime.time.min, tzinfo=tz) < end:
+        if day.isoweekday() in weekdays:
+            window_start = max(start, datetime.datetime.combine(day, work_start, tzinfo=tz))
+            window_end = min(end, datetime.datetime.combine(day, work_end, tzinfo=tz))
+            if window_start < window_end:
+                yield window_start, window_end
+        day += datetime.timedelta(days=1)
+
+
+def free_slots(busy, windows, duration, step):
+    """Yield (start, end) slots of ``duration`` inside ``windows`` that avoid every busy interval.
+
+    Both inputs are sorted and consumed in a single pass. Candidate starts sit
+    on a grid of ``step`` anchored at each window start; after a conflict the
+    next candidate is the first grid point past the end of the busy interval.
+    """
+    busy = iter(busy)
+    current = next(busy, None)
+    for window_start, window_end in windows:
+        cursor = window_start
+        while cursor + duration <= window_end:
+            while current is not None and current[1] <= cursor:
+                current = next(busy, None)
+            if current is not None and current[0] < cursor + duration:
+                steps = -((window_start - current[1]) // step)
+                cursor = window_start + steps * step
+                continue
+            yield cursor, cursor + duration
+            cursor += step
+
+
+def find_meeting_times(users, start, end, duration, count, step, tz, work_start, work_end, weekdays):
+    """The earliest ``count`` slots in which every one of ``users`` is free.
+
+    Each user's busy intervals arrive as a sorted stream; a k-way heap merge
+    combines them so memory stays proportional to the number of users.
+    """
+    busy = merge_intervals(heapq.merge(*(iter_busy(user, start, end) for user in users)))
+    windows = working_windows(start, end, tz, work_start, work_end, weekdays)
+    return list(islice(free_slots(busy, windows, duration, step), count))
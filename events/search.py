@@ -0,0 +1,142 @@
+import re
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'events_event_fts'
+DOCS_TABLE = 'events_event_fts_docs'
+
+# bm25() column weights: a hit in the title counts ten times one in the description.
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+# The index mirrors events_event through triggers, so writes made with
+# bulk_create/bulk_update or raw SQL are indexed as well. events_event has a
+# UUID key and VACUUM may renumber its implicit rowids, so the index is not
+# keyed on them: DOCS_TABLE gives each event id its own stable INTEGER PRIMARY
+# KEY, which is the rowid of its entry in the contentless FTS5 table.
+_SCHEMA = [
+    f"""CREATE TABLE IF NOT EXISTS {DOCS_TABLE} (
+        docid integer NOT NULL PRIMARY KEY,
+        event_id char(32) NOT NULL UNIQUE
+    )""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON events_event BEGIN
+        INSERT INTO {DOCS_TABLE}(event_id) VALUES (new.id);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+            SELECT docid, new.title, new.description FROM {DOCS_TABLE} WHERE event_id = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            SELECT 'delete', docid, old.title, old.description FROM {DOCS_TABLE} WHERE event_id = old.id;
+        DELETE FROM {DOCS_TABLE} WHERE event_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON events_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            SELECT 'delete', docid, old.title, old.description FROM {DOCS_TABLE} WHERE event_id = old.id;
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+            SELECT docid, new.title, new.description FROM {DOCS_TABLE} WHERE event_id = new.id;
+    END""",
+]
+
+# A contentless table has no 'rebuild'; it is emptied and refilled from events_event.
+_REBUILD = [
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')",
+    f"DELETE FROM {DOCS_TABLE}",
+    f"INSERT INTO {DOCS_TABLE}(event_id) SELECT id FROM events_event",
+    f"""INSERT INTO {FTS_TABLE}(rowid, title, description)
+        SELECT docs.docid, event.title, event.description
+        FROM {DOCS_TABLE} AS docs INNER JOIN events_event AS event ON event.id = docs.event_id""",
+]
+
+_available = {}
+
+
+def fts_supported(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any(option == 'ENABLE_FTS5' for option, in cursor.fetchall())
+
+
+def _trigger_count(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'events_event' AND name LIKE %s",
+            [f'{FTS_TABLE}_%'],
+        )
+        return cursor.fetchone()[0]
+
+
+def install(connection):
+    """Create the FTS5 index and its triggers, then (re)build it from events_event."""
+    if not fts_supported(connection):
+        return False
+    with connection.cursor() as cursor:
+        for statement in _SCHEMA + _REBUILD:
+            cursor.execute(statement)
+    _available.pop(connection.alias, None)
+    return True
+
+
+def ensure_installed(connection):
+    """Reinstall the index when events_event was rebuilt without its triggers.
+
+    SQLite migrations that alter a table copy it into a new one, which drops
+    the triggers; a full rebuild restores them and re-indexes the events.
+    """
+    if not fts_supported(connection) or FTS_TABLE not in connection.introspection.table_names():
+        return
+    if _trigger_count(connection) < 3:
+        install(connection)
+
+
+def fts_available(connection):
+    if connection.alias not in _available:
+        _available[connection.alias] = fts_supported(connection) and _trigger_count(connection) == 3
+    return _available[connection.alias]
+
+
+def search_terms(query):
+    return _TERM_RE.findall(query)
+
+
+def match_expression(terms):
+    """FTS5 query matching every term, the last one as a prefix (search as you type)."""
+    quoted = ['"%s"' % term.replace('"', '""') for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def search_events(queryset, terms):
+    """Order ``queryset`` by relevance to ``terms``, keeping only matching events.
+
+    Uses the FTS5 index on SQLite and falls back to icontains on the other
+    backends, where results come back in date order.
+    """
+    if fts_available(connections[queryset.db]):
+        expression = match_expression(terms)
+        matches = RawSQL(
+            f"SELECT docs.event_id FROM {FTS_TABLE} INNER JOIN {DOCS_TABLE} AS docs ON docs.docid = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s",
+            [expression],
+        )
+        # bm25() is only defined inside a MATCH query, so each match is ranked
+        # by one, looked up through its docid.
+        rank = RawSQL(
+            f"SELECT bm25({FTS_TABLE}, %s, %s) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+            f"AND {FTS_TABLE}.rowid = (SELECT docid FROM {DOCS_TABLE} WHERE event_id = events_event.id)",
+            [TITLE_WEIGHT, DESCRIPTION_WEIGHT, expression],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).order_by(rank, 'startDate', 'id')
+    for term in terms:
+        queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+    return queryset.order_by('startDate', 'id')
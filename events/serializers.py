@@ -1,29 +1,243 @@
 from rest_framework import serializers
-from .models import Event, Category
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from calendar_main.timing import measure
+from .models import Event, Category, CalendarShare
+import datetime
 import re
+import zoneinfo
+
+class CategoryField(serializers.PrimaryKeyRelatedField):
+    """A category of the requesting user, resolved from context['categories']
+    when given, saving a query per event.
+
+    With context['categories_complete'] set, ids missing from the mapping are
+    rejected without querying, which lets async views validate off the ORM.
+    """
+
+    def get_queryset(self):
+        # Events can only be filed under the requesting user's categories.
+        request = self.context.get('request')
+        if request is None:
+            return Category.objects.none()
+        return Category.objects.filter(user=request.user)
+
+    def to_internal_value(self, data):
+        categories = self.context.get('categories')
+        if categories is not None and str(data) in categories:
+            return categories[str(data)]
+        if categories is not None and self.context.get('categories_complete'):
+            self.fail('does_not_exist', pk_value=data)
+        return super().to_internal_value(data)
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    @property
+    def data(self):
+        with measure('serialize'):
+            return super().data
+
+
+class TimedSerializerMixin:
+    """Reports validation and representation as serialize time on sampled requests (see calendar_main.timing)."""
+
+    def is_valid(self, *, raise_exception=False):
+        with measure('serialize'):
+            return super().is_valid(raise_exception=raise_exception)
+
+    @property
+    def data(self):
+        with measure('serialize'):
+            return super().data
+
+
+class EventSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    category = CategoryField(queryset=Category.objects.all(), allow_null=True, required=False)
+    recurrenceExceptions = serializers.ListField(child=serializers.DateTimeField(), required=False)
 
-class EventSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
-        fields = '__all__'
+        exclude = ['changeVersion']
         read_only_fields = ['id', 'user', 'createdAt']
+        list_serializer_class = TimedListSerializer
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if 'category' in self.context.get('expand', ()):
+            category = instance.category
+            data['category'] = None if category is None else {
+                'id': str(category.id),
+                'name': category.name,
+                'color': category.color,
+            }
+        return data
+
+    def validate_recurrenceTimezone(self, value):
+        if not value:
+            return None
+        try:
+            zoneinfo.ZoneInfo(value)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError(f"Unknown time zone: {value}.")
+        return value
 
     def validate(self, data):
-        start = data.get('startDate')
-        end = data.get('endDate')
+        def current(name):
+            # Partial updates check the fields they leave alone as stored.
+            return data[name] if name in data else getattr(self.instance, name, None)
+
+        start = current('startDate')
+        end = current('endDate')
         if start and end and start > end:
             raise serializers.ValidationError("The start date cannot be greater than the end date.")
+        if data.get('recurrence') == '':
+            data['recurrence'] = None
+        if data.get('recurrenceInterval') == 0:
+            raise serializers.ValidationError({'recurrenceInterval': "The interval must be at least 1."})
+        if data.get('recurrenceCount') == 0:
+            raise serializers.ValidationError({'recurrenceCount': "The count must be at least 1."})
+        if current('recurrenceCount') and current('recurrenceUntil'):
+            raise serializers.ValidationError("A recurrence can have a count or an until date, not both.")
+        if 'recurrenceExceptions' in data:
+            data['recurrenceExceptions'] = sorted(
+                timezone.localtime(value, datetime.timezone.utc).isoformat()
+                for value in data['recurrenceExceptions']
+            )
         return data
 
+class EventRowSerializer:
+    """Read-only fast path equivalent to ``EventSerializer(many=True).data``.
+
+    Works on ``values()`` rows instead of model instances and skips the DRF
+    field machinery: converters are chosen once from EventSerializer's fields,
+    so the output keeps the same keys, order and formatting.
+    """
+
+    def __init__(self, expand=()):
+        self.expand_category = 'category' in expand
+        field_timezone = timezone.get_current_timezone()
+        utc = datetime.timezone.utc
+        # Database values already carry UTC; converting them to UTC is a no-op worth skipping.
+        skip_utc = getattr(field_timezone, 'key', None) == 'UTC' or field_timezone is utc
+
+        def format_datetime(value):
+            if isinstance(value, datetime.datetime):
+                if not (skip_utc and value.tzinfo is utc):
+                    value = value.astimezone(field_timezone)
+                value = value.isoformat()
+                if value.endswith('+00:00'):
+                    value = value[:-6] + 'Z'
+            return value
+
+        def format_datetime_list(values):
+            return [format_datetime(value) for value in values]
+
+        self.converters = []
+        for name, field in EventSerializer().fields.items():
+            if isinstance(field, serializers.DateTimeField):
+                converter = format_datetime
+            elif isinstance(field, serializers.ListField) and isinstance(field.child, serializers.DateTimeField):
+                converter = format_datetime_list
+            elif isinstance(field, serializers.UUIDField):
+                converter = str
+            else:
+                converter = None
+            self.converters.append((name, field.source, converter))
+        self.value_fields = [source for _, source, _ in self.converters]
+        if self.expand_category:
+            # Fetched through the same join as the event row.
+            self.value_fields += ['category__name', 'category__color']
+
+    def to_representation(self, row):
+        data = {}
+        for name, source, converter in self.converters:
+            value = row[source]
+            if converter is not None and value is not None:
+                value = converter(value)
+            data[name] = value
+        if self.expand_category:
+            category = row['category']
+            data['category'] = None if category is None else {
+                'id': str(category),
+                'name': row['category__name'],
+                'color': row['category__color'],
+            }
+        return data
+
+    def serialize(self, rows):
+        # Run a pending query first so its time is not counted as serialization.
+        rows = list(rows)
+        with measure('serialize'):
+            return [self.to_representation(row) for row in rows]
+
 HEX_COLOR_REGEX = r'^#(?:[0-9a-fA-F]{3}){1,2}$'
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'name', 'color']
         read_only_fields = ['id']
+        list_serializer_class = TimedListSerializer
 
     def validate_color(self, value):
         if not re.match(HEX_COLOR_REGEX, value):
             raise serializers.ValidationError("Invalid color format. Please use a hex color code.")
-        return value
\ No newline at end of file
+        return value
+
+
+class CalendarShareSerializer(serializers.ModelSerializer):
+    sharedWith = serializers.SlugRelatedField(slug_field='email', queryset=get_user_model().objects.filter(is_active=True))
+
+    class Meta:
+        model = CalendarShare
+        fields = ['id', 'sharedWith', 'createdAt']
+        read_only_fields = ['id', 'createdAt']
+
+    def validate_sharedWith(self, value):
+        owner = self.context['request'].user
+        if value == owner:
+            raise serializers.ValidationError("You cannot share your calendar with yourself.")
+        if CalendarShare.objects.filter(owner=owner, sharedWith=value).exists():
+            raise serializers.ValidationError("Your calendar is already shared with this user.")
+        return value
+
+
+class MeetingTimeSerializer(serializers.Serializer):
+    """Parameters of a find-a-meeting-time request. Durations are in minutes."""
+    MAX_USERS = 20
+    MAX_DAYS = 92
+
+    users = serializers.ListField(child=serializers.EmailField(), allow_empty=False, max_length=MAX_USERS)
+    includeSelf = serializers.BooleanField(default=True)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    duration = serializers.IntegerField(min_value=5, max_value=24 * 60)
+    step = serializers.IntegerField(min_value=5, max_value=24 * 60, default=30)
+    count = serializers.IntegerField(min_value=1, max_value=50, default=5)
+    workStart = serializers.TimeField(default=datetime.time(9, 0))
+    workEnd = serializers.TimeField(default=datetime.time(17, 0))
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=7),
+        allow_empty=False,
+        default=[1, 2, 3, 4, 5],
+    )
+    timeZone = serializers.CharField(required=False)
+
+    def validate_timeZone(self, value):
+        try:
+            return zoneinfo.ZoneInfo(value)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError(f"Unknown time zone: {value}.")
+
+    def validate(self, data):
+        if data['start'] >= data['end']:
+            raise serializers.ValidationError("The start date must be before the end date.")
+        if data['end'] - data['start'] > datetime.timedelta(days=self.MAX_DAYS):
+            raise serializers.ValidationError(f"The range cannot exceed {self.MAX_DAYS} days.")
+        if data['workStart'] >= data['workEnd']:
+            raise serializers.ValidationError("Working hours must start before they end.")
+        data.setdefault('timeZone', timezone.get_current_timezone())
+        data['duration'] = datetime.timedelta(minutes=data['duration'])
+        data['step'] = datetime.timedelta(minutes=data['step'])
+        data['weekdays'] = frozenset(data['weekdays'])
+        return data
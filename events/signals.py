@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.db import connections
+from django.dispatch import receiver
+from . import search
+from .models import Category, Event, rows_deleted
+from .caching import invalidate_user
+from .feed import publish_change
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Category)
+def notify_calendar_save(sender, instance, created=False, **kwargs):
+    # The version was bumped and stamped on the row by CalendarModel.save(),
+    # which also moves the user's response cache on (see events.caching).
+    publish_change(instance.user_id, sender._meta.model_name, instance.pk, 'created' if created else 'updated')
+
+
+@receiver(rows_deleted, sender=Event)
+@receiver(rows_deleted, sender=Category)
+def notify_calendar_deletion(sender, rows, **kwargs):
+    # Tombstones and the version bump were written once for the call by models.record_deletions.
+    for user_id, pk in rows:
+        publish_change(user_id, sender._meta.model_name, pk, 'deleted')
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def reset_response_cache_for_new_user(sender, instance, created, **kwargs):
+    # A reused primary key must not inherit another account's cached responses.
+    if created:
+        invalidate_user(instance.pk)
+
+
+def restore_search_index(sender, using, **kwargs):
+    search.ensure_installed(connections[using])
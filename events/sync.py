@@ -0,0 +1,79 @@
+import base64
+import datetime
+from django.conf import settings
+from django.db.models import F, Max
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from .models import CalendarVersion, Category, Event, Tombstone
+from .versioning import get_version
+
+# Stands for the timestamp tokens issued before tokens carried versions.
+LEGACY_TOKEN = -1
+
+
+def encode_token(version):
+    return base64.urlsafe_b64encode(str(version).encode()).decode().rstrip('=')
+
+
+def decode_token(token):
+    """The calendar version a sync token was issued at (LEGACY_TOKEN for old timestamp tokens)."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        value = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (ValueError, UnicodeDecodeError):
+        value = ''
+    if value.isdigit():
+        return int(value)
+    try:
+        if parse_datetime(value) is not None:
+            return LEGACY_TOKEN
+    except ValueError:
+        pass
+    raise ValidationError({'since': "Invalid sync token."})
+
+
+def retention_cutoff():
+    return timezone.now() - datetime.timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+
+def token_expired(user, since):
+    """Tokens older than the user's pruned tombstones could miss deletions."""
+    pruned = CalendarVersion.objects.filter(user=user).values_list('prunedVersion', flat=True).first() or 0
+    return since == LEGACY_TOKEN or since < pruned
+
+
+def prune_tombstones():
+    """Delete tombstones past the retention period, expiring the tokens that still need them."""
+    expired = Tombstone.objects.filter(deletedAt__lt=retention_cutoff())
+    newest = expired.values('user').annotate(newest=Max('changeVersion')).values_list('user', 'newest')
+    for user_id, version in newest:
+        CalendarVersion.objects.filter(user_id=user_id).update(prunedVersion=Greatest(F('prunedVersion'), version))
+    deleted, _ = expired.delete()
+    return deleted
+
+
+def changes_since(user, since=None):
+    """Collect the events, categories and deletions newer than ``since``.
+
+    Returns ``(events, categories, tombstones, version)``. Without ``since``
+    a full snapshot is returned and no tombstones are needed. Changes are
+    selected by the calendar version of the write that made them, never by
+    timestamp: the version is read first and caps every query, and since
+    versions commit in order (CalendarVersion.bump), nothing at or below it
+    can still be in flight. It is the exclusive lower bound of the next sync.
+    """
+    version = get_version(user.pk)
+    events = Event.objects.filter(user=user, changeVersion__lte=version)
+    categories = Category.objects.filter(user=user, changeVersion__lte=version)
+    tombstones = Tombstone.objects.none()
+    if since is not None:
+        events = events.filter(changeVersion__gt=since)
+        categories = categories.filter(changeVersion__gt=since)
+        tombstones = Tombstone.objects.filter(
+            user=user, changeVersion__gt=since, changeVersion__lte=version,
+        ).values_list('model', 'objectId')
+    events = list(events.order_by('changeVersion'))
+    categories = list(categories.order_by('changeVersion'))
+    return events, categories, list(tombstones), version
@@ -0,0 +1,132 @@
+"""Deterministic synthetic users, categories and events for benchmarks and index tuning.
+
+Rows are written with bulk_create in batches and users are processed in
+chunks, so memory stays flat however many rows are generated. Every user
+gets the same password hash, computed once: hashing per user (PBKDF2) is
+what makes creating users through ``create_user`` take hours.
+"""
+import datetime
+import random
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from .models import Category, Event
+from .recurrence import DAILY, MONTHLY, WEEKLY
+
+WORDS = (
+    "planning review sync standup retro demo budget hiring onboarding design "
+    "launch roadmap interview lunch dentist gym yoga dinner flight train "
+    "workshop training offsite quarterly weekly project client vendor audit "
+    "release sprint kickoff follow-up call coffee birthday school pickup"
+).split()
+CATEGORY_NAMES = ("Work", "Personal", "Family", "Health", "Travel", "Study", "Sport", "Social", "Errands", "Holidays")
+COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf")
+# (minutes, weight): mostly meetings, a few long blocks.
+DURATIONS = ((15, 10), (30, 30), (45, 10), (60, 30), (90, 8), (120, 8), (240, 4))
+# Default first day of the generated span: fixed, so a seed gives the same data on any day.
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+# Pareto shape for events per user; 1.16 puts ~80% of the events on ~20% of the users.
+SKEW = 1.16
+
+
+def event_counts(rng, users, events):
+    """Split ``events`` over ``users`` with a heavy-tailed (Pareto) distribution."""
+    weights = [rng.paretovariate(SKEW) for _ in range(users)]
+    total = sum(weights)
+    counts = [int(events * weight / total) for weight in weights]
+    for index in rng.choices(range(users), weights=weights, k=events - sum(counts)):
+        counts[index] += 1
+    return counts
+
+
+class EventFactory:
+    """Builds unsaved Event rows for one user: working-hours meetings that
+    overlap, some multi-day events and a few recurring series."""
+
+    def __init__(self, rng, start, days, multi_day_ratio, recurring_ratio):
+        self.rng = rng
+        self.start = start
+        self.days = days
+        self.multi_day_ratio = multi_day_ratio
+        self.recurring_ratio = recurring_ratio
+        self.minutes, self.weights = zip(*DURATIONS)
+
+    def build(self, user_id, categories):
+        rng = self.rng
+        day = self.start + datetime.timedelta(days=rng.randrange(self.days))
+        roll = rng.random()
+        if roll < self.multi_day_ratio:
+            startDate = day
+            endDate = day + datetime.timedelta(days=rng.randint(1, 5))
+        else:
+            # Starts on the quarter hour, mostly within working hours.
+            hour = min(23, max(0, round(rng.gauss(12.5, 3))))
+            startDate = day + datetime.timedelta(hours=hour, minutes=15 * rng.randrange(4))
+            endDate = startDate + datetime.timedelta(minutes=rng.choices(self.minutes, self.weights)[0])
+        event = Event(
+            title=' '.join(rng.sample(WORDS, rng.randint(1, 3))).capitalize(),
+            description=' '.join(rng.choices(WORDS, k=rng.randint(5, 20))) if rng.random() < 0.4 else None,
+            startDate=startDate,
+            endDate=endDate,
+            category_id=rng.choice(categories) if categories and rng.random() < 0.8 else None,
+            user_id=user_id,
+        )
+        if roll > 1 - self.recurring_ratio:
+            event.recurrence = rng.choice((DAILY, WEEKLY, WEEKLY, MONTHLY))
+            event.recurrenceCount = rng.randint(2, 52) if rng.random() < 0.7 else None
+            # bulk_create() skips Event.save(), which normally fills this in.
+            event.recurrenceEnd = event.compute_recurrence_end()
+        return event
+
+
+def generate(users, events, max_categories=8, seed=0, batch_size=5000, password='password',
+             email_prefix='synthetic', start=START, days=730, multi_day_ratio=0.05, recurring_ratio=0.03,
+             progress=None):
+    """Create ``users`` active users holding ``events`` events in total.
+
+    Events start within ``days`` days from ``start``. Returns the number of
+    users, categories and events created. ``progress``
+    is called with the running totals after each chunk of users.
+    """
+    User = get_user_model()
+    rng = random.Random(seed)
+    password_hash = make_password(password)
+    counts = event_counts(rng, users, events)
+    factory = EventFactory(rng, start, days, multi_day_ratio, recurring_ratio)
+    totals = {'users': 0, 'categories': 0, 'events': 0}
+
+    for first in range(0, users, batch_size):
+        with transaction.atomic():
+            created = User.objects.bulk_create(
+                User(email=f'{email_prefix}{n}@example.com', password=password_hash, is_active=True)
+                for n in range(first, min(first + batch_size, users))
+            )
+            categories = Category.objects.bulk_create(
+                (
+                    Category(name=name, color=rng.choice(COLORS), user_id=user.pk)
+                    for user in created
+                    for name in rng.sample(CATEGORY_NAMES, rng.randint(0, max_categories))
+                ),
+                batch_size=batch_size,
+            )
+            by_user = {}
+            for category in categories:
+                by_user.setdefault(category.user_id, []).append(category.pk)
+
+            batch = []
+            for offset, user in enumerate(created):
+                owned = by_user.get(user.pk, [])
+                for _ in range(counts[first + offset]):
+                    batch.append(factory.build(user.pk, owned))
+                    if len(batch) >= batch_size:
+                        Event.objects.bulk_create(batch)
+                        totals['events'] += len(batch)
+                        batch = []
+            if batch:
+                Event.objects.bulk_create(batch)
+                totals['events'] += len(batch)
+        totals['users'] += len(created)
+        totals['categories'] += len(categories)
+        if progress is not None:
+            progress(totals)
+    return totals
@@ -0,0 +1,142 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.caching import get_cache
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+
+class AsyncViewParityTests(APITestCase):
+    """The async endpoints answer exactly like the DRF viewsets."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", color="#ff0000", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        self.events = [
+            Event.objects.create(
+                title=f"Event {i}", description="Notes" if i % 2 else None,
+                startDate=start + datetime.timedelta(hours=i), endDate=start + datetime.timedelta(hours=i + 1),
+                category=self.category if i % 2 else None, user=self.user,
+            )
+            for i in range(5)
+        ]
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def assertSameResponse(self, sync, async_, content=True):
+        self.assertEqual(sync.status_code, async_.status_code)
+        if content:
+            self.assertEqual(sync.content, async_.content)
+
+    def get_both(self, name, params=None, **kwargs):
+        get_cache().clear()
+        sync = self.client.get(reverse(f'{name}', kwargs=kwargs or None), params)
+        async_ = self.client.get(reverse(f'async-{name}', kwargs=kwargs or None), params)
+        self.assertSameResponse(sync, async_)
+        return sync, async_
+
+    def test_list(self):
+        self.get_both('event-list')
+        self.get_both('event-list', {'start': '2025-06-17T11:30:00Z', 'end': '2025-06-17T13:00:00Z', 'expand': 'category'})
+        self.get_both('category-list')
+
+    def test_list_pages(self):
+        sync = self.client.get(reverse('event-list'), {'page_size': 2})
+        async_ = self.client.get(reverse('async-event-list'), {'page_size': 2})
+        self.assertEqual(sync.json()['results'], async_.json()['results'])
+        cursor = async_.json()['next'].split('?', 1)[1]
+        self.assertEqual(cursor, sync.json()['next'].split('?', 1)[1])
+        sync_page = self.client.get(reverse('event-list') + '?' + cursor)
+        async_page = self.client.get(reverse('async-event-list') + '?' + cursor)
+        self.assertEqual(sync_page.json()['results'], async_page.json()['results'])
+
+    def test_list_etag(self):
+        sync, async_ = self.get_both('event-list')
+        self.assertEqual(sync['ETag'], async_['ETag'])
+        response = self.client.get(reverse('async-event-list'), HTTP_IF_NONE_MATCH=async_['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve(self):
+        self.get_both('event-detail', pk=self.events[1].pk)
+        self.get_both('event-detail', {'expand': 'category'}, pk=self.events[1].pk)
+        self.get_both('category-detail', pk=self.category.pk)
+
+    def test_not_found_and_unauthenticated(self):
+        other = CustomUser.objects.create_user(email='other@example.com', password='testpass123', is_active=True)
+        foreign = Event.objects.create(title="Other", startDate=self.events[0].startDate, endDate=self.events[0].endDate, user=other)
+        self.get_both('event-detail', pk=foreign.pk)
+        self.client.credentials()
+        sync = self.client.get(reverse('event-list'))
+        async_ = self.client.get(reverse('async-event-list'))
+        self.assertSameResponse(sync, async_)
+        self.assertEqual(sync['WWW-Authenticate'], async_['WWW-Authenticate'])
+
+    def test_create(self):
+        payload = {'title': "New", 'startDate': '2025-06-18T10:00:00Z', 'endDate': '2025-06-18T11:00:00Z', 'category': str(self.category.pk)}
+        response = self.client.post(reverse('async-event-list'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        event = Event.objects.get(pk=response.json()['id'])
+        self.assertEqual((event.title, event.category, event.user), ("New", self.category, self.user))
+        self.assertEqual(response.json()['category'], str(self.category.pk))
+
+    def test_create_validation_errors(self):
+        for payload in (
+            {'title': "Backwards", 'startDate': '2025-06-18T11:00:00Z', 'endDate': '2025-06-18T10:00:00Z'},
+            {'title': "Unknown category", 'startDate': '2025-06-18T10:00:00Z', 'endDate': '2025-06-18T11:00:00Z',
+             'category': '00000000-0000-0000-0000-000000000000'},
+            {'startDate': '2025-06-18T10:00:00Z'},
+        ):
+            sync = self.client.post(reverse('event-list'), payload, format='json')
+            async_ = self.client.post(reverse('async-event-list'), payload, format='json')
+            self.assertEqual(sync.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertSameResponse(sync, async_)
+
+    def test_another_users_category_is_rejected(self):
+        other = CustomUser.objects.create_user(email='other@example.com', password='testpass123', is_active=True)
+        foreign_category = Category.objects.create(name="Theirs", user=other)
+        payload = {'title': "New", 'startDate': '2025-06-18T10:00:00Z', 'endDate': '2025-06-18T11:00:00Z', 'category': str(foreign_category.pk)}
+        sync = self.client.post(reverse('event-list'), payload, format='json')
+        async_ = self.client.post(reverse('async-event-list'), payload, format='json')
+        self.assertEqual(sync.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertSameResponse(sync, async_)
+
+        url = reverse('async-event-detail', kwargs={'pk': self.events[0].pk})
+        response = self.client.patch(url, {'category': str(foreign_category.pk)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Event.objects.filter(category=foreign_category).exists())
+
+    def test_update_and_delete(self):
+        event = self.events[0]
+        response = self.client.patch(reverse('async-event-detail', kwargs={'pk': event.pk}), {'title': "Renamed"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        event.refresh_from_db()
+        self.assertEqual(event.title, "Renamed")
+        self.assertEqual(response.content, self.client.get(reverse('event-detail', kwargs={'pk': event.pk})).content)
+
+        response = self.client.delete(reverse('async-event-detail', kwargs={'pk': event.pk}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Event.objects.filter(pk=event.pk).exists())
+
+    def test_category_create_update_delete(self):
+        response = self.client.post(reverse('async-category-list'), {'name': "Home", 'color': "#00ff00"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        pk = response.json()['id']
+        response = self.client.put(reverse('async-category-detail', kwargs={'pk': pk}), {'name': "House", 'color': "#00ff00"}, format='json')
+        self.assertEqual(response.json()['name'], "House")
+        response = self.client.put(reverse('async-category-detail', kwargs={'pk': pk}), {'name': "House", 'color': "green"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.delete(reverse('async-category-detail', kwargs={'pk': pk}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_malformed_json(self):
+        response = self.client.post(reverse('async-event-list'), '{', content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,87 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.urls import reverse
+from events.models import Event, Category
+from events.caching import get_cache, get_stats
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.user2 = CustomUser.objects.create_user(email='testuser2@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        self.event = Event.objects.create(title="Event", startDate=start, endDate=end, user=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_repeated_list_is_served_from_cache(self):
+        first = self.client.get(reverse('event-list'))
+        # The ETag version lookup only.
+        with self.assertNumQueries(1):
+            second = self.client.get(reverse('event-list'))
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(get_stats()['hits'], 1)
+        self.assertEqual(get_stats()['misses'], 1)
+
+    def test_write_invalidates_cache(self):
+        url = reverse('event-detail', kwargs={'pk': self.event.pk})
+        self.client.get(url)
+        self.client.patch(url, {'title': 'Renamed'}, format='json')
+        response = self.client.get(url)
+        self.assertEqual(response.json()['title'], 'Renamed')
+
+        self.client.get(reverse('category-list'))
+        Category.objects.create(name="Home", user=self.user)
+        response = self.client.get(reverse('category-list'))
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_read_during_open_write_transaction_is_not_served_later(self):
+        url = reverse('event-list')
+        before = self.client.get(url)
+        during = []
+
+        def read_before_commit(sender, instance, **kwargs):
+            during.append(self.client.get(url))
+
+        post_save.connect(read_before_commit, sender=Event)
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Event.objects.create(title="Rolled back", startDate=self.event.startDate, endDate=self.event.endDate, user=self.user)
+                raise RuntimeError
+        finally:
+            post_save.disconnect(read_before_commit, sender=Event)
+
+        self.assertEqual(len(during[0].json()['results']), 2)
+        after = self.client.get(url)
+        self.assertEqual(after.content, before.content)
+        self.assertEqual(after['ETag'], before['ETag'])
+
+    def test_cache_is_per_user(self):
+        self.client.get(reverse('event-list'))
+        access_token = self.get_token_for_user(self.user2)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(reverse('event-list'))
+        self.assertEqual(response.json()['results'], [])
+
+    def test_cache_stats_requires_staff(self):
+        response = self.client.get(reverse('event-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(reverse('event-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('hit_ratio', response.data)
@@ -0,0 +1,49 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class ETagTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        self.event = Event.objects.create(title="Event", startDate=start, endDate=end, user=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_not_modified_skips_queryset(self):
+        etag = self.client.get(reverse('event-list'))['ETag']
+        # Only the version lookup; the user is cached and the event query never runs.
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('event-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_write_changes_etag(self):
+        etag = self.client.get(reverse('event-list'))['ETag']
+        self.client.patch(reverse('event-detail', kwargs={'pk': self.event.pk}), {'title': 'Renamed'}, format='json')
+        response = self.client.get(reverse('event-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_category_write_changes_category_etag(self):
+        etag = self.client.get(reverse('category-list'))['ETag']
+        self.client.delete(reverse('category-detail', kwargs={'pk': self.category.pk}))
+        response = self.client.get(reverse('category-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_etag_depends_on_query(self):
+        etag = self.client.get(reverse('event-list'))['ETag']
+        response = self.client.get(reverse('event-list'), {'start': '2025-06-18'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,81 @@
+import importlib
+import os
+import sys
+from unittest import mock
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import SimpleTestCase
+from accounts.models import CustomUser
+from calendar_main.database import REPLICA_DB_ALIAS, ReadReplicaRouter, configure_sqlite
+from events.models import Event
+
+
+class FakeConnection:
+    vendor = 'sqlite'
+
+    def __init__(self, **settings_dict):
+        self.settings_dict = settings_dict
+        self.connection = mock.Mock()
+
+    def pragmas(self):
+        return [call.args[0] for call in self.connection.execute.call_args_list]
+
+
+class ConfigureSqliteTests(SimpleTestCase):
+    def test_primary_gets_every_pragma(self):
+        connection = FakeConnection()
+        configure_sqlite(None, connection)
+        self.assertIn('PRAGMA journal_mode = WAL', connection.pragmas())
+        self.assertIn('PRAGMA synchronous = NORMAL', connection.pragmas())
+        self.assertEqual(len(connection.pragmas()), len(settings.SQLITE_PRAGMAS))
+
+    def test_replica_is_query_only_and_keeps_journal_mode(self):
+        connection = FakeConnection(READ_ONLY=True)
+        configure_sqlite(None, connection)
+        self.assertNotIn('PRAGMA journal_mode = WAL', connection.pragmas())
+        self.assertEqual(connection.pragmas()[-1], 'PRAGMA query_only = ON')
+
+    def test_other_backends_are_untouched(self):
+        connection = FakeConnection()
+        connection.vendor = 'postgresql'
+        configure_sqlite(None, connection)
+        self.assertEqual(connection.pragmas(), [])
+
+
+class ReadReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    def test_reads_go_to_the_replica(self):
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', False):
+            self.assertEqual(self.router.db_for_read(Event), REPLICA_DB_ALIAS)
+
+    def test_reads_of_other_apps_stay_on_the_primary(self):
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', False):
+            self.assertEqual(self.router.db_for_read(CustomUser), DEFAULT_DB_ALIAS)
+
+    def test_reads_inside_a_transaction_stay_on_the_primary(self):
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', True):
+            self.assertEqual(self.router.db_for_read(Event), DEFAULT_DB_ALIAS)
+
+    def test_writes_and_migrations_go_to_the_primary(self):
+        self.assertEqual(self.router.db_for_write(Event, instance=Event()), DEFAULT_DB_ALIAS)
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'events'))
+        self.assertFalse(self.router.allow_migrate(REPLICA_DB_ALIAS, 'events'))
+
+    def test_replica_alias_is_read_only_and_mirrored_in_tests(self):
+        replica = settings.DATABASES[REPLICA_DB_ALIAS]
+        self.assertTrue(replica['READ_ONLY'])
+        self.assertEqual(replica['TEST']['MIRROR'], DEFAULT_DB_ALIAS)
+
+
+class ConnMaxAgeTests(SimpleTestCase):
+    def test_wsgi_keeps_connections(self):
+        self.assertGreater(settings.DATABASES[DEFAULT_DB_ALIAS]['CONN_MAX_AGE'], 0)
+
+    def test_asgi_entry_point_defaults_to_zero(self):
+        environ = {key: value for key, value in os.environ.items() if key != 'DATABASE_CONN_MAX_AGE'}
+        with mock.patch.dict(os.environ, environ, clear=True), mock.patch.dict(sys.modules):
+            sys.modules.pop('calendar_main.asgi', None)
+            importlib.import_module('calendar_main.asgi')
+            self.assertEqual(os.environ['DATABASE_CONN_MAX_AGE'], '0')
@@ -0,0 +1,102 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, Category, Tombstone
+from events.versioning import get_version
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class BulkEventTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.user2 = CustomUser.objects.create_user(email='testuser2@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        self.event = Event.objects.create(title="Existing", startDate=start, endDate=end, user=self.user)
+        self.doomed = Event.objects.create(title="Doomed", startDate=start, endDate=end, user=self.user)
+        self.foreign = Event.objects.create(title="Foreign", startDate=start, endDate=end, user=self.user2)
+        self.url = reverse('event-bulk')
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def event_data(self, title):
+        return {
+            "title": title,
+            "startDate": "2025-06-18T10:00:00Z",
+            "endDate": "2025-06-18T11:00:00Z",
+            "category": str(self.category.id),
+        }
+
+    def test_bulk_create_update_delete(self):
+        payload = {
+            "create": [self.event_data(f"New {i}") for i in range(20)],
+            "update": [{"id": str(self.event.id), "title": "Renamed"}],
+            "delete": [str(self.doomed.id)],
+        }
+        with self.assertNumQueries(16):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['created']), 20)
+        self.assertEqual(Event.objects.filter(user=self.user, category=self.category).count(), 20)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.title, "Renamed")
+        self.assertFalse(Event.objects.filter(pk=self.doomed.pk).exists())
+
+    def test_bulk_delete_records_tombstones_in_one_write(self):
+        start = timezone.make_aware(datetime.datetime(2025, 6, 20, 10, 0, 0))
+        events = Event.objects.bulk_create(
+            Event(title=f"Old {i}", startDate=start, endDate=start, user=self.user) for i in range(200)
+        )
+        version = get_version(self.user.pk)
+        # One DELETE, one version bump and batched tombstone INSERTs, not queries per row.
+        with self.assertNumQueries(13):
+            response = self.client.post(self.url, {"delete": [str(event.id) for event in events]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Tombstone.objects.filter(user=self.user, model=Tombstone.EVENT).count(), 200)
+        self.assertEqual(get_version(self.user.pk), version + 1)
+
+    def test_bulk_errors_are_reported_per_item_and_nothing_is_written(self):
+        invalid = {**self.event_data("Backwards"), "startDate": "2025-06-19T10:00:00Z"}
+        payload = {
+            "create": [self.event_data("Valid"), invalid],
+            "update": [{"id": str(self.foreign.id), "title": "Hijacked"}],
+            "delete": [str(self.doomed.id)],
+        }
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['create'][0], {})
+        self.assertIn('non_field_errors', response.data['create'][1])
+        self.assertIn('id', response.data['update'][0])
+        self.assertEqual(response.data['delete'][0], {})
+        self.assertEqual(Event.objects.count(), 3)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.title, "Foreign")
+
+    def test_bulk_rejects_another_users_category(self):
+        foreign_category = Category.objects.create(name="Theirs", user=self.user2)
+        payload = {
+            "create": [{**self.event_data("New"), "category": str(foreign_category.id)}],
+            "update": [{"id": str(self.event.id), "category": str(foreign_category.id)}],
+        }
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('category', response.data['create'][0])
+        self.assertIn('category', response.data['update'][0])
+        self.assertFalse(Event.objects.filter(category=foreign_category).exists())
+
+    def test_bulk_unauthenticated(self):
+        self.client.credentials()
+        response = self.client.post(self.url, {"create": [self.event_data("New")]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -40,3 +40,14 @@ class EventCreateTests(APITestCase):
     def test_create_event_unauthenticated(self):
         response = self.client.post(self.url, self.event_data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_create_event_with_another_users_category(self):
+        other = CustomUser.objects.create_user(email='other@example.com', password='testpass123', is_active=True)
+        foreign_category = Category.objects.create(name="Theirs", user=other)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.post(self.url, {**self.event_data, "category": str(foreign_category.id)}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('category', response.data)
+        self.assertEqual(Event.objects.count(), 0)
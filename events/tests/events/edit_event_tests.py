@@ -57,3 +57,27 @@ class EventEditTests(APITestCase):
         self.event.refresh_from_db()
         self.assertNotEqual(self.event.title, self.updated_event_data['title'])
         self.assertNotEqual(str(self.event.category.id), self.updated_event_data['category'])
+
+    def test_patch_end_before_stored_start(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.patch(self.url, {"endDate": "2025-06-17T09:00:00Z"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.patch(self.url, {"startDate": "2025-06-17T13:00:00Z"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_patch_until_on_series_with_count(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.event.recurrence = 'weekly'
+        self.event.recurrenceCount = 3
+        self.event.save()
+        response = self.client.patch(self.url, {"recurrenceUntil": "2025-08-01T00:00:00Z"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.event.refresh_from_db()
+        self.assertIsNone(self.event.recurrenceUntil)
+
+        response = self.client.patch(self.url, {"recurrenceCount": None, "recurrenceUntil": "2025-08-01T00:00:00Z"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.event.refresh_from_db()
+        self.assertIsNone(self.event.recurrenceCount)
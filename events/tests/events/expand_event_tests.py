@@ -0,0 +1,72 @@
+from unittest import mock
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.caching import get_cache
+from events.models import Event, Category
+from events.views import EventViewSet
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class ExpandCategoryTests(APITestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", color="#ff0000", user=self.user)
+        self.start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        self.event = self.create_events(1, category=self.category)[0]
+        Event.objects.create(title="No category", startDate=self.start, endDate=self.start, user=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        # Warm the authentication cache so only the list itself is counted.
+        self.client.get(reverse('event-list'))
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def create_events(self, count, category=None):
+        return [
+            Event.objects.create(title=f"Event {i}", startDate=self.start, endDate=self.start, category=category, user=self.user)
+            for i in range(count)
+        ]
+
+    def list_queries(self):
+        get_cache().clear()
+        with self.assertNumQueries(2) as context:
+            response = self.client.get(reverse('event-list'), {'expand': 'category', 'page_size': 1000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_list_expands_category(self):
+        response = self.client.get(reverse('event-list'), {'expand': 'category'})
+        results = {event['title']: event for event in response.data['results']}
+        self.assertEqual(results['Event 0']['category'], {'id': str(self.category.id), 'name': "Work", 'color': "#ff0000"})
+        self.assertIsNone(results['No category']['category'])
+
+    def test_list_query_count_is_constant(self):
+        # The ETag version lookup and one joined event query, whatever the event count.
+        small, _ = self.list_queries()
+        self.create_events(50, category=self.category)
+        large, response = self.list_queries()
+        self.assertEqual(small, large)
+        self.assertEqual(len(response.data['results']), 52)
+
+    def test_slow_path_matches_fast_path(self):
+        fast = self.client.get(reverse('event-list'), {'expand': 'category'})
+        get_cache().clear()
+        with mock.patch.object(EventViewSet, 'fast_list', False):
+            with self.assertNumQueries(2):
+                slow = self.client.get(reverse('event-list'), {'expand': 'category'})
+        self.assertEqual(fast.content, slow.content)
+
+    def test_detail_expands_category(self):
+        response = self.client.get(reverse('event-detail', kwargs={'pk': self.event.pk}), {'expand': 'category'})
+        self.assertEqual(response.data['category']['name'], "Work")
+
+    def test_unknown_expand(self):
+        response = self.client.get(reverse('event-list'), {'expand': 'user'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,78 @@
+from unittest import mock
+from accounts.models import CustomUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events import renderers
+from events.caching import get_cache
+from events.models import Event, Category
+from events.renderers import FastJSONRenderer
+from events.serializers import EventSerializer, EventRowSerializer
+from events.views import EventViewSet
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class FastSerializationTests(APITestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0, 123456))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        Event.objects.create(title="Plain", startDate=start, endDate=end, user=self.user)
+        Event.objects.create(
+            title="Ünïcode   title",
+            description="Description",
+            startDate=start,
+            endDate=end,
+            category=self.category,
+            recurrence='weekly',
+            recurrenceCount=3,
+            recurrenceExceptions=["2025-06-24T10:00:00.123456+00:00"],
+            user=self.user
+        )
+        Event.objects.create(
+            title="Until",
+            startDate=start,
+            endDate=end,
+            recurrence='monthly',
+            recurrenceUntil=end + datetime.timedelta(days=90),
+            user=self.user
+        )
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_row_serializer_output_is_byte_identical(self):
+        queryset = Event.objects.filter(user=self.user).order_by('startDate', 'id')
+        row_serializer = EventRowSerializer()
+        expected = JSONRenderer().render(EventSerializer(queryset, many=True).data)
+        self.assertIsNotNone(renderers.orjson)
+        actual = FastJSONRenderer().render(row_serializer.serialize(queryset.values(*row_serializer.value_fields)))
+        self.assertEqual(actual, expected)
+
+    def test_row_serializer_output_is_byte_identical_without_orjson(self):
+        queryset = Event.objects.filter(user=self.user).order_by('startDate', 'id')
+        row_serializer = EventRowSerializer()
+        expected = JSONRenderer().render(EventSerializer(queryset, many=True).data)
+        with mock.patch.object(renderers, 'orjson', None):
+            actual = FastJSONRenderer().render(row_serializer.serialize(queryset.values(*row_serializer.value_fields)))
+        self.assertEqual(actual, expected)
+
+    def test_renderer_escapes_line_separators_like_json_renderer(self):
+        data = {'title': 'a\u2028b\u2029c', 'when': timezone.now(), 'count': 3, 'none': None}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_list_endpoint_is_byte_identical(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        fast = self.client.get(reverse('event-list'), {'page_size': 2})
+        get_cache().clear()
+        with mock.patch.object(EventViewSet, 'fast_list', False):
+            slow = self.client.get(reverse('event-list'), {'page_size': 2})
+        self.assertEqual(fast.content, slow.content)
@@ -0,0 +1,60 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event
+from events.intervals import merge_intervals
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+def at(day, hour):
+    return timezone.make_aware(datetime.datetime(2025, 6, day, hour, 0, 0))
+
+class FreeBusyTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.user2 = CustomUser.objects.create_user(email='testuser2@example.com', password='testpass123', is_active=True)
+        for start, end in [(at(17, 9), at(17, 11)), (at(17, 10), at(17, 12)), (at(17, 12), at(17, 13)), (at(17, 15), at(17, 16)), (at(16, 22), at(17, 1))]:
+            Event.objects.create(title="Busy", startDate=start, endDate=end, user=self.user)
+        Event.objects.create(title="Other", startDate=at(17, 13), endDate=at(17, 15), user=self.user2)
+        self.url = reverse('event-freebusy')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_merge_intervals(self):
+        self.assertEqual(list(merge_intervals([(1, 3), (2, 4), (4, 5), (7, 8), (7, 7)])), [(1, 5), (7, 8)])
+        self.assertEqual(list(merge_intervals([])), [])
+
+    def test_freebusy_authenticated(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(self.url, {'start': '2025-06-17T00:00:00Z', 'end': '2025-06-18T00:00:00Z'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['busy'], [
+            {'start': at(17, 0), 'end': at(17, 1)},
+            {'start': at(17, 9), 'end': at(17, 13)},
+            {'start': at(17, 15), 'end': at(17, 16)},
+        ])
+
+    def test_freebusy_requires_window(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(self.url, {'start': '2025-06-17T00:00:00Z'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('end', response.data)
+
+    def test_freebusy_window_is_capped(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(self.url, {'start': '2025-01-01T00:00:00Z', 'end': '2026-06-01T00:00:00Z'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    def test_freebusy_unauthenticated(self):
+        response = self.client.get(self.url, {'start': '2025-06-17', 'end': '2025-06-18'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
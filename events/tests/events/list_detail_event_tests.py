@@ -35,9 +35,9 @@ class ListDetailEventTests(APITestCase):
         response = self.client.get(reverse('event-list'), format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], self.event.title)
-        self.assertEqual(str(response.data[0]['category']), str(self.category.id))
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], self.event.title)
+        self.assertEqual(str(response.data['results'][0]['category']), str(self.category.id))
     
     def test_list_events_unauthenticated(self):
         response = self.client.get(reverse('event-list'), format='json')
@@ -49,7 +49,7 @@ class ListDetailEventTests(APITestCase):
         response = self.client.get(reverse('event-list'), format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
     
     def test_detail_event_authenticated(self):
         access_token = self.get_token_for_user(self.user)
@@ -71,3 +71,36 @@ class ListDetailEventTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+
+    def test_list_events_window_overlap(self):
+        Event.objects.create(
+            title="Next Week Event",
+            startDate=timezone.make_aware(datetime.datetime(2025, 6, 24, 10, 0, 0)),
+            endDate=timezone.make_aware(datetime.datetime(2025, 6, 24, 11, 0, 0)),
+            user=self.user
+        )
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(reverse('event-list'), {'start': '2025-06-17T11:00:00Z', 'end': '2025-06-18T00:00:00Z'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], self.event.title)
+
+    def test_list_events_window_excludes_touching_events(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(reverse('event-list'), {'start': '2025-06-17T12:00:00Z', 'end': '2025-06-18'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_list_events_window_invalid(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(reverse('event-list'), {'start': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('start', response.data)
+
+        response = self.client.get(reverse('event-list'), {'start': '2025-06-18', 'end': '2025-06-17'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
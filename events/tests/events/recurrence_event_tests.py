@@ -0,0 +1,131 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event
+from events import recurrence
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+def at(year, month, day, hour=10):
+    return timezone.make_aware(datetime.datetime(year, month, day, hour, 0, 0))
+
+class RecurrenceExpansionTests(APITestCase):
+    def setUp(self):
+        recurrence.clear_cache()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+
+    def create_series(self, **kwargs):
+        return Event.objects.create(
+            title="Standup",
+            startDate=kwargs.pop('startDate', at(2025, 6, 2)),
+            endDate=kwargs.pop('endDate', at(2025, 6, 2, 11)),
+            user=self.user,
+            **kwargs
+        )
+
+    def test_weekly_with_count(self):
+        event = self.create_series(recurrence='weekly', recurrenceCount=3)
+        occurrences = recurrence.expand(event, at(2025, 1, 1), at(2026, 1, 1))
+        self.assertEqual([start for start, _ in occurrences], [at(2025, 6, 2), at(2025, 6, 9), at(2025, 6, 16)])
+        self.assertEqual(event.recurrenceEnd, at(2025, 6, 16, 11))
+
+    def test_daily_only_expands_window(self):
+        event = self.create_series(recurrence='daily', recurrenceInterval=2)
+        occurrences = recurrence.expand(event, at(2030, 1, 1, 0), at(2030, 1, 5, 0))
+        self.assertEqual(len(occurrences), 2)
+        self.assertIsNone(event.recurrenceEnd)
+
+    def test_monthly_until_clamps_day(self):
+        event = self.create_series(
+            startDate=at(2025, 1, 31), endDate=at(2025, 1, 31, 11),
+            recurrence='monthly', recurrenceUntil=at(2025, 4, 30, 23),
+        )
+        occurrences = recurrence.expand(event, at(2025, 1, 1), at(2026, 1, 1))
+        self.assertEqual([start for start, _ in occurrences], [at(2025, 1, 31), at(2025, 2, 28), at(2025, 3, 31), at(2025, 4, 30)])
+
+    def test_exceptions_are_skipped(self):
+        event = self.create_series(recurrence='weekly', recurrenceExceptions=[at(2025, 6, 9).isoformat()])
+        occurrences = recurrence.expand(event, at(2025, 6, 1), at(2025, 6, 20))
+        self.assertEqual([start for start, _ in occurrences], [at(2025, 6, 2), at(2025, 6, 16)])
+
+    def test_series_keeps_local_time_across_dst(self):
+        # 09:00 in Madrid is 07:00 UTC in summer (CEST) and 08:00 UTC in winter (CET).
+        event = self.create_series(
+            startDate=at(2025, 10, 20, 7), endDate=at(2025, 10, 20, 8),
+            recurrence='weekly', recurrenceCount=3, recurrenceTimezone='Europe/Madrid',
+        )
+        occurrences = recurrence.expand(event, at(2025, 10, 1), at(2025, 12, 1))
+        self.assertEqual([start for start, _ in occurrences], [at(2025, 10, 20, 7), at(2025, 10, 27, 8), at(2025, 11, 3, 8)])
+        self.assertEqual(event.recurrenceEnd, at(2025, 11, 3, 9))
+
+    def test_series_without_timezone_repeats_in_utc(self):
+        event = self.create_series(startDate=at(2025, 10, 20, 7), endDate=at(2025, 10, 20, 8), recurrence='weekly')
+        occurrences = recurrence.expand(event, at(2025, 10, 26), at(2025, 10, 28))
+        self.assertEqual([start for start, _ in occurrences], [at(2025, 10, 27, 7)])
+
+    def test_expansion_is_cached_per_window(self):
+        event = self.create_series(recurrence='daily')
+        recurrence.expand(event, at(2025, 6, 1), at(2025, 7, 1))
+        recurrence.expand(event, at(2025, 6, 1), at(2025, 7, 1))
+        self.assertEqual(recurrence._expand.cache_info().hits, 1)
+
+
+class RecurrenceApiTests(APITestCase):
+    def setUp(self):
+        recurrence.clear_cache()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.series_data = {
+            "title": "Weekly sync",
+            "startDate": "2025-06-02T10:00:00Z",
+            "endDate": "2025-06-02T11:00:00Z",
+            "recurrence": "weekly",
+            "recurrenceExceptions": ["2025-06-16T10:00:00Z"],
+        }
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_create_series_and_list_occurrences(self):
+        response = self.client.post(reverse('event-list'), self.series_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Event.objects.count(), 1)
+
+        response = self.client.get(reverse('event-occurrences'), {'start': '2025-06-01', 'end': '2025-06-30'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [occurrence['startDate'] for occurrence in response.data],
+            ["2025-06-02T10:00:00Z", "2025-06-09T10:00:00Z", "2025-06-23T10:00:00Z"],
+        )
+
+    def test_occurrences_window_is_capped(self):
+        self.client.post(reverse('event-list'), self.series_data, format='json')
+        response = self.client.get(reverse('event-occurrences'), {'start': '2025-01-01', 'end': '2125-01-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    def test_series_listed_in_later_window(self):
+        self.client.post(reverse('event-list'), self.series_data, format='json')
+        response = self.client.get(reverse('event-list'), {'start': '2026-01-01', 'end': '2026-02-01'})
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_series_included_in_freebusy(self):
+        self.client.post(reverse('event-list'), self.series_data, format='json')
+        response = self.client.get(reverse('event-freebusy'), {'start': '2025-06-09', 'end': '2025-06-10'})
+        self.assertEqual(response.data['busy'], [{'start': at(2025, 6, 9), 'end': at(2025, 6, 9, 11)}])
+
+    def test_unknown_recurrence_timezone(self):
+        data = {**self.series_data, "recurrenceTimezone": "Mars/Olympus"}
+        response = self.client.post(reverse('event-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('recurrenceTimezone', response.data)
+
+    def test_count_and_until_are_exclusive(self):
+        data = {**self.series_data, "recurrenceCount": 3, "recurrenceUntil": "2025-07-01T00:00:00Z"}
+        response = self.client.post(reverse('event-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,129 @@
+import asyncio
+import json
+from unittest import mock
+from accounts.models import CustomUser
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.async_views import AsyncEventFeedView
+from events.feed import RESYNC, ChangeBroker, TooManySubscriptions, broker
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+
+class ChangeBrokerTests(SimpleTestCase):
+    async def test_fan_out_per_user(self):
+        changes = ChangeBroker(queue_size=10, max_per_user=5)
+        first, second, other = changes.subscribe(1), changes.subscribe(1), changes.subscribe(2)
+        await sync_to_async(changes.publish)(1, {'type': 'change'})
+        self.assertEqual(await first.get(1), {'type': 'change'})
+        self.assertEqual(await second.get(1), {'type': 'change'})
+        self.assertIsNone(await other.get(0.01))
+
+    async def test_overflow_drops_and_asks_for_resync(self):
+        changes = ChangeBroker(queue_size=3, max_per_user=5)
+        subscription = changes.subscribe(1)
+        for number in range(10):
+            changes.publish(1, {'type': 'change', 'number': number})
+        await asyncio.sleep(0)
+        self.assertIs(await subscription.get(1), RESYNC)
+        self.assertIsNone(await subscription.get(0.01))
+        self.assertEqual(changes.stats()['dropped'], 10)
+        changes.publish(1, {'type': 'change', 'number': 10})
+        self.assertEqual((await subscription.get(1))['number'], 10)
+
+    async def test_connection_limit_and_unsubscribe(self):
+        changes = ChangeBroker(queue_size=3, max_per_user=1)
+        subscription = changes.subscribe(1)
+        with self.assertRaises(TooManySubscriptions):
+            changes.subscribe(1)
+        subscription.close()
+        self.assertEqual(changes.stats()['subscriptions'], 0)
+        changes.subscribe(1)
+
+
+class ChangePublishingTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+
+    def test_writes_publish_after_commit(self):
+        with mock.patch.object(broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                event = Event.objects.create(title="Event", startDate=self.start, endDate=self.start, user=self.user)
+                event_id = event.pk
+                self.assertFalse(publish.called)
+            with self.captureOnCommitCallbacks(execute=True):
+                event.save()
+                category = Category.objects.create(name="Work", user=self.user)
+                event.delete()
+        actions = [(call.args[1]['model'], call.args[1]['action']) for call in publish.call_args_list]
+        self.assertEqual(actions, [('event', 'created'), ('event', 'updated'), ('category', 'created'), ('event', 'deleted')])
+        self.assertEqual(publish.call_args_list[0].args[0], self.user.pk)
+        self.assertEqual(publish.call_args_list[3].args[1]['id'], str(event_id))
+        self.assertEqual(publish.call_args_list[2].args[1]['id'], str(category.pk))
+
+    def test_bulk_writes_publish_resync(self):
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        payload = {'create': [{'title': "Bulk", 'startDate': '2025-06-17T10:00:00Z', 'endDate': '2025-06-17T11:00:00Z'}]}
+        with mock.patch.object(broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse('event-bulk'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        publish.assert_called_once_with(self.user.pk, RESYNC)
+
+
+class FeedStreamTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.url = reverse('async-event-feed')
+
+    async def disconnect(self, stream):
+        # ASGI servers report a disconnect by cancelling the task reading the stream.
+        reader = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        reader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await reader
+
+    async def open_feed(self):
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Bearer {self.token}'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        return response, aiter(response.streaming_content)
+
+    async def test_stream_delivers_changes(self):
+        response, stream = await self.open_feed()
+        self.assertIn(b'event: ready', await anext(stream))
+        message = {'type': 'change', 'model': 'event', 'id': 'x', 'action': 'created'}
+        await sync_to_async(broker.publish)(self.user.pk, message)
+        frame = (await asyncio.wait_for(anext(stream), 1)).decode()
+        self.assertTrue(frame.startswith('event: change\ndata: '))
+        self.assertEqual(json.loads(frame.split('data: ', 1)[1]), message)
+        await self.disconnect(stream)
+        self.assertEqual(broker.stats()['subscriptions'], 0)
+
+    async def test_heartbeat(self):
+        with mock.patch.object(AsyncEventFeedView, 'heartbeat', 0.01):
+            response, stream = await self.open_feed()
+            await anext(stream)
+            self.assertEqual(await asyncio.wait_for(anext(stream), 1), b': keepalive\n\n')
+            await self.disconnect(stream)
+
+    async def test_connection_limit(self):
+        with mock.patch.object(broker, 'max_per_user', 1):
+            response, stream = await self.open_feed()
+            await anext(stream)
+            second = await self.async_client.get(self.url, headers={'Authorization': f'Bearer {self.token}'})
+            self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            await self.disconnect(stream)
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
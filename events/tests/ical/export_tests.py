@@ -0,0 +1,86 @@
+from accounts.models import CustomUser
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, Category
+from events.ical import fold
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class ICalendarExportTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.user2 = CustomUser.objects.create_user(email='testuser2@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        self.event = Event.objects.create(
+            title="Lunch; with, friends",
+            description="Line one\nLine two",
+            startDate=start,
+            endDate=end,
+            category=self.category,
+            user=self.user
+        )
+        self.series = Event.objects.create(title="Standup", startDate=start, endDate=end, recurrence='weekly', recurrenceCount=4, user=self.user)
+        Event.objects.create(title="Not mine", startDate=start, endDate=end, user=self.user2)
+        self.url = reverse('event-export')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def export(self, **kwargs):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(self.url, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        return b''.join(response.streaming_content).decode()
+
+    def test_export_streams_vevents(self):
+        body = self.export(HTTP_ACCEPT='text/calendar')
+        self.assertTrue(body.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(body.count('BEGIN:VEVENT'), 2)
+        self.assertIn('SUMMARY:Lunch\\; with\\, friends\r\n', body)
+        self.assertIn('DESCRIPTION:Line one\\nLine two\r\n', body)
+        self.assertIn('CATEGORIES:Work\r\n', body)
+        self.assertIn('DTSTART:20250617T100000Z\r\n', body)
+        self.assertIn('RRULE:FREQ=WEEKLY;INTERVAL=1;COUNT=4\r\n', body)
+        self.assertNotIn('Not mine', body)
+
+    def test_export_series_in_its_timezone(self):
+        self.series.recurrenceTimezone = 'Europe/Madrid'
+        self.series.save()
+        body = self.export()
+        self.assertIn('DTSTART;TZID=Europe/Madrid:20250617T120000\r\n', body)
+        self.assertIn('DTEND;TZID=Europe/Madrid:20250617T140000\r\n', body)
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        access_token = await sync_to_async(self.get_token_for_user)(self.user)
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(body.count('BEGIN:VEVENT'), 2)
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+
+    def test_export_window(self):
+        body = self.export(data={'start': '2025-07-01', 'end': '2025-07-02'})
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+        self.assertIn('SUMMARY:Standup', body)
+
+    def test_export_unauthenticated(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_fold_long_lines(self):
+        folded = fold('DESCRIPTION:' + 'é' * 100)
+        for line in folded.split('\r\n')[:-1]:
+            self.assertLessEqual(len(line.encode('utf-8')), 75)
+        self.assertEqual(folded.replace('\r\n ', ''), 'DESCRIPTION:' + 'é' * 100 + '\r\n')
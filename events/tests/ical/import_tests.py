@@ -0,0 +1,139 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.urls import reverse
+from events.models import Event, Category
+from events.importer import import_calendar
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+import io
+import tempfile
+from unittest import mock
+
+ICS = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VEVENT\r
+UID:one@example.com\r
+DTSTART:20250617T100000Z\r
+DTEND:20250617T120000Z\r
+SUMMARY:Lunch\\, with friends\r
+DESCRIPTION:A long description that has been folded by the exporter so it\r
+  spans two lines\r
+CATEGORIES:Work\r
+BEGIN:VALARM\r
+TRIGGER:-PT15M\r
+DESCRIPTION:Reminder\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:two@example.com\r
+DTSTART;TZID=Europe/Madrid:20250618T090000\r
+DURATION:PT30M\r
+SUMMARY:Standup\r
+RRULE:FREQ=WEEKLY;BYDAY=WE;COUNT=10\r
+EXDATE:20250625T070000Z\r
+CATEGORIES:Work\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:broken@example.com\r
+SUMMARY:No start\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:yearly@example.com\r
+DTSTART;VALUE=DATE:20250101\r
+SUMMARY:New year\r
+RRULE:FREQ=YEARLY\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+class ICalendarImportTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.url = reverse('event-import')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_import_maps_events_and_reports_errors(self):
+        result = import_calendar(self.user, io.BytesIO(ICS.encode()), batch_size=1)
+
+        self.assertEqual(result['imported'], 2)
+        self.assertEqual([error['index'] for error in result['errors']], [2, 3])
+        self.assertEqual(Category.objects.filter(user=self.user, name="Work").count(), 1)
+
+        lunch = Event.objects.get(title="Lunch, with friends")
+        self.assertEqual(lunch.description, "A long description that has been folded by the exporter so it spans two lines")
+        self.assertEqual(lunch.category.name, "Work")
+
+        standup = Event.objects.get(title="Standup")
+        self.assertEqual(standup.startDate, timezone.make_aware(datetime.datetime(2025, 6, 18, 7, 0, 0)))
+        self.assertEqual(standup.endDate - standup.startDate, datetime.timedelta(minutes=30))
+        self.assertEqual(standup.recurrence, 'weekly')
+        self.assertEqual(standup.recurrenceCount, 10)
+        self.assertEqual(standup.recurrenceTimezone, 'Europe/Madrid')
+        self.assertEqual(standup.recurrenceExceptions, ["2025-06-25T07:00:00+00:00"])
+        self.assertIsNotNone(standup.recurrenceEnd)
+
+    def test_invalid_interval_and_count_are_reported(self):
+        rules = ['FREQ=DAILY;INTERVAL=0', 'FREQ=DAILY;INTERVAL=-1', 'FREQ=DAILY;COUNT=0', 'FREQ=WEEKLY;COUNT=ten']
+        ics = ''.join(
+            f"BEGIN:VEVENT\r\nUID:{index}\r\nDTSTART:20250618T090000Z\r\nSUMMARY:Bad\r\nRRULE:{rule}\r\nEND:VEVENT\r\n"
+            for index, rule in enumerate(rules)
+        )
+        result = import_calendar(self.user, io.BytesIO(ics.encode()))
+
+        self.assertEqual(result['imported'], 0)
+        self.assertEqual([error['index'] for error in result['errors']], [0, 1, 2, 3])
+        self.assertIn('INTERVAL', result['errors'][0]['error'])
+        self.assertIn('COUNT', result['errors'][3]['error'])
+
+    def test_failed_batch_is_reported_and_later_batches_continue(self):
+        bulk_create = Event.objects.bulk_create
+        batches = []
+
+        def fail_first_batch(batch):
+            batches.append(batch)
+            if len(batches) == 1:
+                raise IntegrityError('CHECK constraint failed')
+            return bulk_create(batch)
+
+        with mock.patch.object(Event.objects, 'bulk_create', side_effect=fail_first_batch):
+            result = import_calendar(self.user, io.BytesIO(ICS.encode()), batch_size=1)
+
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual([error['index'] for error in result['errors']], [0, 2, 3])
+        self.assertIn('CHECK constraint failed', result['errors'][0]['error'])
+        # The category rolled back with the first batch was created by the second.
+        self.assertEqual(Event.objects.get(user=self.user).category.name, "Work")
+
+    def test_import_endpoint(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        upload = SimpleUploadedFile("calendar.ics", ICS.encode(), content_type="text/calendar")
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['imported'], 2)
+        self.assertEqual(len(response.data['errors']), 2)
+        self.assertEqual(Event.objects.filter(user=self.user).count(), 2)
+
+    def test_import_endpoint_requires_file(self):
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.post(self.url, {}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_command(self):
+        with tempfile.NamedTemporaryFile(suffix='.ics') as stream:
+            stream.write(ICS.encode())
+            stream.flush()
+            out = io.StringIO()
+            call_command('import_ics', stream.name, user=self.user.email, stdout=out, stderr=io.StringIO())
+        self.assertIn("Imported 2 events, 2 errors.", out.getvalue())
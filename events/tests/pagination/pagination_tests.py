@@ -0,0 +1,62 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        for i in range(5):
+            Event.objects.create(
+                title=f"Event {i}",
+                startDate=start + datetime.timedelta(days=i),
+                endDate=start + datetime.timedelta(days=i, hours=1),
+                user=self.user
+            )
+        # Two events sharing a start date must not be skipped or repeated across pages.
+        Event.objects.create(title="Event 2b", startDate=start + datetime.timedelta(days=2), endDate=start + datetime.timedelta(days=2, hours=2), user=self.user)
+        for name in ["Work", "Home", "Gym"]:
+            Category.objects.create(name=name, user=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def collect(self, url, params):
+        items = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            items.extend(response.data['results'])
+            if not response.data['next']:
+                return items
+            response = self.client.get(response.data['next'])
+
+    def test_events_paginated_by_start_date(self):
+        events = self.collect(reverse('event-list'), {'page_size': 2})
+        self.assertEqual(len(events), 6)
+        self.assertEqual(len({event['id'] for event in events}), 6)
+        starts = [event['startDate'] for event in events]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_page_size_respected(self):
+        response = self.client.get(reverse('event-list'), {'page_size': 4})
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_categories_paginated_by_name(self):
+        categories = self.collect(reverse('category-list'), {'page_size': 1})
+        self.assertEqual([category['name'] for category in categories], ["Gym", "Home", "Work"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('event-list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,101 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, CalendarShare
+from events.scheduling import free_slots
+from rest_framework_simplejwt.tokens import RefreshToken
+import datetime
+
+UTC = datetime.timezone.utc
+
+
+def at(day, hour, minute=0):
+    return datetime.datetime(2025, 6, day, hour, minute, tzinfo=UTC)
+
+
+class FreeSlotsTests(SimpleTestCase):
+    def test_slots_skip_busy_intervals_on_the_step_grid(self):
+        busy = [(at(16, 9, 10), at(16, 10, 5)), (at(16, 11), at(16, 12))]
+        windows = [(at(16, 9), at(16, 13))]
+        slots = free_slots(busy, windows, datetime.timedelta(hours=1), datetime.timedelta(minutes=30))
+        self.assertEqual([slot_start for slot_start, _ in slots], [at(16, 12)])
+
+    def test_busy_interval_spanning_windows(self):
+        busy = [(at(16, 16), at(17, 10))]
+        windows = [(at(16, 9), at(16, 17)), (at(17, 9), at(17, 17))]
+        slots = list(free_slots(busy, windows, datetime.timedelta(hours=1), datetime.timedelta(hours=1)))
+        self.assertEqual(slots[6:8], [(at(16, 15), at(16, 16)), (at(17, 10), at(17, 11))])
+
+
+class FindTimeTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.alice = CustomUser.objects.create_user(email='alice@example.com', password='testpass123', is_active=True)
+        self.bob = CustomUser.objects.create_user(email='bob@example.com', password='testpass123', is_active=True)
+        CalendarShare.objects.create(owner=self.alice, sharedWith=self.user)
+        CalendarShare.objects.create(owner=self.bob, sharedWith=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.url = reverse('event-find-time')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def busy(self, user, start, end, **kwargs):
+        Event.objects.create(title="Busy", startDate=start, endDate=end, user=user, **kwargs)
+
+    def find(self, **data):
+        payload = {
+            'users': ['alice@example.com', 'bob@example.com'],
+            'start': '2025-06-16T00:00:00Z',  # Monday
+            'end': '2025-06-21T00:00:00Z',
+            'duration': 60,
+            'count': 3,
+            **data,
+        }
+        return self.client.post(self.url, payload, format='json')
+
+    def slot_starts(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [slot['start'] for slot in response.data['slots']]
+
+    def test_earliest_common_slots(self):
+        self.busy(self.user, at(16, 9), at(16, 10))
+        self.busy(self.alice, at(16, 9, 30), at(16, 11))
+        self.busy(self.bob, at(16, 12), at(16, 13))
+        self.assertEqual(self.slot_starts(self.find()), [at(16, 11), at(16, 13), at(16, 13, 30)])
+
+    def test_working_hours_weekdays_and_timezone(self):
+        response = self.find(workStart='10:00', workEnd='12:00', weekdays=[3], timeZone='Europe/Madrid', count=2)
+        # Wednesday 10:00 in Madrid is 08:00 UTC.
+        self.assertEqual(self.slot_starts(response), [at(18, 8), at(18, 8, 30)])
+
+    def test_recurring_events_are_busy(self):
+        self.busy(self.alice, at(16, 9), at(16, 17), recurrence='daily', recurrenceCount=4)
+        self.assertEqual(self.slot_starts(self.find(count=1)), [at(20, 9)])
+
+    def test_include_self(self):
+        self.busy(self.user, at(16, 9), at(16, 17))
+        self.assertEqual(self.slot_starts(self.find(count=1, includeSelf=False)), [at(16, 9)])
+        self.assertEqual(self.slot_starts(self.find(count=1)), [at(17, 9)])
+
+    def test_no_slots_when_everyone_is_busy(self):
+        self.busy(self.bob, at(15, 0), at(21, 0))
+        self.assertEqual(self.slot_starts(self.find()), [])
+
+    def test_calendar_must_be_shared(self):
+        carol = CustomUser.objects.create_user(email='carol@example.com', password='testpass123', is_active=True)
+        CalendarShare.objects.create(owner=self.user, sharedWith=carol)
+        response = self.find(users=['alice@example.com', 'carol@example.com'])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('carol@example.com', response.data['users'][0])
+
+    def test_invalid_parameters(self):
+        for data in ({'users': []}, {'duration': 0}, {'end': '2025-06-15T00:00:00Z'}, {'end': '2025-12-31T00:00:00Z'},
+                     {'workStart': '18:00'}, {'weekdays': [8]}, {'timeZone': 'Mars/Base'}):
+            response = self.find(**data)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
@@ -0,0 +1,47 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import CalendarShare
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class CalendarShareTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.alice = CustomUser.objects.create_user(email='alice@example.com', password='testpass123', is_active=True)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_share_list_and_revoke(self):
+        response = self.client.post(reverse('share-list'), {'sharedWith': 'alice@example.com'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['sharedWith'], 'alice@example.com')
+        response = self.client.get(reverse('share-list'))
+        self.assertEqual([share['sharedWith'] for share in response.data], ['alice@example.com'])
+        share_id = response.data[0]['id']
+        response = self.client.delete(reverse('share-detail', kwargs={'pk': share_id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(CalendarShare.objects.exists())
+
+    def test_received_shares(self):
+        CalendarShare.objects.create(owner=self.alice, sharedWith=self.user)
+        response = self.client.get(reverse('share-received'))
+        self.assertEqual([share['owner'] for share in response.data], ['alice@example.com'])
+        self.assertEqual(self.client.get(reverse('share-list')).data, [])
+
+    def test_cannot_revoke_someone_elses_share(self):
+        share = CalendarShare.objects.create(owner=self.alice, sharedWith=self.user)
+        response = self.client.delete(reverse('share-detail', kwargs={'pk': share.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_shares(self):
+        CalendarShare.objects.create(owner=self.user, sharedWith=self.alice)
+        for email in ('alice@example.com', 'testuser@example.com', 'nobody@example.com'):
+            response = self.client.post(reverse('share-list'), {'sharedWith': email}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, email)
@@ -0,0 +1,102 @@
+from unittest import mock
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events import search
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", color="#ff0000", user=self.user)
+        self.start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.url = reverse('event-search')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def create_event(self, title, description=None, days=0, **kwargs):
+        start = self.start + datetime.timedelta(days=days)
+        return Event.objects.create(title=title, description=description, startDate=start, endDate=start + datetime.timedelta(hours=1), user=self.user, **kwargs)
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [event['title'] for event in response.data['results']]
+
+    def test_index_is_installed(self):
+        self.assertTrue(search.fts_available(search.connections['default']))
+
+    def test_title_matches_rank_above_description(self):
+        self.create_event("Lunch", description="Dentist appointment afterwards")
+        self.create_event("Dentist")
+        self.create_event("Gym")
+        self.assertEqual(self.search(q='dentist'), ["Dentist", "Lunch"])
+
+    def test_all_terms_must_match_and_last_is_prefix(self):
+        self.create_event("Team planning meeting")
+        self.create_event("Team lunch")
+        self.assertEqual(self.search(q='team plan'), ["Team planning meeting"])
+
+    def test_diacritics_and_punctuation(self):
+        self.create_event("Reunión de café")
+        self.assertEqual(self.search(q='reunion "cafe'), ["Reunión de café"])
+
+    def test_index_follows_updates_and_deletes(self):
+        event = self.create_event("Dentist")
+        event.title = "Doctor"
+        event.save()
+        self.assertEqual(self.search(q='dentist'), [])
+        self.assertEqual(self.search(q='doctor'), ["Doctor"])
+        event.delete()
+        self.assertEqual(self.search(q='doctor'), [])
+
+    def test_bulk_created_events_are_indexed(self):
+        Event.objects.bulk_create([
+            Event(title=f"Standup {i}", startDate=self.start, endDate=self.start, user=self.user) for i in range(3)
+        ])
+        self.assertEqual(len(self.search(q='standup')), 3)
+
+    def test_window_category_and_limit(self):
+        self.create_event("Review early", days=0, category=self.category)
+        self.create_event("Review late", days=10, category=self.category)
+        self.create_event("Review other", days=0)
+        self.assertCountEqual(self.search(q='review', end='2025-06-20'), ["Review early", "Review other"])
+        self.assertCountEqual(self.search(q='review', category=str(self.category.id)), ["Review early", "Review late"])
+        self.assertEqual(len(self.search(q='review', limit=1)), 1)
+
+    def test_only_own_events(self):
+        other = CustomUser.objects.create_user(email='other@example.com', password='testpass123', is_active=True)
+        Event.objects.create(title="Dentist", startDate=self.start, endDate=self.start, user=other)
+        self.assertEqual(self.search(q='dentist'), [])
+
+    def test_fallback_without_index(self):
+        self.create_event("Lunch", description="Dentist appointment afterwards")
+        self.create_event("Dentist", days=1)
+        with mock.patch.object(search, 'fts_available', return_value=False):
+            self.assertEqual(self.search(q='dentist'), ["Lunch", "Dentist"])
+
+    def test_invalid_parameters(self):
+        for params in ({}, {'q': '  ?! '}, {'q': 'x', 'category': 'nope'}, {'q': 'x', 'limit': '0'}, {'q': 'x', 'limit': '1000'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_index_survives_vacuum_renumbering_rowids(self):
+        for title in ("Gym", "Dentist", "Lunch"):
+            self.create_event(title)
+        Event.objects.filter(title="Gym").delete()
+        connection = search.connections['default']
+        with connection.cursor() as cursor:
+            # VACUUM cannot run inside the test transaction; renumber the way it may.
+            cursor.execute("UPDATE events_event SET rowid = rowid + 1000")
+        self.assertEqual(self.search(q='dentist'), ["Dentist"])
+        self.assertEqual(self.search(q='lunch'), ["Lunch"])
@@ -0,0 +1,120 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.urls import reverse
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+
+UTC = datetime.timezone.utc
+
+
+class SummaryTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", color="#ff0000", user=self.user)
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.url = reverse('event-summary')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def create_event(self, start, end, **kwargs):
+        return Event.objects.create(title="Event", startDate=start, endDate=end, user=self.user, **kwargs)
+
+    def get_days(self, **params):
+        response = self.client.get(self.url, {'start': '2025-06-01', 'end': '2025-06-30', **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {str(day['date']): day for day in response.data['days']}
+
+    def test_groups_by_day_and_category(self):
+        self.create_event(datetime.datetime(2025, 6, 2, 9, tzinfo=UTC), datetime.datetime(2025, 6, 2, 10, tzinfo=UTC), category=self.category)
+        self.create_event(datetime.datetime(2025, 6, 2, 11, tzinfo=UTC), datetime.datetime(2025, 6, 2, 11, 30, tzinfo=UTC), category=self.category)
+        self.create_event(datetime.datetime(2025, 6, 2, 14, tzinfo=UTC), datetime.datetime(2025, 6, 2, 14, 15, tzinfo=UTC))
+        days = self.get_days()
+        self.assertEqual(list(days), ['2025-06-02'])
+        self.assertEqual(days['2025-06-02']['count'], 3)
+        self.assertEqual(days['2025-06-02']['minutes'], 105)
+        self.assertEqual(days['2025-06-02']['categories'], [
+            {'category': None, 'count': 1, 'minutes': 15},
+            {'category': self.category.id, 'count': 2, 'minutes': 90},
+        ])
+
+    def test_multi_day_event_is_split(self):
+        self.create_event(datetime.datetime(2025, 6, 3, 22, tzinfo=UTC), datetime.datetime(2025, 6, 5, 2, tzinfo=UTC))
+        days = self.get_days()
+        self.assertEqual({day: (entry['count'], entry['minutes']) for day, entry in days.items()}, {
+            '2025-06-03': (1, 120),
+            '2025-06-04': (1, 1440),
+            '2025-06-05': (1, 120),
+        })
+
+    def test_event_ending_at_midnight_stays_on_its_day(self):
+        self.create_event(datetime.datetime(2025, 6, 3, 23, tzinfo=UTC), datetime.datetime(2025, 6, 4, 0, tzinfo=UTC))
+        self.assertEqual(list(self.get_days()), ['2025-06-03'])
+
+    def test_days_follow_the_requested_timezone(self):
+        # 23:30 UTC on June 2nd is already June 3rd in Madrid (UTC+2).
+        self.create_event(datetime.datetime(2025, 6, 2, 23, 30, tzinfo=UTC), datetime.datetime(2025, 6, 2, 23, 45, tzinfo=UTC))
+        self.assertEqual(list(self.get_days()), ['2025-06-02'])
+        self.assertEqual(list(self.get_days(tz='Europe/Madrid')), ['2025-06-03'])
+
+    def test_spring_forward_day_is_23_hours(self):
+        self.create_event(datetime.datetime(2025, 3, 29, 22, tzinfo=UTC), datetime.datetime(2025, 3, 31, 2, tzinfo=UTC))
+        days = self.get_days(start='2025-03-01', end='2025-03-31', tz='Europe/Madrid')
+        self.assertEqual({day: entry['minutes'] for day, entry in days.items()}, {
+            '2025-03-29': 60,
+            '2025-03-30': 1380,
+            '2025-03-31': 240,
+        })
+
+    def test_fall_back_day_is_25_hours(self):
+        self.create_event(datetime.datetime(2025, 10, 25, 21, tzinfo=UTC), datetime.datetime(2025, 10, 27, 1, tzinfo=UTC))
+        days = self.get_days(start='2025-10-01', end='2025-10-31', tz='Europe/Madrid')
+        self.assertEqual({day: entry['minutes'] for day, entry in days.items()}, {
+            '2025-10-25': 60,
+            '2025-10-26': 1500,
+            '2025-10-27': 120,
+        })
+
+    def test_window_clips_days(self):
+        self.create_event(datetime.datetime(2025, 5, 31, 12, tzinfo=UTC), datetime.datetime(2025, 6, 1, 12, tzinfo=UTC))
+        self.create_event(datetime.datetime(2025, 7, 1, 12, tzinfo=UTC), datetime.datetime(2025, 7, 1, 13, tzinfo=UTC))
+        days = self.get_days()
+        self.assertEqual(list(days), ['2025-06-01'])
+        self.assertEqual(days['2025-06-01']['minutes'], 720)
+
+    def test_recurring_series(self):
+        self.create_event(
+            datetime.datetime(2025, 6, 2, 9, tzinfo=UTC), datetime.datetime(2025, 6, 2, 10, tzinfo=UTC),
+            recurrence='weekly', recurrenceCount=3,
+        )
+        days = self.get_days()
+        self.assertEqual(list(days), ['2025-06-02', '2025-06-09', '2025-06-16'])
+        self.assertEqual(days['2025-06-16']['minutes'], 60)
+
+    def test_query_count_does_not_grow_with_events(self):
+        for day in range(1, 29):
+            start = datetime.datetime(2025, 6, day, 9, tzinfo=UTC)
+            self.create_event(start, start + datetime.timedelta(hours=1), category=self.category)
+            self.create_event(start, start + datetime.timedelta(minutes=30))
+        # User lookup, grouped single-day events, spanning events, recurring series.
+        with self.assertNumQueries(4):
+            days = self.get_days()
+        self.assertEqual(len(days), 28)
+
+    def test_only_own_events(self):
+        other = CustomUser.objects.create_user(email='other@example.com', password='testpass123', is_active=True)
+        Event.objects.create(title="Other", startDate=timezone.make_aware(datetime.datetime(2025, 6, 2, 9)), endDate=timezone.make_aware(datetime.datetime(2025, 6, 2, 10)), user=other)
+        self.assertEqual(self.get_days(), {})
+
+    def test_invalid_parameters(self):
+        for params in ({}, {'start': '2025-06-01'}, {'start': 'june', 'end': '2025-06-30'},
+                       {'start': '2025-06-30', 'end': '2025-06-01'}, {'start': '2025-06-01', 'end': '2025-06-30', 'tz': 'Mars/Base'},
+                       {'start': '2020-01-01', 'end': '2025-01-01'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
@@ -0,0 +1,106 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.core.management import call_command
+from django.urls import reverse
+from events.models import Event, Category, Tombstone
+from events.sync import encode_token
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+import io
+
+class SyncTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        end = timezone.make_aware(datetime.datetime(2025, 6, 17, 12, 0, 0))
+        self.event = Event.objects.create(title="Kept", startDate=start, endDate=end, category=self.category, user=self.user)
+        self.doomed = Event.objects.create(title="Doomed", startDate=start, endDate=end, user=self.user)
+        self.url = reverse('event-sync')
+        access_token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_full_then_incremental_sync(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['events']), 2)
+        self.assertEqual(len(response.data['categories']), 1)
+        token = response.data['token']
+
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual(response.data['events'], [])
+        self.assertEqual(response.data['deleted'], {'events': [], 'categories': []})
+        self.assertEqual(response.data['token'], token)
+
+        self.client.patch(reverse('event-detail', kwargs={'pk': self.event.pk}), {'title': 'Renamed'}, format='json')
+        self.client.delete(reverse('event-detail', kwargs={'pk': self.doomed.pk}))
+
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual([event['title'] for event in response.data['events']], ['Renamed'])
+        self.assertEqual(response.data['deleted']['events'], [self.doomed.pk])
+        self.assertEqual(response.data['categories'], [])
+
+        response = self.client.get(self.url, {'since': response.data['token']})
+        self.assertEqual(response.data['events'], [])
+        self.assertEqual(response.data['deleted']['events'], [])
+
+    def test_changes_are_found_by_version_not_clock(self):
+        token = self.client.get(self.url).data['token']
+        self.client.patch(reverse('event-detail', kwargs={'pk': self.event.pk}), {'title': 'Renamed'}, format='json')
+        # A write stamped by a lagging clock, or committed late, is still newer than the token.
+        Event.objects.filter(pk=self.event.pk).update(updatedAt=timezone.now() - datetime.timedelta(days=1))
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual([event['title'] for event in response.data['events']], ['Renamed'])
+
+    def test_category_deletion_recorded(self):
+        token = self.client.get(self.url).data['token']
+        self.client.delete(reverse('category-detail', kwargs={'pk': self.category.pk}))
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual(response.data['deleted']['categories'], [self.category.pk])
+
+    def test_category_deletion_returns_its_uncategorized_events(self):
+        token = self.client.get(self.url).data['token']
+        self.client.delete(reverse('category-detail', kwargs={'pk': self.category.pk}))
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual([event['title'] for event in response.data['events']], ['Kept'])
+        self.assertIsNone(response.data['events'][0]['category'])
+
+        other = Category.objects.create(name="Home", user=self.user)
+        Event.objects.filter(pk=self.event.pk).update(category=other)
+        token = self.client.get(self.url).data['token']
+        Category.objects.filter(pk=other.pk).delete()
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual([event['title'] for event in response.data['events']], ['Kept'])
+        self.assertEqual(response.data['deleted']['categories'], [other.pk])
+
+    def test_user_deletion_leaves_no_tombstones(self):
+        self.user.delete()
+        self.assertEqual(Tombstone.objects.count(), 0)
+
+    def test_invalid_and_expired_tokens(self):
+        response = self.client.get(self.url, {'since': 'garbage'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Tokens from before versions were timestamps; clients must resync.
+        legacy = encode_token(timezone.now().isoformat())
+        response = self.client.get(self.url, {'since': legacy})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_pruning_expires_older_tokens(self):
+        token = self.client.get(self.url).data['token']
+        self.doomed.delete()
+        Tombstone.objects.update(deletedAt=timezone.now() - datetime.timedelta(days=365))
+        call_command('prune_tombstones', stdout=io.StringIO())
+
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        token = self.client.get(self.url).data['token']
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,80 @@
+from accounts.models import CustomUser
+from django.core.management import CommandError, call_command
+from django.db.models import Count, F
+from django.test import TestCase
+from events.models import Event, Category
+from events.synthetic import generate
+import datetime
+import io
+
+
+class GenerateDatasetTests(TestCase):
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def test_generates_requested_volumes(self):
+        totals = generate(30, 1500, seed=1, batch_size=7, start=self.start)
+
+        self.assertEqual(totals['users'], 30)
+        self.assertEqual(totals['events'], 1500)
+        self.assertEqual(CustomUser.objects.filter(email__startswith='synthetic').count(), 30)
+        self.assertEqual(Event.objects.count(), 1500)
+        self.assertEqual(Category.objects.count(), totals['categories'])
+        # Categories always belong to the event's owner.
+        self.assertFalse(Event.objects.exclude(category=None).exclude(category__user=F('user')).exists())
+
+    def test_event_counts_are_skewed(self):
+        generate(50, 5000, seed=2, start=self.start)
+
+        counts = sorted(Event.objects.values('user').annotate(n=Count('id')).values_list('n', flat=True), reverse=True)
+        self.assertGreater(sum(counts[:10]), sum(counts) / 2)
+
+    def test_password_is_hashed_once_and_valid(self):
+        generate(3, 10, password='s3cret-pass', start=self.start)
+
+        users = list(CustomUser.objects.all())
+        self.assertEqual(len({user.password for user in users}), 1)
+        self.assertTrue(all(user.is_active and user.check_password('s3cret-pass') for user in users))
+
+    def test_multi_day_and_recurring_events(self):
+        generate(5, 400, seed=3, start=self.start, multi_day_ratio=0.2, recurring_ratio=0.2)
+
+        multi_day = [event for event in Event.objects.all() if event.endDate - event.startDate >= datetime.timedelta(days=1)]
+        self.assertTrue(multi_day)
+        series = Event.objects.exclude(recurrence=None)
+        self.assertTrue(series.exists())
+        for event in series:
+            self.assertEqual(event.recurrenceEnd, event.compute_recurrence_end())
+
+    def test_same_seed_same_data(self):
+        def snapshot(prefix):
+            generate(4, 60, seed=5, email_prefix=prefix, start=self.start)
+            return list(
+                Event.objects.filter(user__email__startswith=prefix)
+                .order_by('user__email', 'startDate', 'title')
+                .values_list('title', 'startDate', 'endDate', 'recurrence')
+            )
+
+        self.assertEqual(snapshot('first'), snapshot('second'))
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('generate_dataset', users=4, events=40, batch_size=2, stdout=out)
+        self.assertIn("Created 4 users", out.getvalue())
+        self.assertEqual(Event.objects.count(), 40)
+
+        with self.assertRaises(CommandError):
+            call_command('generate_dataset', users=4, events=40, stdout=io.StringIO())
+
+    def test_default_span_is_fixed(self):
+        generate(3, 50, seed=6)
+        first = Event.objects.order_by('startDate').values_list('startDate', flat=True).first()
+        self.assertGreaterEqual(first, datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc))
+        self.assertLess(first, datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc))
+
+    def test_command_start(self):
+        call_command('generate_dataset', '--start', '2030-03-01', '--days', '10', users=2, events=20, stdout=io.StringIO())
+        self.assertFalse(Event.objects.filter(startDate__lt=datetime.datetime(2030, 3, 1, tzinfo=datetime.timezone.utc)).exists())
+        self.assertFalse(Event.objects.filter(startDate__gte=datetime.datetime(2030, 3, 11, tzinfo=datetime.timezone.utc)).exists())
+
+        with self.assertRaises(CommandError):
+            call_command('generate_dataset', '--start', 'tomorrow', stdout=io.StringIO())
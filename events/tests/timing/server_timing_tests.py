@@ -0,0 +1,91 @@
+from accounts.models import CustomUser
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.test import override_settings
+from django.urls import reverse
+from events.models import Event, Category
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.utils import timezone
+import datetime
+import re
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for entry in header.split(', '):
+        name, *params = entry.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+    return metrics
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1.0)
+class ServerTimingTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', password='testpass123', is_active=True)
+        self.category = Category.objects.create(name="Work", color="#ff0000", user=self.user)
+        start = timezone.make_aware(datetime.datetime(2025, 6, 17, 10, 0, 0))
+        for i in range(3):
+            Event.objects.create(
+                title=f"Event {i}", startDate=start + datetime.timedelta(hours=i),
+                endDate=start + datetime.timedelta(hours=i + 1), category=self.category, user=self.user,
+            )
+        self.token = self.get_token_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    @staticmethod
+    def get_token_for_user(user):
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token)
+
+    def test_sampled_request_gets_server_timing_header(self):
+        with self.assertLogs('performance', 'INFO') as logs:
+            response = self.client.get(reverse('event-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = parse_server_timing(response['Server-Timing'])
+        self.assertEqual(list(metrics), ['db', 'auth', 'serialize', 'view', 'render', 'total', 'size'])
+        self.assertRegex(metrics['db']['desc'], r'^"[1-9]\d* queries"$')
+        self.assertEqual(metrics['size']['desc'], f'"{len(response.content)} bytes"')
+        durations = {name: float(values['dur']) for name, values in metrics.items() if 'dur' in values}
+        self.assertGreater(durations['view'], 0)
+        self.assertGreater(durations['render'], 0)
+        self.assertGreater(durations['serialize'], 0)
+        self.assertGreaterEqual(durations['total'], durations['view'] + durations['render'])
+
+        record = logs.records[0].audit
+        self.assertEqual(record['view'], 'event-list')
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['bytes'], len(response.content))
+        self.assertEqual(record['queries'], int(re.search(r'\d+', metrics['db']['desc']).group()))
+
+    def test_serializer_time_is_reported_for_detail_views(self):
+        event = Event.objects.first()
+        with self.assertLogs('performance', 'INFO') as logs:
+            self.client.patch(reverse('event-detail', args=[event.id]), {'title': 'Renamed'}, format='json')
+        self.assertGreater(logs.records[0].audit['serialize_ms'], 0)
+        self.assertGreater(logs.records[0].audit['auth_ms'], 0)
+
+    @override_settings(SERVER_TIMING_HEADER=False)
+    def test_header_can_be_turned_off(self):
+        with self.assertLogs('performance', 'INFO'):
+            response = self.client.get(reverse('category-list'))
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_request_is_not_timed(self):
+        with self.assertNoLogs('performance'):
+            response = self.client.get(reverse('event-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
+
+    async def test_async_views_are_timed(self):
+        with self.assertLogs('performance', 'INFO') as logs:
+            response = await self.async_client.get(
+                reverse('async-event-list'), headers={'Authorization': f'Bearer {self.token}'}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = parse_server_timing(response['Server-Timing'])
+        self.assertGreater(float(metrics['auth']['dur']), 0)
+        self.assertEqual(logs.records[0].audit['view'], 'async-event-list')
+        self.assertGreater(logs.records[0].audit['queries'], 0)
@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CategoryViewSet, EventViewSet
+from .views import CalendarShareViewSet, CategoryViewSet, EventViewSet
 
 router = DefaultRouter()
 router.register(r'category', CategoryViewSet, basename='category')
+router.register(r'shares', CalendarShareViewSet, basename='share')
 router.register(r'', EventViewSet, basename='event')
 
 urlpatterns = [
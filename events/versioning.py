@@ -0,0 +1,45 @@
+import hashlib
+from django.utils.cache import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+from .models import CalendarVersion
+
+
+def bump_version(user_id):
+    return CalendarVersion.bump(user_id)
+
+
+def get_version(user_id):
+    return CalendarVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+
+
+async def aget_version(user_id):
+    return await CalendarVersion.objects.filter(user_id=user_id).values_list('version', flat=True).afirst() or 0
+
+
+def calendar_etag(request, scope, version=None):
+    """Strong ETag for a list response: calendar version plus the exact query string."""
+    if version is None:
+        version = get_version(request.user.pk)
+    query = hashlib.sha1(request.META.get('QUERY_STRING', '').encode()).hexdigest()[:16]
+    return quote_etag(f"{scope}-{request.user.pk}-{version}-{query}")
+
+
+class CalendarETagMixin:
+    """Answers list requests with 304 when If-None-Match carries the current ETag.
+
+    The version is read before the queryset runs, so a write racing with the
+    request can only make the ETag older than the body, never newer: the
+    client simply refetches on its next poll.
+    """
+
+    def list(self, request, *args, **kwargs):
+        # Also keys the response cache (events.caching.CachedReadMixin).
+        self.calendar_version = get_version(request.user.pk)
+        etag = calendar_etag(request, self.basename, self.calendar_version)
+        if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
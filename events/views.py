@@ -1,22 +1,249 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
-from rest_framework import viewsets, permissions
-from .models import Event, Category
-from .serializers import EventSerializer, CategorySerializer
+from django.contrib.auth import get_user_model
+from rest_framework import mixins, viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.fields import DateTimeField
+from rest_framework.renderers import JSONRenderer
+from rest_framework.parsers import MultiPartParser
+from .models import Event, Category, CalendarShare, Tombstone
+from .serializers import EventSerializer, EventRowSerializer, CategorySerializer, CalendarShareSerializer, MeetingTimeSerializer
 from .permissions import IsOwner
+from .bulk import apply_bulk
+from .filters import filter_window, parse_day_range, parse_expand, parse_limit, parse_timezone, parse_uuid, parse_window
+from .aggregates import summarize_days
+from .search import search_events, search_terms
+from .scheduling import find_meeting_times, iter_busy
+from .ical import EXPORT_FIELDS, aiter_calendar, iter_calendar
+from .renderers import ICalendarRenderer
+from .importer import import_calendar
+from .intervals import merge_intervals
+from .pagination import CategoryCursorPagination, EventCursorPagination
+from .recurrence import expand
+from .versioning import CalendarETagMixin
+from .caching import CachedReadMixin, get_stats
+from .sync import changes_since, decode_token, encode_token, token_expired
+import datetime
 
-class EventViewSet(viewsets.ModelViewSet):
+class RowListMixin:
+    """Serves list from values() rows through EventRowSerializer when ``fast_list`` is set."""
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_list:
+            return super().list(request, *args, **kwargs)
+        row_serializer = EventRowSerializer(expand=parse_expand(request.query_params))
+        queryset = self.filter_queryset(self.get_queryset()).values(*row_serializer.value_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(row_serializer.serialize(page))
+        return Response(row_serializer.serialize(queryset))
+
+class EventViewSet(CalendarETagMixin, CachedReadMixin, RowListMixin, viewsets.ModelViewSet):
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    pagination_class = EventCursorPagination
+    bulk_max_items = 10000
+    export_chunk_size = 2000
+    import_batch_size = 500
+    summary_max_days = 731
+    # Longest window occurrences and freebusy will expand recurring series over.
+    expansion_max_days = 366
+    search_default_limit = 50
+    search_max_limit = 200
 
     def get_queryset(self):
-        return Event.objects.filter(user=self.request.user)
+        queryset = Event.objects.filter(user=self.request.user)
+        if self.action == 'list':
+            start, end = parse_window(self.request.query_params)
+            queryset = filter_window(queryset, start, end)
+        if 'category' in parse_expand(self.request.query_params):
+            queryset = queryset.select_related('category')
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request is not None:
+            context['expand'] = parse_expand(self.request.query_params)
+        return context
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class CategoryViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        if not isinstance(request.data, dict):
+            return Response({'error': 'Expected an object with create, update and delete lists.'}, status=status.HTTP_400_BAD_REQUEST)
+        for key in ('create', 'update', 'delete'):
+            if not isinstance(request.data.get(key, []), list):
+                return Response({key: ['Expected a list.']}, status=status.HTTP_400_BAD_REQUEST)
+        size = sum(len(request.data.get(key, [])) for key in ('create', 'update', 'delete'))
+        if size > self.bulk_max_items:
+            return Response({'error': f'At most {self.bulk_max_items} items per request.'}, status=status.HTTP_400_BAD_REQUEST)
+        errors, result = apply_bulk(request.user, request.data, self.get_serializer_context())
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def sync(self, request):
+        token = request.query_params.get('since')
+        since = decode_token(token) if token else None
+        if since is not None and token_expired(request.user, since):
+            return Response({'error': 'Sync token expired. Perform a full sync without since.'}, status=status.HTTP_410_GONE)
+        events, categories, tombstones, version = changes_since(request.user, since)
+        return Response({
+            'events': self.get_serializer(events, many=True).data,
+            'categories': CategorySerializer(categories, many=True).data,
+            'deleted': {
+                'events': [objectId for model, objectId in tombstones if model == Tombstone.EVENT],
+                'categories': [objectId for model, objectId in tombstones if model == Tombstone.CATEGORY],
+            },
+            'token': encode_token(version),
+        })
+
+    @action(detail=False, methods=['get'], renderer_classes=[JSONRenderer, ICalendarRenderer])
+    def export(self, request):
+        start, end = parse_window(request.query_params)
+        rows = (
+            filter_window(Event.objects.filter(user=request.user), start, end)
+            .order_by('startDate')
+            .values(*EXPORT_FIELDS)
+        )
+        if isinstance(request._request, ASGIRequest):
+            # Under ASGI Django would collect a sync iterator into a list before
+            # sending it; an async one is streamed chunk by chunk.
+            content = aiter_calendar(rows.aiterator(chunk_size=self.export_chunk_size), name=request.user.email)
+        else:
+            content = iter_calendar(rows.iterator(chunk_size=self.export_chunk_size), name=request.user.email)
+        response = StreamingHttpResponse(content, content_type='text/calendar; charset=utf-8')
+        response['Content-Disposition'] = 'attachment; filename="calendar.ics"'
+        return response
+
+    @action(detail=False, methods=['post'], url_path='import', url_name='import', parser_classes=[MultiPartParser])
+    def import_ics(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'file': ['An .ics file is required.']}, status=status.HTTP_400_BAD_REQUEST)
+        result = import_calendar(request.user, upload, batch_size=self.import_batch_size)
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[permissions.IsAdminUser])
+    def cache_stats(self, request):
+        return Response(get_stats())
+
+    def window_too_long(self):
+        return Response({'error': f'The window can span at most {self.expansion_max_days} days.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def occurrences(self, request):
+        start, end = parse_window(request.query_params, required=True)
+        if end - start > datetime.timedelta(days=self.expansion_max_days):
+            return self.window_too_long()
+        date_field = DateTimeField()
+        occurrences = []
+        for event in filter_window(Event.objects.filter(user=request.user), start, end):
+            data = self.get_serializer(event).data
+            for occurrence_start, occurrence_end in expand(event, start, end):
+                occurrences.append((occurrence_start, data['id'], {
+                    **data,
+                    'startDate': date_field.to_representation(occurrence_start),
+                    'endDate': date_field.to_representation(occurrence_end),
+                    'occurrenceOf': data['id'],
+                }))
+        occurrences.sort(key=lambda occurrence: occurrence[:2])
+        results = [occurrence for _, _, occurrence in occurrences]
+        return Response(results)
+
+    @action(detail=False, methods=['get'])
+    def freebusy(self, request):
+        start, end = parse_window(request.query_params, required=True)
+        if end - start > datetime.timedelta(days=self.expansion_max_days):
+            return self.window_too_long()
+        busy = merge_intervals(iter_busy(request.user, start, end))
+        return Response({
+            'start': start,
+            'end': end,
+            'busy': [{'start': busy_start, 'end': busy_end} for busy_start, busy_end in busy],
+        })
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        first_day, last_day = parse_day_range(request.query_params)
+        tz = parse_timezone(request.query_params)
+        if (last_day - first_day).days >= self.summary_max_days:
+            return Response({'error': f'A summary covers at most {self.summary_max_days} days.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'start': first_day,
+            'end': last_day,
+            'timeZone': str(tz),
+            'days': summarize_days(Event.objects.filter(user=request.user), first_day, last_day, tz),
+        })
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        terms = search_terms(request.query_params.get('q', ''))
+        if not terms:
+            return Response({'q': ['Enter at least one word to search for.']}, status=status.HTTP_400_BAD_REQUEST)
+        start, end = parse_window(request.query_params)
+        category = parse_uuid(request.query_params, 'category')
+        limit = parse_limit(request.query_params, self.search_default_limit, self.search_max_limit)
+        queryset = filter_window(Event.objects.filter(user=request.user), start, end)
+        if category is not None:
+            queryset = queryset.filter(category=category)
+        row_serializer = EventRowSerializer(expand=parse_expand(request.query_params))
+        rows = search_events(queryset, terms).values(*row_serializer.value_fields)[:limit]
+        return Response({'results': row_serializer.serialize(rows)})
+
+    @action(detail=False, methods=['post'], url_path='find-time', url_name='find-time')
+    def find_time(self, request):
+        query = MeetingTimeSerializer(data=request.data)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        requested = set(params['users']) - {request.user.email}
+        shared = dict(
+            get_user_model().objects
+            .filter(email__in=requested, shares__sharedWith=request.user)
+            .values_list('email', 'id')
+        )
+        missing = requested - shared.keys()
+        if missing:
+            return Response(
+                {'users': [f"Calendar not shared with you: {', '.join(sorted(missing))}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        users = list(shared.values())
+        if params['includeSelf'] or request.user.email in params['users']:
+            users.append(request.user.pk)
+        slots = find_meeting_times(
+            users, params['start'], params['end'], params['duration'], params['count'], params['step'],
+            params['timeZone'], params['workStart'], params['workEnd'], params['weekdays'],
+        )
+        return Response({'slots': [{'start': slot_start, 'end': slot_end} for slot_start, slot_end in slots]})
+
+class CalendarShareViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """Calendars the requester shares with other users for meeting scheduling."""
+    serializer_class = CalendarShareSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return CalendarShare.objects.filter(owner=self.request.user).select_related('sharedWith').order_by('createdAt')
+
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+
+    @action(detail=False, methods=['get'])
+    def received(self, request):
+        shares = CalendarShare.objects.filter(sharedWith=request.user).order_by('createdAt').values('owner__email', 'createdAt')
+        return Response([{'owner': share['owner__email'], 'createdAt': share['createdAt']} for share in shares])
+
+class CategoryViewSet(CalendarETagMixin, CachedReadMixin, viewsets.ModelViewSet):
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticated]
+    cached_actions = ('list',)
+    pagination_class = CategoryCursorPagination
 
     def get_queryset(self):
         return Category.objects.filter(user=self.request.user)